@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Asset Catalog
+=============
+Shared, persisted index of slide and visual asset files used by the
+compositors (video-compositor.py, audio-slides-compositor.py).
+
+Asset roots are indexed recursively into normalised keys:
+- segment number  (segment_001.png, lesson_segment-1.mp4   -> "segment:1")
+- slide number    (slide_03.png                            -> "slide:3")
+- bare number     (007.png                                 -> "number:7")
+- slugified stem  (Intro to AWS.png                        -> "stem:intro_to_aws")
+
+Directory listings are persisted together with each directory's mtime, so
+an unchanged tree costs one stat per directory on the next run and is never
+listed again. Content hashes are computed lazily, cached by file size and
+mtime, and persisted alongside the listings.
+
+This module has an importable name so the hyphenated scripts next to it can
+share it:
+    from asset_catalog import AssetCatalog
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Iterable, Optional
+
+# ============================================================================
+# Constants and Configuration
+# ============================================================================
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+DEFAULT_CATALOG_PATH = SCRIPT_DIR / "output" / "asset-catalog.json"
+CATALOG_VERSION = 1
+
+IMAGE_FORMATS = {".png", ".jpg", ".jpeg", ".webp", ".bmp"}
+VIDEO_FORMATS = {".mp4", ".mov", ".webm", ".avi", ".mkv"}
+
+# Numbered filename patterns, in lookup priority order
+NUMBER_PATTERNS = [
+    ("segment", re.compile(r"segment[_-]?(\d+)")),
+    ("slide", re.compile(r"slide[_-]?(\d+)")),
+    ("number", re.compile(r"^(\d+)$")),
+]
+
+_SLUG_PATTERN = re.compile(r"[^a-z0-9]+")
+
+
+def slugify(text: str) -> str:
+    """Normalise a title or file stem to a lookup slug."""
+    return _SLUG_PATTERN.sub("_", text.lower()).strip("_")
+
+
+def asset_keys(stem: str) -> list[str]:
+    """Return every catalog key a file stem is indexed under."""
+    stem = stem.lower()
+    keys = []
+    for kind, pattern in NUMBER_PATTERNS:
+        match = pattern.search(stem)
+        if match:
+            keys.append(f"{kind}:{int(match.group(1))}")
+    keys.append(f"stem:{slugify(stem)}")
+    return keys
+
+
+# ============================================================================
+# Asset Catalog
+# ============================================================================
+
+class AssetCatalog:
+    """Recursive, persisted index of asset files under one or more roots."""
+
+    def __init__(
+        self,
+        roots: Iterable[Path],
+        extensions: Iterable[str],
+        cache_path: Optional[Path] = DEFAULT_CATALOG_PATH,
+        logger: Optional[logging.Logger] = None
+    ):
+        self.roots = [Path(root).resolve() for root in roots]
+        self.extensions = {ext.lower() for ext in extensions}
+        self.cache_path = cache_path
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.files: list[Path] = []
+        self.index: dict[str, Path] = {}
+        self.rescanned_dirs = 0
+
+        self._dirs: dict[str, dict] = {}
+        self._hashes: dict[str, list] = {}
+        self._seen_dirs: set[str] = set()
+        self._by_hash: Optional[dict[str, Path]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+        self._load()
+        self.refresh()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load(self):
+        if not self.cache_path or not self.cache_path.exists():
+            return
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.warning(f"Ignoring unreadable asset catalog {self.cache_path}: {e}")
+            return
+        if data.get("version") != CATALOG_VERSION:
+            return
+        self._dirs = data.get("dirs", {})
+        self._hashes = data.get("hashes", {})
+
+    def save(self):
+        """Write the catalog back to disk if anything changed."""
+        if not self.cache_path or not self._dirty:
+            return
+
+        # Forget directories under our roots that no longer exist
+        for key in list(self._dirs):
+            if key not in self._seen_dirs and any(self._under_root(key, root) for root in self.roots):
+                del self._dirs[key]
+        for key in list(self._hashes):
+            if any(self._under_root(key, root) for root in self.roots) and str(Path(key).parent) not in self._dirs:
+                del self._hashes[key]
+
+        data = {"version": CATALOG_VERSION, "dirs": self._dirs, "hashes": self._hashes}
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+        except OSError as e:
+            self.logger.warning(f"Failed to save asset catalog: {e}")
+
+    @staticmethod
+    def _under_root(key: str, root: Path) -> bool:
+        root_key = str(root)
+        return key == root_key or key.startswith(root_key.rstrip(os.sep) + os.sep)
+
+    # ------------------------------------------------------------------
+    # Scanning
+    # ------------------------------------------------------------------
+
+    def _list_dir(self, directory: Path) -> Optional[tuple[list[str], list[str]]]:
+        """Return (files, subdirs) for a directory, relisting only if its mtime changed."""
+        key = str(directory)
+        try:
+            mtime_ns = directory.stat().st_mtime_ns
+        except OSError:
+            return None
+        self._seen_dirs.add(key)
+
+        cached = self._dirs.get(key)
+        if cached and cached.get("mtime_ns") == mtime_ns:
+            return cached["files"], cached["subdirs"]
+
+        files, subdirs = [], []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    elif entry.is_file():
+                        files.append(entry.name)
+        except OSError as e:
+            self.logger.warning(f"Cannot list {directory}: {e}")
+            return None
+
+        files.sort()
+        subdirs.sort()
+        self._dirs[key] = {"mtime_ns": mtime_ns, "files": files, "subdirs": subdirs}
+        self.rescanned_dirs += 1
+        self._dirty = True
+        return files, subdirs
+
+    def refresh(self):
+        """Re-walk the roots and rebuild the key index."""
+        self.files = []
+        self.index = {}
+        self._by_hash = None
+        self.rescanned_dirs = 0
+
+        for root in self.roots:
+            if not root.is_dir():
+                self.logger.warning(f"Assets directory not found: {root}")
+                continue
+
+            # Breadth-first, so shallower files win key collisions
+            queue = deque([root])
+            while queue:
+                directory = queue.popleft()
+                listing = self._list_dir(directory)
+                if listing is None:
+                    continue
+                files, subdirs = listing
+
+                for name in files:
+                    path = directory / name
+                    if path.suffix.lower() not in self.extensions:
+                        continue
+                    self.files.append(path)
+                    for key in asset_keys(path.stem):
+                        self.index.setdefault(key, path)
+
+                queue.extend(directory / name for name in subdirs)
+
+        self.logger.info(
+            f"Indexed {len(self.files)} assets from {len(self.roots)} root(s) "
+            f"({self.rescanned_dirs} director{'y' if self.rescanned_dirs == 1 else 'ies'} rescanned)"
+        )
+        self.save()
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[Path]:
+        """Look up a normalised key such as "segment:3" or "stem:intro"."""
+        return self.index.get(key)
+
+    def find_number(self, number: int, kinds: Iterable[str] = ("segment", "slide", "number")) -> Optional[Path]:
+        """Find the asset numbered `number`, trying each filename kind in order."""
+        for kind in kinds:
+            path = self.index.get(f"{kind}:{number}")
+            if path:
+                return path
+        return None
+
+    def find_title(self, title: str) -> Optional[Path]:
+        """Find the asset whose file stem matches a title."""
+        return self.index.get(f"stem:{slugify(title)}")
+
+    def find_segment(
+        self,
+        segment_id: int,
+        title: Optional[str] = None,
+        segment_index: Optional[int] = None
+    ) -> Optional[Path]:
+        """Find the asset for a segment by 1-based id, then 0-based index, then title."""
+        candidates = [("segment", segment_id)]
+        if segment_index is not None:
+            candidates.append(("segment", segment_index))
+        candidates.append(("slide", segment_id))
+        if segment_index is not None:
+            candidates.append(("slide", segment_index))
+        candidates.append(("number", segment_id))
+        if segment_index is not None:
+            candidates.append(("number", segment_index))
+
+        for kind, number in candidates:
+            path = self.index.get(f"{kind}:{number}")
+            if path:
+                return path
+
+        if title:
+            return self.find_title(title)
+        return None
+
+    def content_hash(self, path: Path) -> Optional[str]:
+        """SHA-256 of a file, cached by size and mtime."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+
+        key = str(path)
+        with self._lock:
+            cached = self._hashes.get(key)
+            if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+                return cached[2]
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+
+        with self._lock:
+            self._hashes[key] = [stat.st_size, stat.st_mtime_ns, digest.hexdigest()]
+            self._dirty = True
+        return digest.hexdigest()
+
+    def find_by_hash(self, digest: str) -> Optional[Path]:
+        """Find an indexed file with this content hash (hashes every file once)."""
+        if self._by_hash is None:
+            self._by_hash = {}
+            for path in self.files:
+                file_hash = self.content_hash(path)
+                if file_hash:
+                    self._by_hash.setdefault(file_hash, path)
+            self.save()
+        return self._by_hash.get(digest)
@@ -15,9 +15,14 @@ Features:
 1. Read parsed script JSON to get segment timings
 2. For each segment, display the corresponding slide image
 3. Use FFmpeg to create video from image sequence with proper durations
-4. Support crossfade transitions between slides (0.3s default)
+4. Support crossfade transitions between slides (0.3s default), rendered
+   in parallel chunks that are joined with stream copy
 5. Handle cases where audio is longer/shorter than total slide duration
 6. Output 1920x1080 @ 30fps
+7. Optional single-pass mode: one FFmpeg invocation decodes and encodes
+   the whole lesson once (slides, transitions, duration fit and audio)
+8. Still-image x264 profile, with optional VFR output where each slide is
+   a single held frame and only transitions are encoded at full rate
 
 Usage:
     python audio-slides-compositor.py \\
@@ -34,16 +39,24 @@ Requirements:
 """
 
 import argparse
+import hashlib
 import json
 import logging
 import os
 import shutil
-import subprocess
 import sys
 import tempfile
-from dataclasses import dataclass, field
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, Optional, Callable
+from typing import Optional
+
+from asset_catalog import DEFAULT_CATALOG_PATH, AssetCatalog
+from ffmpeg_runtime import get_runtime
+from ffmpeg_tools import FFmpegProgress, FFmpegWrapper, ProbeCache, RunReport
+from mezzanine import DEFAULT_MANIFEST_PATH, MezzanineStore
+from placeholder_cards import PILLOW_AVAILABLE, placeholder_path, render_placeholder
 
 # ============================================================================
 # Constants and Configuration
@@ -53,10 +66,6 @@ SCRIPT_DIR = Path(__file__).parent.resolve()
 DEFAULT_OUTPUT_DIR = SCRIPT_DIR / "output"
 DEFAULT_LOG_PATH = SCRIPT_DIR / "audio-slides-compositor.log"
 
-# FFmpeg paths
-FFMPEG_PATH = Path(r"C:\ffmpeg\bin\ffmpeg.exe")
-FFPROBE_PATH = Path(r"C:\ffmpeg\bin\ffprobe.exe")
-
 # Output specifications
 OUTPUT_WIDTH = 1920
 OUTPUT_HEIGHT = 1080
@@ -66,6 +75,32 @@ BACKGROUND_COLOR = "0x1E1B4B"  # Dark purple (matches video-compositor.py)
 # Transition settings
 DEFAULT_TRANSITION_DURATION = 0.3  # seconds
 
+# Parallel segment encoding
+DEFAULT_JOBS = max(1, (os.cpu_count() or 1) // 2)
+
+# Crossfade engine: "chunked" renders groups of segments in parallel and
+# stream-copies the joins; "graph" uses one xfade chain over every segment
+DEFAULT_TRANSITION_ENGINE = "chunked"
+DEFAULT_TRANSITION_CHUNK_SIZE = 8  # segments per chunk
+
+# Segment encoder settings (part of the segment cache key). The codec itself
+# is the FFmpeg runtime's preferred encoder, see ffmpeg_runtime.py.
+SEGMENT_PIX_FMT_ARGS = ["-pix_fmt", "yuv420p"]
+
+# Still-image profile: slides are static, so use x264's stillimage tuning and
+# long GOPs instead of spending bits and CPU on 30 identical frames a second
+STILL_GOP_SECONDS = 10
+STILL_GOP_ARGS = ["-g", str(OUTPUT_FPS * STILL_GOP_SECONDS), "-pix_fmt", "yuv420p"]
+DEFAULT_ENCODER_PROFILE = "still"
+
+# VFR mode keeps only frames that differ from the previous one (scene score
+# above this threshold), plus the first and last frame to preserve duration
+VFR_SCENE_THRESHOLD = 0.001
+
+# Persistent segment clip cache
+DEFAULT_CACHE_DIR = DEFAULT_OUTPUT_DIR / "segment-cache"
+DEFAULT_CACHE_SIZE_MB = 4096
+
 # ============================================================================
 # Logging Setup
 # ============================================================================
@@ -130,175 +165,19 @@ class CompositorConfig:
     verbose: bool = False
     temp_dir: Optional[Path] = None
     keep_temp: bool = False
-
-
-# ============================================================================
-# FFmpeg Wrapper
-# ============================================================================
-
-class FFmpegWrapper:
-    """Wrapper for FFmpeg operations with progress reporting."""
-
-    def __init__(self, logger: logging.Logger):
-        self.logger = logger
-        self.ffmpeg_path = self._find_ffmpeg()
-        self.ffprobe_path = self._find_ffprobe()
-
-    def _find_ffmpeg(self) -> str:
-        """Find FFmpeg executable."""
-        # Check configured path first
-        if FFMPEG_PATH.exists():
-            return str(FFMPEG_PATH)
-
-        # Check common locations
-        common_paths = [
-            r"C:\ffmpeg\bin\ffmpeg.exe",
-            r"C:\Program Files\ffmpeg\bin\ffmpeg.exe",
-            r"C:\ProgramData\chocolatey\bin\ffmpeg.exe",
-            "ffmpeg.exe",
-            "ffmpeg",
-            "/usr/bin/ffmpeg",
-            "/usr/local/bin/ffmpeg",
-        ]
-
-        for path in common_paths:
-            if os.path.exists(path) or shutil.which(path):
-                return path
-
-        # Try to find via where/which
-        try:
-            result = subprocess.run(
-                ["where", "ffmpeg"] if sys.platform == "win32" else ["which", "ffmpeg"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                return result.stdout.strip().split('\n')[0]
-        except Exception:
-            pass
-
-        return "ffmpeg"  # Hope it's in PATH
-
-    def _find_ffprobe(self) -> str:
-        """Find FFprobe executable."""
-        # Check configured path first
-        if FFPROBE_PATH.exists():
-            return str(FFPROBE_PATH)
-
-        # Check common locations
-        common_paths = [
-            r"C:\ffmpeg\bin\ffprobe.exe",
-            r"C:\Program Files\ffmpeg\bin\ffprobe.exe",
-            "ffprobe.exe",
-            "ffprobe",
-        ]
-
-        for path in common_paths:
-            if os.path.exists(path) or shutil.which(path):
-                return path
-
-        # Try deriving from ffmpeg path
-        if self.ffmpeg_path and self.ffmpeg_path != "ffmpeg":
-            ffprobe = self.ffmpeg_path.replace("ffmpeg", "ffprobe")
-            if os.path.exists(ffprobe):
-                return ffprobe
-
-        return "ffprobe"
-
-    def check_availability(self) -> tuple[bool, str]:
-        """Check if FFmpeg is available and return version."""
-        try:
-            result = subprocess.run(
-                [self.ffmpeg_path, "-version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                version_line = result.stdout.split('\n')[0]
-                self.logger.info(f"FFmpeg found: {version_line}")
-                return True, version_line
-            return False, "FFmpeg returned error"
-        except FileNotFoundError:
-            return False, f"FFmpeg not found at {self.ffmpeg_path}"
-        except subprocess.TimeoutExpired:
-            return False, "FFmpeg check timed out"
-        except Exception as e:
-            return False, f"Error checking FFmpeg: {e}"
-
-    def get_media_info(self, file_path: Path) -> dict[str, Any]:
-        """Get media file information using ffprobe."""
-        try:
-            result = subprocess.run(
-                [
-                    self.ffprobe_path,
-                    "-v", "quiet",
-                    "-print_format", "json",
-                    "-show_format",
-                    "-show_streams",
-                    str(file_path)
-                ],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            if result.returncode == 0:
-                return json.loads(result.stdout)
-            self.logger.error(f"FFprobe error: {result.stderr}")
-            return {}
-        except Exception as e:
-            self.logger.error(f"Error getting media info: {e}")
-            return {}
-
-    def get_duration(self, file_path: Path) -> float:
-        """Get media file duration in seconds."""
-        info = self.get_media_info(file_path)
-        if info and "format" in info:
-            return float(info["format"].get("duration", 0))
-        return 0.0
-
-    def run_ffmpeg(
-        self,
-        args: list[str],
-        progress_callback: Optional[Callable[[str], None]] = None,
-        timeout: int = 3600
-    ) -> tuple[bool, str]:
-        """Run FFmpeg with the given arguments."""
-        cmd = [self.ffmpeg_path] + args
-        self.logger.debug(f"Running: {' '.join(cmd)}")
-
-        try:
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1
-            )
-
-            # Capture stderr for progress (FFmpeg outputs progress to stderr)
-            stderr_output = []
-            for line in process.stderr:
-                stderr_output.append(line)
-                if progress_callback and "time=" in line:
-                    progress_callback(line)
-                elif "error" in line.lower() and "errors" not in line.lower():
-                    self.logger.warning(line.strip())
-
-            process.wait(timeout=timeout)
-
-            if process.returncode == 0:
-                return True, "Success"
-            else:
-                error_msg = ''.join(stderr_output[-20:])  # Last 20 lines
-                return False, error_msg
-
-        except subprocess.TimeoutExpired:
-            process.kill()
-            return False, "FFmpeg timed out"
-        except Exception as e:
-            return False, f"FFmpeg error: {e}"
+    single_pass: bool = False
+    encoder_profile: str = DEFAULT_ENCODER_PROFILE
+    vfr: bool = False
+    jobs: int = DEFAULT_JOBS
+    transition_engine: str = DEFAULT_TRANSITION_ENGINE
+    transition_chunk_size: int = DEFAULT_TRANSITION_CHUNK_SIZE
+    cache_dir: Optional[Path] = DEFAULT_CACHE_DIR
+    cache_size_mb: int = DEFAULT_CACHE_SIZE_MB
+    probe_cache: Optional[Path] = None
+    report_path: Optional[Path] = None
+    asset_catalog: Optional[Path] = DEFAULT_CATALOG_PATH
+    mezzanine_manifest: Optional[Path] = DEFAULT_MANIFEST_PATH
+    normalize_media: bool = False
 
 
 # ============================================================================
@@ -374,59 +253,20 @@ class SlideManager:
 
     SUPPORTED_FORMATS = {".png", ".jpg", ".jpeg", ".webp", ".bmp"}
 
-    def __init__(self, slides_dir: Path, logger: logging.Logger):
+    def __init__(
+        self,
+        slides_dir: Path,
+        logger: logging.Logger,
+        catalog_path: Optional[Path] = DEFAULT_CATALOG_PATH
+    ):
         self.slides_dir = slides_dir
         self.logger = logger
-        self.slides: dict[int, Path] = {}
-        self._scan_slides()
-
-    def _scan_slides(self):
-        """Scan slides directory and index files by segment number."""
-        if not self.slides_dir.exists():
-            self.logger.warning(f"Slides directory not found: {self.slides_dir}")
-            return
-
-        for file in self.slides_dir.iterdir():
-            if not file.is_file():
-                continue
-
-            suffix = file.suffix.lower()
-            if suffix not in self.SUPPORTED_FORMATS:
-                continue
-
-            # Extract segment number from filename
-            # Expected formats: segment_001.png, segment_002.png, etc.
-            stem = file.stem.lower()
-
-            segment_num = None
-
-            # Try various patterns
-            import re
-
-            # Pattern: segment_NNN or segment_NN or segment_N
-            match = re.search(r'segment[_-]?(\d+)', stem)
-            if match:
-                segment_num = int(match.group(1))
-            else:
-                # Pattern: slide_NNN
-                match = re.search(r'slide[_-]?(\d+)', stem)
-                if match:
-                    segment_num = int(match.group(1))
-                else:
-                    # Pattern: just numbers NNN
-                    match = re.match(r'^(\d+)$', stem)
-                    if match:
-                        segment_num = int(match.group(1))
-
-            if segment_num is not None:
-                self.slides[segment_num] = file
-                self.logger.debug(f"Found slide: segment {segment_num} -> {file.name}")
-
-        self.logger.info(f"Indexed {len(self.slides)} slides from {self.slides_dir}")
+        # Slides are indexed by segment_NNN, slide_NNN or bare NNN file names
+        self.catalog = AssetCatalog([slides_dir], self.SUPPORTED_FORMATS, cache_path=catalog_path, logger=logger)
 
     def get_slide(self, segment_id: int) -> Optional[Path]:
         """Get slide for a specific segment ID."""
-        return self.slides.get(segment_id)
+        return self.catalog.find_number(segment_id)
 
     def match_slides_to_segments(self, segments: list[SlideSegment]) -> list[SlideSegment]:
         """Match slide files to segments and update segment objects."""
@@ -443,6 +283,108 @@ class SlideManager:
         return segments
 
 
+# ============================================================================
+# Segment Cache
+# ============================================================================
+
+class SegmentCache:
+    """Persistent, content-addressed store of rendered segment clips.
+
+    Clips are keyed on a hash of the slide image bytes, the segment duration
+    and everything that affects the encode (fps, resolution, encoder args and
+    FFmpeg version). Hits refresh the clip's mtime, and the least recently
+    used clips are evicted once the cache exceeds its size cap.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_bytes: int,
+        ffmpeg_version: str,
+        encoder_args: list[str],
+        logger: logging.Logger
+    ):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.ffmpeg_version = ffmpeg_version
+        self.encoder_args = encoder_args
+        self.logger = logger
+        self.hits = 0
+        self.misses = 0
+        self._in_use: set[Path] = set()
+        self._lock = threading.Lock()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def key(self, slide_path: Path, duration: float) -> str:
+        """Compute the cache key for a slide rendered for a given duration."""
+        digest = hashlib.sha256()
+        digest.update(slide_path.read_bytes())
+        digest.update(json.dumps({
+            "duration": round(duration, 3),
+            "fps": OUTPUT_FPS,
+            "size": [OUTPUT_WIDTH, OUTPUT_HEIGHT],
+            "background": BACKGROUND_COLOR,
+            "encoder": self.encoder_args,
+            "ffmpeg": self.ffmpeg_version,
+        }, sort_keys=True).encode("utf-8"))
+        return digest.hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        """Location of the clip for a cache key."""
+        return self.cache_dir / f"{key}.mp4"
+
+    def get(self, key: str) -> Optional[Path]:
+        """Return the cached clip for a key, or None on a miss."""
+        path = self.path_for(key)
+        with self._lock:
+            if not path.exists():
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._in_use.add(path)
+        try:
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            pass
+        return path
+
+    def put(self, key: str, clip_path: Path) -> Path:
+        """Move a freshly rendered clip into the cache and return its new path."""
+        path = self.path_for(key)
+        try:
+            os.replace(clip_path, path)
+        except OSError as e:
+            self.logger.warning(f"Could not store segment in cache: {e}")
+            return clip_path
+        with self._lock:
+            self._in_use.add(path)
+        return path
+
+    def evict(self):
+        """Remove least recently used clips until the cache fits its size cap."""
+        with self._lock:
+            entries = []
+            for file in self.cache_dir.glob("*.mp4"):
+                try:
+                    stat = file.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, file))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, file in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                if file in self._in_use:
+                    continue
+                try:
+                    file.unlink()
+                    total -= size
+                    self.logger.debug(f"Evicted cached segment: {file.name}")
+                except OSError:
+                    pass
+
+
 # ============================================================================
 # Audio-Slides Compositor
 # ============================================================================
@@ -453,12 +395,20 @@ class AudioSlidesCompositor:
     def __init__(self, config: CompositorConfig, logger: logging.Logger):
         self.config = config
         self.logger = logger
-        self.ffmpeg = FFmpegWrapper(logger)
+        self.ffmpeg = FFmpegWrapper(logger, ProbeCache(config.probe_cache))
+        self.report = RunReport("audio-slides-compositor", self.ffmpeg)
         self.script_parser = ScriptParser(config.script_path, logger)
-        self.slide_manager = SlideManager(config.slides_dir, logger)
+        self.slide_manager = SlideManager(config.slides_dir, logger, config.asset_catalog)
         self.temp_dir = config.temp_dir or Path(tempfile.mkdtemp(prefix="audio_slides_"))
+        self.segment_cache: Optional[SegmentCache] = None
         self.audio_duration = 0.0
         self.total_progress = 0.0
+        self.mezzanine = None
+        if config.mezzanine_manifest:
+            self.mezzanine = MezzanineStore(config.mezzanine_manifest, self.ffmpeg.runtime, logger)
+        # Audio actually read, and how it is written: copied once it is mezzanine AAC
+        self.audio_path = config.audio_path
+        self.audio_args = ["-c:a", "aac", "-b:a", "192k"]
 
     def validate_inputs(self) -> bool:
         """Validate all input files and configuration."""
@@ -468,12 +418,23 @@ class AudioSlidesCompositor:
         available, msg = self.ffmpeg.check_availability()
         if not available:
             errors.append(f"FFmpeg: {msg}")
+        elif self.config.transition_duration > 0 and not self.ffmpeg.runtime.has_filter("xfade"):
+            self.logger.warning("FFmpeg build has no xfade filter, using hard cuts")
+            self.config.transition_duration = 0.0
 
         # Check audio file
         if not self.config.audio_path.exists():
             errors.append(f"Audio file not found: {self.config.audio_path}")
         else:
-            self.audio_duration = self.ffmpeg.get_duration(self.config.audio_path)
+            if self.mezzanine:
+                # Normally normalize-media.py has made the copy ahead of time
+                if self.config.normalize_media:
+                    self.audio_path = self.mezzanine.normalize(self.config.audio_path)
+                else:
+                    self.audio_path = self.mezzanine.lookup(self.config.audio_path) or self.config.audio_path
+                if self.mezzanine.is_mezzanine(self.audio_path):
+                    self.audio_args = ["-c:a", "copy"]
+            self.audio_duration = self.ffmpeg.get_duration(self.audio_path)
             if self.audio_duration == 0:
                 errors.append("Could not read audio duration")
             else:
@@ -482,7 +443,7 @@ class AudioSlidesCompositor:
         # Check slides directory
         if not self.config.slides_dir.exists():
             errors.append(f"Slides directory not found: {self.config.slides_dir}")
-        elif not self.slide_manager.slides:
+        elif not self.slide_manager.catalog.files:
             errors.append("No slide images found in slides directory")
 
         # Check script JSON
@@ -499,8 +460,21 @@ class AudioSlidesCompositor:
 
         return True
 
-    def create_placeholder_image(self, output_path: Path, text: str = "Slide") -> bool:
-        """Create a placeholder image with text for missing slides."""
+    def create_placeholder_image(self, text: str = "Slide") -> Optional[Path]:
+        """Return a placeholder card for a missing slide, rendering it if needed."""
+        if PILLOW_AVAILABLE:
+            try:
+                return render_placeholder(text, OUTPUT_WIDTH, OUTPUT_HEIGHT)
+            except OSError as e:
+                self.logger.error(f"Failed to create placeholder: {e}")
+                return None
+
+        # Without Pillow, draw the card with FFmpeg instead
+        output_path = placeholder_path(text, OUTPUT_WIDTH, OUTPUT_HEIGHT, kind="drawtext")
+        if output_path.exists():
+            return output_path
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
         # Escape special characters for FFmpeg
         safe_text = text.replace("'", "").replace(":", " -").replace("\\", "")[:50]
 
@@ -513,49 +487,178 @@ class AudioSlidesCompositor:
                 "-frames:v", "1",
                 str(output_path)
             ])
-            return success and output_path.exists()
+            return output_path if success and output_path.exists() else None
         except Exception as e:
             self.logger.error(f"Failed to create placeholder: {e}")
-            return False
-
-    def prepare_segment_video(self, segment: SlideSegment, index: int) -> Optional[Path]:
-        """Create a video clip for a single segment from its slide image."""
-        output_path = self.temp_dir / f"segment_{segment.segment_id:03d}.mp4"
+            return None
 
-        # Get slide path or create placeholder
+    @staticmethod
+    def _slide_filter() -> str:
+        """Filter chain that fits a slide into the output frame."""
+        return (
+            f"scale={OUTPUT_WIDTH}:{OUTPUT_HEIGHT}:force_original_aspect_ratio=decrease,"
+            f"pad={OUTPUT_WIDTH}:{OUTPUT_HEIGHT}:(ow-iw)/2:(oh-ih)/2:color={BACKGROUND_COLOR},"
+            f"setsar=1,format=yuv420p"
+        )
+
+    def resolve_slide(self, segment: SlideSegment) -> Optional[Path]:
+        """Return the slide image for a segment, creating a placeholder if missing."""
         slide_path = segment.slide_path
-        if not slide_path or not slide_path.exists():
-            self.logger.warning(f"Creating placeholder for segment {segment.segment_id}")
-            slide_path = self.temp_dir / f"placeholder_{segment.segment_id:03d}.png"
-            text = segment.visual_cue[:40] if segment.visual_cue else f"Segment {segment.segment_id}"
-            if not self.create_placeholder_image(slide_path, text):
-                return None
+        if slide_path and slide_path.exists():
+            return slide_path
+
+        self.logger.warning(f"Creating placeholder for segment {segment.segment_id}")
+        text = segment.visual_cue[:40] if segment.visual_cue else f"Segment {segment.segment_id}"
+        return self.create_placeholder_image(text)
+
+    def encoder_threads(self) -> int:
+        """x264 thread budget per segment encode so parallel jobs share the CPU."""
+        return max(1, (os.cpu_count() or 1) // max(1, self.config.jobs))
+
+    def encoder_args(self) -> list[str]:
+        """Encoder arguments for the configured encoding profile."""
+        if self.config.encoder_profile == "still":
+            return self.ffmpeg.runtime.video_encoder_args(tune="stillimage") + STILL_GOP_ARGS
+        return self.ffmpeg.runtime.video_encoder_args() + SEGMENT_PIX_FMT_ARGS
+
+    def rate_args(self) -> list[str]:
+        """Output frame rate arguments: constant OUTPUT_FPS, or VFR passthrough."""
+        return ["-fps_mode", "vfr"] if self.config.vfr else ["-r", str(OUTPUT_FPS)]
+
+    @staticmethod
+    def _vfr_select(frame_count: int, keep_changes: bool = True) -> str:
+        """select filter keeping the first, last and (optionally) changed frames."""
+        terms = ["eq(n\\,0)", f"eq(n\\,{max(0, frame_count - 1)})"]
+        if keep_changes:
+            terms.append(f"gt(scene\\,{VFR_SCENE_THRESHOLD})")
+        return f"select='{'+'.join(terms)}'"
+
+    def _encode_segment(self, segment: SlideSegment, slide_path: Path) -> tuple[Optional[Path], str]:
+        """Encode one slide into a clip of exact duration (safe to run in a worker)."""
+        frame_count = max(1, round(segment.duration * OUTPUT_FPS))
+        cache_key = None
+        if self.segment_cache:
+            cache_key = self.segment_cache.key(slide_path, segment.duration)
+            cached = self.segment_cache.get(cache_key)
+            if cached:
+                self.logger.debug(f"Segment {segment.segment_id}: cache hit ({cached.name})")
+                self.ffmpeg.probe_cache.record_duration(cached, frame_count / OUTPUT_FPS)
+                return cached, "Cached"
+            # Render next to the cache so the final move is an atomic rename
+            output_path = self.segment_cache.cache_dir / f"{cache_key}.{os.getpid()}-{threading.get_ident()}.part"
+        else:
+            output_path = self.temp_dir / f"segment_{segment.segment_id:03d}.mp4"
+
+        video_filter = self._slide_filter()
+        if self.config.vfr:
+            # One frame held for the whole segment, plus a closing frame so the
+            # clip keeps its exact duration
+            video_filter += f",trim=end_frame={frame_count},{self._vfr_select(frame_count, keep_changes=False)}"
 
-        # Create video from image with exact duration
         success, msg = self.ffmpeg.run_ffmpeg([
             "-y",
             "-loop", "1",
+            "-framerate", str(OUTPUT_FPS),
             "-i", str(slide_path),
-            "-t", str(segment.duration),
-            "-vf", (
-                f"scale={OUTPUT_WIDTH}:{OUTPUT_HEIGHT}:force_original_aspect_ratio=decrease,"
-                f"pad={OUTPUT_WIDTH}:{OUTPUT_HEIGHT}:(ow-iw)/2:(oh-ih)/2:color={BACKGROUND_COLOR},"
-                f"setsar=1,format=yuv420p"
-            ),
-            "-c:v", "libx264",
-            "-preset", "medium",
-            "-crf", "18",
-            "-r", str(OUTPUT_FPS),
-            "-pix_fmt", "yuv420p",
+            "-frames:v", str(min(2, frame_count) if self.config.vfr else frame_count),
+            "-vf", video_filter,
+            *self.encoder_args(),
+            "-threads", str(self.encoder_threads()),
+            *self.rate_args(),
+            "-f", "mp4",
             str(output_path)
         ])
 
         if not success:
+            if cache_key:
+                output_path.unlink(missing_ok=True)
+            return None, msg
+
+        if cache_key:
+            output_path = self.segment_cache.put(cache_key, output_path)
+        # Rendered with an exact frame count, so no need to probe it later
+        self.ffmpeg.probe_cache.record_duration(output_path, frame_count / OUTPUT_FPS)
+        return output_path, msg
+
+    def open_segment_cache(self):
+        """Open the persistent segment cache unless caching is disabled."""
+        if self.config.cache_dir is None:
+            return
+        try:
+            self.segment_cache = SegmentCache(
+                self.config.cache_dir,
+                self.config.cache_size_mb * 1024 * 1024,
+                self.ffmpeg.version,
+                self.encoder_args() + self.rate_args(),
+                self.logger
+            )
+            self.logger.info(f"Using segment cache: {self.config.cache_dir}")
+        except OSError as e:
+            self.logger.warning(f"Segment cache unavailable, rendering without it: {e}")
+
+    def prepare_segment_video(self, segment: SlideSegment, index: int) -> Optional[Path]:
+        """Create a video clip for a single segment from its slide image."""
+        # Get slide path or create placeholder
+        slide_path = self.resolve_slide(segment)
+        if slide_path is None:
+            return None
+
+        # Create video from image with exact duration
+        output_path, msg = self._encode_segment(segment, slide_path)
+        if output_path is None:
             self.logger.error(f"Failed to create segment {segment.segment_id} video: {msg}")
             return None
 
         return output_path
 
+    def prepare_segment_videos(self, segments: list[SlideSegment]) -> list[Path]:
+        """Encode all segment clips using a bounded worker pool.
+
+        Slides and placeholders are resolved in order on the calling thread,
+        and results are collected in segment order, so the concat list and
+        log output match a sequential run.
+        """
+        slide_paths = [self.resolve_slide(segment) for segment in segments]
+        jobs = max(1, self.config.jobs)
+        self.logger.info(f"Encoding segments with {jobs} job(s), {self.encoder_threads()} thread(s) each")
+
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = [
+                pool.submit(self._encode_segment, segment, slide_path) if slide_path else None
+                for segment, slide_path in zip(segments, slide_paths)
+            ]
+
+            segment_videos = []
+            for i, (segment, future) in enumerate(zip(segments, futures)):
+                print(f"\rProcessing segment {i+1}/{len(segments)}: {segment.segment_id}", end="", flush=True)
+                video_path, msg = future.result() if future else (None, "")
+                if video_path:
+                    segment_videos.append(video_path)
+                    continue
+                if msg:
+                    self.logger.error(f"Failed to create segment {segment.segment_id} video: {msg}")
+                self.logger.warning(f"Skipping segment {segment.segment_id} due to error")
+
+        print()  # New line after progress
+        return segment_videos
+
+    def segments_conform(self, segment_videos: list[Path]) -> bool:
+        """Check that all clips share codec, resolution, fps and pix_fmt."""
+        reference = None
+        for video in segment_videos:
+            params = self.ffmpeg.get_video_stream_params(video)
+            if not params:
+                return False
+            if self.config.vfr:
+                # Frame rate guesses vary with each VFR clip's timestamps
+                params.pop("r_frame_rate", None)
+            if reference is None:
+                reference = params
+            elif params != reference:
+                self.logger.debug(f"{video.name} does not conform: {params} != {reference}")
+                return False
+        return True
+
     def concatenate_segments_simple(self, segment_videos: list[Path]) -> Optional[Path]:
         """Concatenate segment videos without transitions (simple concat)."""
         if not segment_videos:
@@ -573,15 +676,21 @@ class AudioSlidesCompositor:
                 # Use forward slashes for ffmpeg compatibility
                 f.write(f"file '{video.as_posix()}'\n")
 
+        stream_copy = self.segments_conform(segment_videos)
+        if stream_copy:
+            # Identical codec parameters: join packets without re-encoding
+            self.logger.info("Segments share encoding parameters, concatenating with stream copy")
+            codec_args = ["-c", "copy"]
+        else:
+            self.logger.info("Segment encoding parameters differ, re-encoding during concat")
+            codec_args = self.ffmpeg.runtime.video_encoder_args() + SEGMENT_PIX_FMT_ARGS
+
         success, msg = self.ffmpeg.run_ffmpeg([
             "-y",
             "-f", "concat",
             "-safe", "0",
             "-i", str(concat_list),
-            "-c:v", "libx264",
-            "-preset", "medium",
-            "-crf", "18",
-            "-pix_fmt", "yuv420p",
+            *codec_args,
             str(output_path)
         ])
 
@@ -589,6 +698,10 @@ class AudioSlidesCompositor:
             self.logger.error(f"Failed to concatenate segments: {msg}")
             return None
 
+        if stream_copy:
+            total = sum(self.ffmpeg.get_duration(video) for video in segment_videos)
+            self.ffmpeg.probe_cache.record_duration(output_path, total)
+
         return output_path
 
     def concatenate_segments_with_transitions(self, segment_videos: list[Path]) -> Optional[Path]:
@@ -599,68 +712,218 @@ class AudioSlidesCompositor:
         if len(segment_videos) == 1:
             return segment_videos[0]
 
-        # For crossfade, we need to use xfade filter
-        # This is complex with many segments, so we'll do it pairwise
         transition_dur = self.config.transition_duration
+        n = len(segment_videos)
 
-        self.logger.info(f"Applying {transition_dur}s crossfade transitions between {len(segment_videos)} segments")
+        self.logger.info(f"Applying {transition_dur}s crossfade transitions between {n} segments")
 
-        # Build complex filter graph for xfade
-        # For n videos, we need n-1 xfade filters
-        n = len(segment_videos)
+        # Calculate offsets for xfade from the actual clip durations
+        durations = [self.ffmpeg.get_duration(video) for video in segment_videos]
+        inputs = [(video, 0.0, dur) for video, dur in zip(segment_videos, durations)]
 
-        # Input labels
-        inputs = []
-        for i, video in enumerate(segment_videos):
-            inputs.extend(["-i", str(video)])
+        chunk_size = max(2, self.config.transition_chunk_size)
+        if self.config.transition_engine == "graph" or n <= chunk_size:
+            output_path = self.temp_dir / "slides_transition.mp4"
+            success, msg = self._render_xfade_chain(inputs, output_path, 0)
+        else:
+            output_path, msg = self._crossfade_chunked(inputs, chunk_size)
+            success = output_path is not None
 
-        # Calculate offsets for xfade
-        # Each xfade needs an offset which is the total duration up to that point minus transition time
-        durations = []
-        for video in segment_videos:
-            dur = self.ffmpeg.get_duration(video)
-            durations.append(dur)
+        if not success:
+            self.logger.warning(f"Transition concatenation failed, falling back to simple concat: {msg}")
+            return self.concatenate_segments_simple(segment_videos)
+
+        return output_path
+
+    def _render_xfade_chain(
+        self,
+        inputs: list[tuple[Path, float, float]],
+        output_path: Path,
+        threads: int
+    ) -> tuple[bool, str]:
+        """Encode a chain of clips joined by xfade.
 
-        # Build filter complex
+        Each input is (path, start offset, duration used from that offset).
+        Trimming happens in the filter graph so VFR clips are cut correctly.
+        """
+        transition_dur = self.config.transition_duration
+        n = len(inputs)
+        durations = [dur for _, _, dur in inputs]
+        total = sum(durations) - transition_dur * (n - 1)
+
+        args = ["-y"]
         filter_parts = []
-        current_input = "[0:v]"
+        for i, (video, start, dur) in enumerate(inputs):
+            args.extend(["-i", str(video)])
+            # VFR clips are brought back to full rate for the crossfades
+            rate = f"fps={OUTPUT_FPS}," if self.config.vfr else ""
+            filter_parts.append(
+                f"[{i}:v]{rate}trim=start={start:.3f}:duration={dur:.3f},setpts=PTS-STARTPTS[in{i}]"
+            )
 
+        # For n inputs, we need n-1 xfade filters
+        current_input = "[in0]"
         for i in range(1, n):
-            next_input = f"[{i}:v]"
-            output_label = f"[v{i}]" if i < n - 1 else "[vout]"
+            output_label = f"[v{i}]"
 
-            # Calculate offset: cumulative duration minus transition overlaps so far
-            offset = sum(durations[:i]) - (transition_dur * (i))
-            offset = max(0, offset)
+            # Offset: cumulative duration minus transition overlaps so far
+            offset = max(0, sum(durations[:i]) - (transition_dur * i))
 
             filter_parts.append(
-                f"{current_input}{next_input}xfade=transition=fade:duration={transition_dur}:offset={offset:.3f}{output_label}"
+                f"{current_input}[in{i}]xfade=transition=fade:duration={transition_dur}:offset={offset:.3f}{output_label}"
             )
-
             current_input = output_label
 
-        filter_complex = ";".join(filter_parts)
-
-        output_path = self.temp_dir / "slides_transition.mp4"
+        if self.config.vfr:
+            # Static stretches collapse to single held frames; fades stay at full rate
+            frame_count = round(total * OUTPUT_FPS)
+            filter_parts.append(f"{current_input}{self._vfr_select(frame_count)}[vout]")
+        else:
+            filter_parts.append(f"{current_input}null[vout]")
 
-        cmd = ["-y"] + inputs + [
-            "-filter_complex", filter_complex,
+        args.extend([
+            "-filter_complex", ";".join(filter_parts),
             "-map", "[vout]",
-            "-c:v", "libx264",
-            "-preset", "medium",
-            "-crf", "18",
-            "-pix_fmt", "yuv420p",
-            "-r", str(OUTPUT_FPS),
+            *self.encoder_args(),
+            "-threads", str(threads),
+            *self.rate_args(),
             str(output_path)
+        ])
+
+        success, msg = self.ffmpeg.run_ffmpeg(args)
+        if success:
+            self.ffmpeg.probe_cache.record_duration(output_path, total)
+        return success, msg
+
+    def _crossfade_chunked(
+        self,
+        inputs: list[tuple[Path, float, float]],
+        chunk_size: int
+    ) -> tuple[Optional[Path], str]:
+        """Render crossfades in independent chunks and join them with stream copy.
+
+        The timeline is split at segment boundaries. Each chunk also renders
+        the fade into the first segment of the next chunk, using only the
+        first transition_duration seconds of it. The next chunk starts that
+        far into the same segment. Every chunk is a fresh encode, so each one
+        begins on a keyframe and the joins can be stream-copied. The result
+        has the same length as the single xfade graph.
+        """
+        chunk_jobs = [
+            (self.temp_dir / f"transition_chunk_{c:03d}.mp4", chunk_inputs)
+            for c, chunk_inputs in enumerate(self.plan_crossfade_chunks(inputs, chunk_size))
         ]
 
-        success, msg = self.ffmpeg.run_ffmpeg(cmd)
+        jobs = max(1, self.config.jobs)
+        self.logger.info(f"Rendering {len(chunk_jobs)} transition chunks with {jobs} job(s)")
 
-        if not success:
-            self.logger.warning(f"Transition concatenation failed, falling back to simple concat: {msg}")
-            return self.concatenate_segments_simple(segment_videos)
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = [
+                pool.submit(self._render_xfade_chain, chunk_inputs, chunk_path, self.encoder_threads())
+                for chunk_path, chunk_inputs in chunk_jobs
+            ]
+            results = [future.result() for future in futures]
 
-        return output_path
+        for (chunk_path, _), (success, msg) in zip(chunk_jobs, results):
+            if not success:
+                return None, f"{chunk_path.name}: {msg}"
+
+        concat_list = self.temp_dir / "transition_chunks.txt"
+        with open(concat_list, 'w') as f:
+            for chunk_path, _ in chunk_jobs:
+                f.write(f"file '{chunk_path.as_posix()}'\n")
+
+        output_path = self.temp_dir / "slides_transition.mp4"
+        success, msg = self.ffmpeg.run_ffmpeg([
+            "-y",
+            "-f", "concat",
+            "-safe", "0",
+            "-i", str(concat_list),
+            "-c", "copy",
+            str(output_path)
+        ])
+
+        return (output_path if success else None), msg
+
+    def plan_crossfade_chunks(
+        self,
+        inputs: list[tuple[Path, float, float]],
+        chunk_size: int
+    ) -> list[list[tuple[Path, float, float]]]:
+        """Split xfade inputs into chunks that each render as an independent chain.
+
+        Chunks start at segment boundaries. A chunk after the first starts
+        transition_duration into its first segment, whose head the previous
+        chunk fades into, so the chunk lengths sum to the single chain's.
+        """
+        transition_dur = self.config.transition_duration
+        n = len(inputs)
+
+        # Chunk boundaries; never leave a lone segment in the last chunk
+        starts = list(range(0, n, chunk_size))
+        if len(starts) > 1 and n - starts[-1] < 2:
+            starts.pop()
+        bounds = [(a, (starts[i + 1] if i + 1 < len(starts) else n)) for i, a in enumerate(starts)]
+
+        chunks = []
+        for c, (a, b) in enumerate(bounds):
+            chunk_inputs = list(inputs[a:b])
+            if c > 0:
+                # Skip the head already shown in the previous chunk's fade
+                video, start, dur = chunk_inputs[0]
+                chunk_inputs[0] = (video, start + transition_dur, dur - transition_dur)
+            if b < n:
+                # Fade into the head of the next chunk's first segment
+                video, start, _ = inputs[b]
+                chunk_inputs.append((video, start, transition_dur))
+            chunks.append(chunk_inputs)
+        return chunks
+
+    def fit_segments_to_duration(self, segments: list[SlideSegment], target_duration: float) -> list[SlideSegment]:
+        """Plan segment durations so the joined timeline lands exactly on the target.
+
+        Durations are quantised to whole frames and the crossfade overlaps are
+        accounted for. The last segment is stretched to hold its slide when the
+        slides run short, and trailing segments are shortened (or dropped) when
+        they run long. This replaces a separate full-length tpad/trim pass.
+        Every segment is kept long enough to hold a fade in and a fade out, so
+        a chunked crossfade can start on any of them.
+        """
+        if not segments or target_duration <= 0:
+            return segments
+
+        overlap_frames = 0
+        if self.config.transition_duration > 0 and len(segments) > 1:
+            overlap_frames = round(self.config.transition_duration * OUTPUT_FPS)
+        min_frames = 2 * overlap_frames + 1
+
+        frames = [max(min_frames, round(seg.duration * OUTPUT_FPS)) for seg in segments]
+        target_frames = round(target_duration * OUTPUT_FPS)
+
+        def timeline_frames() -> int:
+            return sum(frames) - overlap_frames * (len(frames) - 1)
+
+        # Trim from the end when the slides outrun the audio
+        while len(frames) > 1 and timeline_frames() - frames[-1] + overlap_frames >= target_frames:
+            frames.pop()
+        frames[-1] += target_frames - timeline_frames()
+        frames[-1] = max(1, frames[-1])
+
+        planned = [
+            replace(seg, duration=count / OUTPUT_FPS)
+            for seg, count in zip(segments, frames)
+        ]
+
+        delta = planned[-1].duration - segments[len(planned) - 1].duration
+        if len(planned) < len(segments):
+            self.logger.info(f"Dropping {len(segments) - len(planned)} trailing segment(s) past the audio end")
+        if abs(delta) >= 1 / OUTPUT_FPS:
+            self.logger.info(
+                f"{'Holding' if delta > 0 else 'Trimming'} last slide by {abs(delta):.2f}s "
+                f"to match {target_duration:.2f}s of audio"
+            )
+
+        return planned
 
     def adjust_video_duration(self, video_path: Path, target_duration: float) -> Optional[Path]:
         """Adjust video duration to match target (audio) duration."""
@@ -683,10 +946,8 @@ class AudioSlidesCompositor:
                 "-y",
                 "-i", str(video_path),
                 "-vf", f"tpad=stop_mode=clone:stop_duration={extend_duration}",
-                "-c:v", "libx264",
-                "-preset", "medium",
-                "-crf", "18",
-                "-pix_fmt", "yuv420p",
+                *self.ffmpeg.runtime.video_encoder_args(),
+                *SEGMENT_PIX_FMT_ARGS,
                 str(output_path)
             ])
 
@@ -698,10 +959,8 @@ class AudioSlidesCompositor:
                 "-y",
                 "-i", str(video_path),
                 "-t", str(target_duration),
-                "-c:v", "libx264",
-                "-preset", "medium",
-                "-crf", "18",
-                "-pix_fmt", "yuv420p",
+                *self.ffmpeg.runtime.video_encoder_args(),
+                *SEGMENT_PIX_FMT_ARGS,
                 str(output_path)
             ])
 
@@ -715,16 +974,12 @@ class AudioSlidesCompositor:
         """Combine the video track with audio to create final output."""
         self.logger.info("Combining audio and video tracks...")
 
-        # Determine output codec based on audio format
-        audio_suffix = self.config.audio_path.suffix.lower()
-
         success, msg = self.ffmpeg.run_ffmpeg([
             "-y",
             "-i", str(video_path),
-            "-i", str(self.config.audio_path),
+            "-i", str(self.audio_path),
             "-c:v", "copy",
-            "-c:a", "aac",
-            "-b:a", "192k",
+            *self.audio_args,
             "-map", "0:v:0",
             "-map", "1:a:0",
             "-shortest",
@@ -739,49 +994,193 @@ class AudioSlidesCompositor:
             self.logger.error(f"Failed to combine audio/video: {msg}")
             return False
 
-    def _progress_callback(self, line: str):
-        """Handle FFmpeg progress output."""
-        import re
-        match = re.search(r'time=(\d+):(\d+):(\d+\.?\d*)', line)
-        if match:
-            hours, minutes, seconds = match.groups()
-            current = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
-            total = self.audio_duration or 60
-            percent = min(100, (current / total) * 100)
-            print(f"\rProgress: {percent:.1f}% ({current:.1f}s / {total:.1f}s)", end="", flush=True)
+    def build_single_pass_args(self, segments: list[SlideSegment], slide_paths: list[Path]) -> list[str]:
+        """Build one FFmpeg invocation for slides, transitions, duration fit and audio."""
+        n = len(segments)
+        transition_dur = self.config.transition_duration if n > 1 else 0.0
+        durations = [seg.duration for seg in segments]
+
+        inputs = []
+        for seg, slide_path in zip(segments, slide_paths):
+            # Each still is looped for exactly its segment duration
+            inputs.extend([
+                "-loop", "1",
+                "-framerate", str(OUTPUT_FPS),
+                "-t", f"{seg.duration:.3f}",
+                "-i", str(slide_path),
+            ])
+        inputs.extend(["-i", str(self.audio_path)])
+
+        filter_parts = [
+            f"[{i}:v]{self._slide_filter()},fps={OUTPUT_FPS},settb=AVTB[s{i}]"
+            for i in range(n)
+        ]
+
+        if n == 1:
+            current = "[s0]"
+            timeline = durations[0]
+        elif transition_dur > 0:
+            current = "[s0]"
+            for i in range(1, n):
+                offset = max(0, sum(durations[:i]) - transition_dur * i)
+                label = f"[x{i}]"
+                filter_parts.append(
+                    f"{current}[s{i}]xfade=transition=fade:duration={transition_dur}:offset={offset:.3f}{label}"
+                )
+                current = label
+            timeline = sum(durations) - transition_dur * (n - 1)
+        else:
+            filter_parts.append("".join(f"[s{i}]" for i in range(n)) + f"concat=n={n}:v=1:a=0[joined]")
+            current = "[joined]"
+            timeline = sum(durations)
+
+        # Hold the last frame when the slides run short, then trim to the audio
+        target = self.audio_duration or timeline
+        hold = max(0.0, target - timeline)
+        vfr_select = f",{self._vfr_select(round(target * OUTPUT_FPS))}" if self.config.vfr else ""
+        filter_parts.append(
+            f"{current}tpad=stop_mode=clone:stop_duration={hold:.3f},trim=duration={target:.3f}{vfr_select}[vout]"
+        )
+
+        filter_script = self.temp_dir / "single_pass_filter.txt"
+        filter_script.write_text(";\n".join(filter_parts), encoding="utf-8")
+
+        return ["-y"] + inputs + [
+            "-filter_complex_script", str(filter_script),
+            "-map", "[vout]",
+            "-map", f"{n}:a:0",
+            *self.encoder_args(),
+            *self.rate_args(),
+            *self.audio_args,
+            "-t", f"{target:.3f}",
+            "-movflags", "+faststart",
+            str(self.config.output_path)
+        ]
+
+    def render_single_pass(self, segments: list[SlideSegment]) -> bool:
+        """Render the whole lesson with a single decode/encode pass."""
+        slide_paths = []
+        render_segments = []
+        for segment in segments:
+            slide_path = self.resolve_slide(segment)
+            if slide_path is None:
+                self.logger.warning(f"Skipping segment {segment.segment_id} due to error")
+                continue
+            render_segments.append(segment)
+            slide_paths.append(slide_path)
+
+        if not render_segments:
+            self.logger.error("No slides available for single-pass render")
+            return False
+
+        self.logger.info(f"Rendering {len(render_segments)} segments in a single pass...")
+        success, msg = self.ffmpeg.run_ffmpeg(
+            self.build_single_pass_args(render_segments, slide_paths),
+            progress_callback=self._progress_callback
+        )
+
+        if success:
+            self.logger.info(f"Final video created: {self.config.output_path}")
+            return True
+        self.logger.error(f"Single-pass render failed: {msg}")
+        return False
+
+    def _progress_callback(self, progress: FFmpegProgress):
+        """Handle FFmpeg progress events."""
+        total = self.audio_duration or 60
+        percent = min(100, (progress.out_time / total) * 100)
+        eta = ""
+        if progress.speed > 0 and not progress.done:
+            eta = f", ETA {max(0.0, total - progress.out_time) / progress.speed:.0f}s"
+        print(f"\rProgress: {percent:.1f}% ({progress.out_time:.1f}s / {total:.1f}s) "
+              f"{progress.speed:.2f}x{eta}", end="", flush=True)
 
     def run(self) -> bool:
-        """Execute the full composition pipeline."""
+        """Execute the full composition pipeline and write the run report."""
+        success = False
+        try:
+            success = self._run_pipeline()
+        finally:
+            # Also on early exits, so probes made before a failure are kept
+            self.ffmpeg.probe_cache.save()
+            if self.mezzanine:
+                self.mezzanine.save()
+            if self.config.report_path:
+                try:
+                    self.report.write(self.config.report_path, self.config.output_path, success)
+                    self.logger.info(f"Run report written: {self.config.report_path}")
+                except OSError as e:
+                    self.logger.warning(f"Failed to write run report: {e}")
+        return success
+
+    def _run_pipeline(self) -> bool:
+        """Validate, render and clean up, recording each stage in the report."""
         self.logger.info("=" * 60)
         self.logger.info("Audio-Slides Compositor Starting")
         self.logger.info("=" * 60)
 
-        # Validate inputs
-        self.logger.info("Validating inputs...")
-        if not self.validate_inputs():
-            return False
+        with self.report.stage("validate"):
+            # Validate inputs
+            self.logger.info("Validating inputs...")
+            if not self.validate_inputs():
+                return False
 
-        # Match slides to segments
-        self.logger.info("Matching slides to segments...")
-        segments = self.slide_manager.match_slides_to_segments(self.script_parser.segments)
+            # Match slides to segments
+            self.logger.info("Matching slides to segments...")
+            segments = self.slide_manager.match_slides_to_segments(self.script_parser.segments)
 
         if not segments:
             self.logger.error("No segments to process")
             return False
 
-        # Prepare individual segment videos
-        self.logger.info(f"Creating {len(segments)} segment videos...")
-        segment_videos = []
+        if self.config.single_pass:
+            with self.report.stage("single_pass"):
+                success = self.render_single_pass(segments)
+        else:
+            success = self.render_multi_pass(segments)
 
-        for i, segment in enumerate(segments):
-            print(f"\rProcessing segment {i+1}/{len(segments)}: {segment.segment_id}", end="", flush=True)
-            video_path = self.prepare_segment_video(segment, i)
-            if video_path:
-                segment_videos.append(video_path)
-            else:
-                self.logger.warning(f"Skipping segment {segment.segment_id} due to error")
+        # Cleanup temp files
+        with self.report.stage("cleanup"):
+            if success and not self.config.keep_temp:
+                self.logger.info("Cleaning up temporary files...")
+                try:
+                    shutil.rmtree(self.temp_dir, ignore_errors=True)
+                except Exception as e:
+                    self.logger.warning(f"Failed to cleanup temp dir: {e}")
 
         print()  # New line after progress
+        self.logger.info("=" * 60)
+
+        if success:
+            file_size = self.config.output_path.stat().st_size / (1024 * 1024)
+            duration = self.ffmpeg.get_duration(self.config.output_path)
+            self.logger.info(f"Composition complete!")
+            self.logger.info(f"Output: {self.config.output_path}")
+            self.logger.info(f"Duration: {duration:.2f}s ({duration/60:.1f} min)")
+            self.logger.info(f"File size: {file_size:.1f} MB")
+        else:
+            self.logger.error("Composition failed")
+
+        self.logger.info("=" * 60)
+
+        return success
+
+    def render_multi_pass(self, segments: list[SlideSegment]) -> bool:
+        """Render segment clips, join them, fit the duration, then mux audio."""
+        with self.report.stage("segment_encode"):
+            # Build the hold/trim to the audio length into the segment timeline
+            segments = self.fit_segments_to_duration(segments, self.audio_duration)
+
+            # Prepare individual segment videos
+            self.logger.info(f"Creating {len(segments)} segment videos...")
+            self.open_segment_cache()
+            segment_videos = self.prepare_segment_videos(segments)
+
+            if self.segment_cache:
+                self.logger.info(
+                    f"Segment cache: {self.segment_cache.hits} hit(s), {self.segment_cache.misses} miss(es)"
+                )
+                self.segment_cache.evict()
 
         if not segment_videos:
             self.logger.error("No segment videos created")
@@ -791,18 +1190,20 @@ class AudioSlidesCompositor:
 
         # Concatenate segments with transitions
         self.logger.info("Concatenating segments...")
-        if self.config.transition_duration > 0:
-            slides_video = self.concatenate_segments_with_transitions(segment_videos)
-        else:
-            slides_video = self.concatenate_segments_simple(segment_videos)
+        with self.report.stage("transitions"):
+            if self.config.transition_duration > 0:
+                slides_video = self.concatenate_segments_with_transitions(segment_videos)
+            else:
+                slides_video = self.concatenate_segments_simple(segment_videos)
 
         if slides_video is None:
             self.logger.error("Failed to concatenate segments")
             return False
 
-        # Adjust video duration to match audio
-        self.logger.info("Adjusting video duration to match audio...")
-        slides_video = self.adjust_video_duration(slides_video, self.audio_duration)
+        # The timeline was planned to the audio length; this only re-encodes
+        # if a segment failed or a fallback path changed the total duration
+        with self.report.stage("duration_adjust"):
+            slides_video = self.adjust_video_duration(slides_video, self.audio_duration)
 
         if slides_video is None:
             self.logger.error("Failed to adjust video duration")
@@ -810,32 +1211,8 @@ class AudioSlidesCompositor:
 
         # Combine with audio
         self.logger.info("Combining with audio track...")
-        success = self.combine_audio_video(slides_video)
-
-        # Cleanup temp files
-        if success and not self.config.keep_temp:
-            self.logger.info("Cleaning up temporary files...")
-            try:
-                shutil.rmtree(self.temp_dir, ignore_errors=True)
-            except Exception as e:
-                self.logger.warning(f"Failed to cleanup temp dir: {e}")
-
-        print()  # New line after progress
-        self.logger.info("=" * 60)
-
-        if success:
-            file_size = self.config.output_path.stat().st_size / (1024 * 1024)
-            duration = self.ffmpeg.get_duration(self.config.output_path)
-            self.logger.info(f"Composition complete!")
-            self.logger.info(f"Output: {self.config.output_path}")
-            self.logger.info(f"Duration: {duration:.2f}s ({duration/60:.1f} min)")
-            self.logger.info(f"File size: {file_size:.1f} MB")
-        else:
-            self.logger.error("Composition failed")
-
-        self.logger.info("=" * 60)
-
-        return success
+        with self.report.stage("mux"):
+            return self.combine_audio_video(slides_video)
 
 
 # ============================================================================
@@ -880,6 +1257,14 @@ Examples:
         --output final.mp4 \\
         -v --keep-temp
 
+    # Single-pass render (one decode/encode for the whole lesson)
+    python audio-slides-compositor.py \\
+        --audio audio.aac \\
+        --slides ./slides/ \\
+        --script script.json \\
+        --output final.mp4 \\
+        --single-pass
+
 Slide Naming Convention:
     Slides should be named: segment_001.png, segment_002.png, etc.
     The number corresponds to the segment_id in the parsed script JSON.
@@ -929,6 +1314,111 @@ Supported Image Formats:
         help=f"Crossfade transition duration in seconds (default: {DEFAULT_TRANSITION_DURATION}s, 0 for hard cuts)"
     )
 
+    parser.add_argument(
+        "--transition-engine",
+        choices=["chunked", "graph"],
+        default=DEFAULT_TRANSITION_ENGINE,
+        help="Crossfade engine: parallel chunks joined by stream copy, or one xfade graph (default: chunked)"
+    )
+
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_TRANSITION_CHUNK_SIZE,
+        help=f"Segments per crossfade chunk (default: {DEFAULT_TRANSITION_CHUNK_SIZE})"
+    )
+
+    parser.add_argument(
+        "--single-pass",
+        action="store_true",
+        help="Render slides, transitions and audio in one FFmpeg pass (no intermediate clips)"
+    )
+
+    parser.add_argument(
+        "--encoder-profile",
+        choices=["still", "standard"],
+        default=DEFAULT_ENCODER_PROFILE,
+        help="x264 profile: 'still' uses stillimage tuning and long GOPs for slides (default: still)"
+    )
+
+    parser.add_argument(
+        "--vfr",
+        action="store_true",
+        help="Variable frame rate output: each slide is one held frame, only transitions run at full rate"
+    )
+
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Number of segment clips to encode in parallel (default: {DEFAULT_JOBS})"
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help=f"Persistent cache for rendered segment clips (default: {DEFAULT_CACHE_DIR})"
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the segment cache and render every clip from scratch"
+    )
+
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_CACHE_SIZE_MB,
+        help=f"Segment cache size cap in MB; least recently used clips are evicted (default: {DEFAULT_CACHE_SIZE_MB})"
+    )
+
+    parser.add_argument(
+        "--probe-cache",
+        type=Path,
+        help="Persist ffprobe results to this JSON file and reuse them across runs"
+    )
+
+    parser.add_argument(
+        "--report",
+        type=Path,
+        help="Write a per-stage timing and resource report (JSON) to this path"
+    )
+
+    parser.add_argument(
+        "--asset-catalog",
+        type=Path,
+        default=DEFAULT_CATALOG_PATH,
+        help="Persisted slide index, shared between runs and compositors (default: output/asset-catalog.json)"
+    )
+
+    parser.add_argument(
+        "--no-asset-catalog",
+        action="store_true",
+        help="Index slides in memory only, without reading or writing the catalog file"
+    )
+
+    parser.add_argument(
+        "--mezzanine-manifest",
+        type=Path,
+        default=DEFAULT_MANIFEST_PATH,
+        help="Mezzanine manifest to take the conformed audio from (default: output/mezzanine/manifest.json)"
+    )
+
+    parser.add_argument(
+        "--no-mezzanine",
+        action="store_true",
+        help="Use the audio file as it is, without the mezzanine stage"
+    )
+
+    parser.add_argument(
+        "--normalize-media",
+        action="store_true",
+        help="Transcode the audio into the mezzanine store during the run if it is missing "
+             "(default: use only a copy normalize-media.py already made)"
+    )
+
     parser.add_argument(
         "--temp-dir",
         type=Path,
@@ -966,12 +1456,16 @@ def main():
 
     # FFmpeg check mode
     if args.check_ffmpeg:
+        get_runtime(refresh=True, logger=logger)  # Re-probe rather than trust the cache
         ffmpeg = FFmpegWrapper(logger)
         available, version = ffmpeg.check_availability()
         if available:
             print(f"FFmpeg is available: {version}")
             print(f"FFmpeg path: {ffmpeg.ffmpeg_path}")
             print(f"FFprobe path: {ffmpeg.ffprobe_path}")
+            print(f"Video encoder: {ffmpeg.runtime.video_encoder}")
+            for name, present in ffmpeg.runtime.capabilities().items():
+                print(f"  {name:<10} {'yes' if present else 'no'}")
             sys.exit(0)
         else:
             print(f"FFmpeg not available: {version}")
@@ -994,7 +1488,20 @@ def main():
         transition_duration=args.transition,
         verbose=args.verbose,
         temp_dir=args.temp_dir,
-        keep_temp=args.keep_temp
+        keep_temp=args.keep_temp,
+        single_pass=args.single_pass,
+        encoder_profile=args.encoder_profile,
+        vfr=args.vfr,
+        jobs=max(1, args.jobs),
+        transition_engine=args.transition_engine,
+        transition_chunk_size=args.chunk_size,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        cache_size_mb=args.cache_size,
+        probe_cache=args.probe_cache,
+        report_path=args.report,
+        asset_catalog=None if args.no_asset_catalog else args.asset_catalog,
+        mezzanine_manifest=None if args.no_mezzanine else args.mezzanine_manifest,
+        normalize_media=args.normalize_media
     )
 
     # Run compositor
@@ -28,6 +28,8 @@ from enum import Enum
 
 import requests
 
+from script_ir import load_script_ir
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -113,74 +115,6 @@ class VideoJob:
 # Script Parser
 # ============================================================================
 
-def extract_spoken_text(content: str) -> str:
-    """
-    Extract only the spoken dialogue from a video script.
-    Removes screen directions, pause markers, headers, etc.
-    """
-    lines = content.split('\n')
-    spoken_lines = []
-
-    for line in lines:
-        line = line.strip()
-
-        # Skip empty lines
-        if not line:
-            continue
-
-        # Skip markdown headers
-        if line.startswith('#'):
-            continue
-
-        # Skip metadata lines
-        if line.startswith('**') and ':' in line:
-            continue
-        if line.startswith('*') and ('word' in line.lower() or 'runtime' in line.lower()):
-            continue
-
-        # Skip horizontal rules
-        if line == '---':
-            continue
-
-        # Skip screen directions [SCREEN: ...]
-        if line.startswith('[SCREEN:') or line.startswith('[Screen:'):
-            continue
-
-        # Remove inline [SCREEN: ...] and [PAUSE] markers
-        line = re.sub(r'\[SCREEN:[^\]]+\]', '', line)
-        line = re.sub(r'\[PAUSE\]', '', line)
-        line = re.sub(r'\[pause\]', '', line)
-
-        # Skip production notes sections
-        if 'PRODUCTION NOTES' in line.upper():
-            break
-        if 'KEY TERMS FOR PRONUNCIATION' in line.upper():
-            break
-        if 'POST-VIDEO RESOURCES' in line.upper():
-            break
-
-        # Clean up the line
-        line = line.strip()
-
-        # Skip bullet points that are just labels
-        if line.startswith('- ') and ':' in line and len(line) < 50:
-            continue
-
-        if line:
-            spoken_lines.append(line)
-
-    # Join and clean up
-    text = ' '.join(spoken_lines)
-
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-
-    # Remove markdown formatting
-    text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)  # Bold
-    text = re.sub(r'\*([^*]+)\*', r'\1', text)      # Italic
-
-    return text.strip()
-
 def get_script_priority(filename: str) -> int:
     """Determine priority based on filename."""
     for p1_prefix in PRIORITY_1_SCRIPTS:
@@ -229,16 +163,13 @@ def load_all_scripts() -> List[VideoScript]:
 
     for md_file in sorted(SCRIPTS_DIR.glob("*.md")):
         try:
-            content = md_file.read_text(encoding='utf-8')
-            spoken_text = extract_spoken_text(content)
-
-            # Extract title from content or filename
-            title_match = re.search(r'^#\s+(.+?)(?:\n|$)', content, re.MULTILINE)
-            title = title_match.group(1) if title_match else md_file.stem
+            # Shared, cached parse (see script_ir.py)
+            ir = load_script_ir(md_file)
+            content = ir.content
+            spoken_text = ir.avatar_text
 
-            # Clean up title
-            title = re.sub(r'^Script\s+\d+\.\d+:\s*', '', title)
-            title = re.sub(r'^Module\s+\d+\.\d+:\s*', '', title)
+            # Title without the "Module N.N:" prefix
+            title = re.sub(r'^Module\s+\d+\.\d+:\s*', '', ir.title)
 
             priority = get_script_priority(md_file.stem)
 
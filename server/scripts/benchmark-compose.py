@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Compose Benchmark
+=================
+Times the chunked final composite (--compose-chunks N) against the single
+encode on a real lesson, and checks both outputs frame by frame.
+
+video-compositor.py is run once per chunk count with --report, on the same
+Devon video, assets and script. The "mux" stage of each run report is the
+composite itself (for chunked runs it also contains the compose_chunks,
+chunk_join and chunk_verify stages). Each output's frame timestamps are
+then read with ffprobe and checked for the expected frame count and for
+duplicated or dropped frames, which is where chunk cuts would show up.
+A chunked run whose own check failed falls back to the single encode; the
+benchmark reports that instead of timing it as a chunked run.
+
+Any further arguments are passed to video-compositor.py unchanged.
+
+Usage:
+    python benchmark-compose.py --devon devon.mp4 --assets ./assets/ --script parsed.json
+    python benchmark-compose.py --devon devon.mp4 --assets ./assets/ --script parsed.json --chunks 2 4 8
+    python benchmark-compose.py ... --json results.json --transition 0
+
+Requirements:
+    - FFmpeg installed and accessible via command line
+    - Python 3.8+
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from ffmpeg_runtime import get_runtime
+from ffmpeg_tools import count_frame_errors, probe_frame_times
+
+# ============================================================================
+# Constants and Configuration
+# ============================================================================
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+COMPOSITOR = SCRIPT_DIR / "video-compositor.py"
+
+OUTPUT_FPS = 30  # video-compositor.py output rate
+DEFAULT_CHUNKS = [4]
+
+
+# ============================================================================
+# Runs
+# ============================================================================
+
+def run_compositor(args: argparse.Namespace, extra: list[str], chunks: int, work_dir: Path) -> dict:
+    """Run video-compositor.py with the given chunk count and summarise its report."""
+    output_path = work_dir / f"compose_{chunks}.mp4"
+    report_path = work_dir / f"compose_{chunks}.report.json"
+    command = [
+        sys.executable, str(COMPOSITOR),
+        "--devon", str(args.devon),
+        "--assets", str(args.assets),
+        "--script", str(args.script),
+        "--output", str(output_path),
+        "--compose-chunks", str(chunks),
+        "--report", str(report_path),
+        *extra,
+    ]
+    print(f"Composing with {chunks} chunk(s)...")
+    result = subprocess.run(command, capture_output=True, text=True)
+
+    row = {"chunks": chunks, "success": result.returncode == 0, "output": str(output_path)}
+    if not report_path.exists():
+        return row
+
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    stages = {stage["name"]: stage for stage in report["stages"]}
+    row["success"] = row["success"] and report["success"]
+    row["total_seconds"] = report["wall_seconds"]
+    for name in ("mux", "compose_chunks", "chunk_join", "chunk_verify"):
+        if name in stages:
+            row[f"{name}_seconds"] = stages[name]["wall_seconds"]
+    row["child_cpu_seconds"] = stages.get("mux", {}).get("child_cpu_seconds")
+    # A single-encode "compose" stage in a chunked run means its chunks were discarded
+    row["fell_back"] = chunks > 1 and "compose" in stages
+    return row
+
+
+def check_frames(ffprobe_path: str, row: dict):
+    """Add the frame count and duplicated/dropped frames of a run's output."""
+    frame_times = probe_frame_times(ffprobe_path, Path(row["output"])) if row["success"] else None
+    if not frame_times:
+        return
+    row["frames"] = len(frame_times)
+    row["duplicated"], row["dropped"] = count_frame_errors(frame_times, OUTPUT_FPS)
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def parse_args() -> tuple[argparse.Namespace, list[str]]:
+    """Parse command line arguments; unknown ones go to the compositor."""
+    parser = argparse.ArgumentParser(description="Benchmark chunked against single-encode final composites")
+    parser.add_argument("--devon", type=Path, required=True, help="Devon avatar video")
+    parser.add_argument("--assets", type=Path, required=True, help="Visual assets directory")
+    parser.add_argument("--script", type=Path, required=True, help="Parsed script JSON")
+    parser.add_argument("--chunks", type=int, nargs="+", default=DEFAULT_CHUNKS,
+                        help="Chunk counts to compare with the single encode (default: 4)")
+    parser.add_argument("--work-dir", type=Path,
+                        help="Keep outputs and run reports here (default: a temporary directory)")
+    parser.add_argument("--json", type=Path, help="Write results as JSON to this path")
+    return parser.parse_known_args()
+
+
+def main():
+    """Main entry point."""
+    args, extra = parse_args()
+    runtime = get_runtime()
+    if not runtime.available:
+        print("FFmpeg not found")
+        sys.exit(1)
+
+    with tempfile.TemporaryDirectory(prefix="compose_benchmark_") as temp_dir:
+        work_dir = args.work_dir or Path(temp_dir)
+        work_dir.mkdir(parents=True, exist_ok=True)
+
+        results = []
+        for chunks in [1] + [n for n in args.chunks if n > 1]:
+            row = run_compositor(args, extra, chunks, work_dir)
+            check_frames(runtime.ffprobe_path, row)
+            results.append(row)
+
+    single = results[0]
+    failed = False
+    print()
+    print(f"{'Chunks':>7} {'compose (s)':>12} {'speedup':>8} {'frames':>8} {'dup':>5} {'drop':>5} {'result':>10}")
+    for row in results:
+        frames_match = row.get("frames") is not None and row.get("frames") == single.get("frames")
+        exact = frames_match and not row.get("duplicated") and not row.get("dropped")
+        if not row["success"]:
+            status = "FAILED"
+        elif row.get("fell_back"):
+            status = "FELL BACK"
+        else:
+            status = "exact" if exact else "MISMATCH"
+        failed = failed or status != "exact"
+        row["status"] = status
+
+        seconds = row.get("mux_seconds")
+        speedup = "-"
+        if seconds and single.get("mux_seconds"):
+            speedup = f"{single['mux_seconds'] / seconds:.2f}x"
+        print(
+            f"{row['chunks']:>7} {seconds if seconds is not None else '-':>12} {speedup:>8} "
+            f"{row.get('frames', '-'):>8} {row.get('duplicated', '-'):>5} {row.get('dropped', '-'):>5} {status:>10}"
+        )
+
+    if args.json:
+        args.json.write_text(json.dumps({"results": results}, indent=2), encoding="utf-8")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
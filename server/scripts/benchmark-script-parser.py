@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Script Parser Benchmark
+=======================
+Times the single-pass segment tokenizer (script_ir.scan_segment) against
+the reference multi-pass regex cleaner it replaced on synthetic scripts,
+and checks that both produce byte-identical script JSON. The reference is
+swapped in by patching script_ir.scan_segment for the comparison parse.
+
+Each synthetic script has the given number of [SCREEN: ...] cues, with
+spoken text mixing plain prose, bold/italic/code markup, [PAUSE] markers,
+section headers and horizontal rules, plus the usual footer. The segment
+stage (cleaning, word and pause counts for every cue) is timed on its own,
+since the full parse also includes cue classification; timings are
+reported per cue so scaling across sizes is visible.
+
+Usage:
+    python benchmark-script-parser.py                     # 100, 1000 and 10000 cues
+    python benchmark-script-parser.py --counts 10000 --repeat 5
+    python benchmark-script-parser.py --json results.json
+
+Requirements:
+    - Python 3.8+
+"""
+
+import argparse
+import importlib.util
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+import script_ir
+from script_ir import SCREEN_PATTERN, SCRIPT_END_PATTERN, count_words, scan_segment
+
+# ============================================================================
+# Constants and Configuration
+# ============================================================================
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+PARSER = SCRIPT_DIR / "video-script-parser.py"
+
+DEFAULT_COUNTS = [100, 1000, 10000]
+DEFAULT_REPEAT = 3
+
+CUE_KINDS = [
+    "Slide with title \"{n}\"",
+    "Diagram showing the request flow for step {n}",
+    "Terminal window running aws s3 ls",
+    "Avatar on camera, explaining point {n}",
+    "Code snippet highlighting line {n}",
+]
+SENTENCES = [
+    "Welcome back to the course, today we build something useful.",
+    "Notice how the **load balancer** spreads traffic across zones.",
+    "Run `terraform plan` before you apply anything. [PAUSE]",
+    "This is the *important* part, so take your time here.",
+    "Each request is logged [see appendix] for later review.",
+    "That wraps up this section.",
+]
+
+
+def load_parser():
+    """Import video-script-parser.py (hyphenated, so not importable by name)."""
+    spec = importlib.util.spec_from_file_location("video_script_parser", PARSER)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def clean_segment_regex(text: str) -> tuple[str, int, int]:
+    """
+    Reference multi-pass version of scan_segment, one regex pass per rule.
+    """
+    spoken_text = text.strip()
+    # Remove section headers (## HEADING)
+    spoken_text = re.sub(r'^##\s+.+$', '', spoken_text, flags=re.MULTILINE)
+    # Remove horizontal rules
+    spoken_text = re.sub(r'^---+$', '', spoken_text, flags=re.MULTILINE)
+    # Remove [PAUSE] for word counting but keep for reference
+    spoken_text_for_count = re.sub(r'\[PAUSE\]', '', spoken_text, flags=re.IGNORECASE)
+    pause_count = len(re.findall(r'\[PAUSE\]', spoken_text, re.IGNORECASE))
+    # Normalize whitespace
+    spoken_text = re.sub(r'\n{3,}', '\n\n', spoken_text).strip()
+    word_count = count_words(spoken_text_for_count.strip())
+    return spoken_text, word_count, pause_count
+
+
+# ============================================================================
+# Synthetic Scripts
+# ============================================================================
+
+def build_script(cues: int, seed: int = 0) -> str:
+    """Generate a markdown video script with the given number of visual cues."""
+    rng = random.Random(seed)
+    lines = [
+        "# Benchmark Lesson",
+        "",
+        "**Duration:** 10:00",
+        "**Module:** Benchmarks",
+        "",
+    ]
+    for n in range(1, cues + 1):
+        if n % 25 == 1:
+            lines += ["---", "", f"## SECTION {n // 25 + 1}", ""]
+        lines.append(f"[SCREEN: {rng.choice(CUE_KINDS).format(n=n)}]")
+        lines.append("")
+        for _ in range(rng.randint(1, 4)):
+            lines.append(rng.choice(SENTENCES))
+        lines.append("")
+    lines += ["---", "", "**END OF SCRIPT**", "", "*Approximate word count: unknown*"]
+    return "\n".join(lines) + "\n"
+
+
+def segment_texts(content: str) -> list[str]:
+    """Raw spoken text between consecutive cues, as build_script_ir slices it."""
+    cues = list(SCREEN_PATTERN.finditer(content))
+    texts = []
+    for i, cue in enumerate(cues):
+        if i + 1 < len(cues):
+            end = cues[i + 1].start()
+        else:
+            footer = SCRIPT_END_PATTERN.search(content, cue.end())
+            end = footer.start() if footer else len(content)
+        texts.append(content[cue.end():end])
+    return texts
+
+
+def time_segments(texts: list[str], scanner, repeat: int) -> float:
+    """Best-of-N time to clean and count every segment."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            scanner(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def parse_json(parser, content: str, scanner) -> str:
+    """Full script JSON as the parser writes it (parsed_at excluded)."""
+    original = script_ir.scan_segment
+    script_ir.scan_segment = scanner
+    try:
+        data = parser.script_to_dict(parser.parse_script(content, "benchmark.md"))
+    finally:
+        script_ir.scan_segment = original
+    data.pop("parsed_at", None)
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark the video script parser's segment tokenizer")
+    parser.add_argument("--counts", type=int, nargs="+", default=DEFAULT_COUNTS,
+                        help="Cue counts to benchmark (default: 100 1000 10000)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help="Runs per measurement; the best is reported (default: 3)")
+    parser.add_argument("--json", type=Path, help="Write results as JSON to this path")
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+    parser = load_parser()
+
+    results = []
+    mismatched = False
+    for count in args.counts:
+        content = build_script(count)
+        print(f"Parsing {count} cues ({len(content) / 1024:.0f} KiB)...")
+        texts = segment_texts(content)
+        regex_time = time_segments(texts, clean_segment_regex, args.repeat)
+        single_time = time_segments(texts, scan_segment, args.repeat)
+
+        identical = (parse_json(parser, content, clean_segment_regex)
+                     == parse_json(parser, content, scan_segment))
+        mismatched = mismatched or not identical
+        results.append({
+            "cues": count,
+            "multi_pass": round(regex_time, 4),
+            "single_pass": round(single_time, 4),
+            "identical": identical,
+        })
+
+    print()
+    print(f"{'Cues':>8} {'multi-pass (s)':>15} {'single-pass (s)':>16} {'us/cue':>14} {'speedup':>8} {'output':>10}")
+    for row in results:
+        per_cue = f"{row['multi_pass'] / row['cues'] * 1e6:.0f} -> {row['single_pass'] / row['cues'] * 1e6:.0f}"
+        speedup = f"{row['multi_pass'] / row['single_pass']:.2f}x" if row["single_pass"] else "-"
+        output = "identical" if row["identical"] else "DIFFERS"
+        print(f"{row['cues']:>8} {row['multi_pass']:>15} {row['single_pass']:>16} {per_cue:>14} {speedup:>8} {output:>10}")
+
+    if args.json:
+        args.json.write_text(json.dumps({"repeat": args.repeat, "results": results}, indent=2), encoding="utf-8")
+    sys.exit(1 if mismatched else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Transition Engine Benchmark
+===========================
+Times the audio-slides compositor's crossfade engines against each other on
+synthetic lessons, so changes to the transition path can be measured.
+
+For each segment count a lesson is generated (numbered test-pattern slides,
+a parsed-script JSON and a silent audio track). The segment cache is warmed
+first, so the timed runs measure concat/transitions, duration fit and mux,
+not slide encoding.
+
+Usage:
+    python benchmark-transitions.py                       # 10, 50 and 200 segments
+    python benchmark-transitions.py --counts 10 50 --jobs 8
+    python benchmark-transitions.py --json results.json
+
+Requirements:
+    - FFmpeg in PATH or a standard install location (see ffmpeg_runtime.py)
+    - Python 3.8+
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from ffmpeg_runtime import get_runtime
+
+# ============================================================================
+# Constants and Configuration
+# ============================================================================
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+COMPOSITOR = SCRIPT_DIR / "audio-slides-compositor.py"
+
+DEFAULT_COUNTS = [10, 50, 200]
+DEFAULT_SEGMENT_DURATION = 4.0  # seconds
+ENGINES = ["graph", "chunked"]
+
+
+# ============================================================================
+# Synthetic Lessons
+# ============================================================================
+
+def build_lesson(work_dir: Path, count: int, segment_duration: float, ffmpeg: str) -> dict[str, Path]:
+    """Generate slides, script JSON and silent audio for a synthetic lesson."""
+    lesson_dir = work_dir / f"lesson_{count}"
+    slides_dir = lesson_dir / "slides"
+    slides_dir.mkdir(parents=True, exist_ok=True)
+
+    # One distinct test-pattern frame per segment
+    subprocess.run([
+        ffmpeg, "-y", "-v", "error",
+        "-f", "lavfi", "-i", "testsrc2=s=1920x1080:r=1",
+        "-frames:v", str(count),
+        "-start_number", "1",
+        str(slides_dir / "segment_%03d.png")
+    ], check=True)
+
+    total = count * segment_duration
+    audio_path = lesson_dir / "audio.m4a"
+    subprocess.run([
+        ffmpeg, "-y", "-v", "error",
+        "-f", "lavfi", "-i", "anullsrc=r=48000:cl=stereo",
+        "-t", str(total),
+        "-c:a", "aac",
+        str(audio_path)
+    ], check=True)
+
+    script_path = lesson_dir / "script.json"
+    segments = [
+        {
+            "segment_id": i + 1,
+            "start_time": i * segment_duration,
+            "end_time": (i + 1) * segment_duration,
+            "visual_cue": f"Synthetic slide {i + 1}",
+        }
+        for i in range(count)
+    ]
+    script_path.write_text(json.dumps({
+        "title": f"Benchmark {count}",
+        "total_duration_seconds": total,
+        "segments": segments,
+    }, indent=2), encoding="utf-8")
+
+    return {"slides": slides_dir, "audio": audio_path, "script": script_path, "dir": lesson_dir}
+
+
+def run_compositor(lesson: dict[str, Path], engine: str, jobs: int, cache_dir: Path) -> float:
+    """Run the compositor once and return its wall time in seconds."""
+    cmd = [
+        sys.executable, str(COMPOSITOR),
+        "--audio", str(lesson["audio"]),
+        "--slides", str(lesson["slides"]),
+        "--script", str(lesson["script"]),
+        "--output", str(lesson["dir"] / f"out_{engine}.mp4"),
+        "--transition-engine", engine,
+        "--jobs", str(jobs),
+        "--cache-dir", str(cache_dir),
+    ]
+    start = time.perf_counter()
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f"{engine} run failed:\n{result.stderr[-2000:]}")
+    return elapsed
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark audio-slides crossfade engines")
+    parser.add_argument("--counts", type=int, nargs="+", default=DEFAULT_COUNTS,
+                        help="Segment counts to benchmark (default: 10 50 200)")
+    parser.add_argument("--segment-duration", type=float, default=DEFAULT_SEGMENT_DURATION,
+                        help=f"Seconds per synthetic segment (default: {DEFAULT_SEGMENT_DURATION})")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Parallel jobs passed to the compositor (default: CPU count)")
+    parser.add_argument("--work-dir", type=Path, help="Keep synthetic lessons in this directory")
+    parser.add_argument("--json", type=Path, help="Write results as JSON to this path")
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+    ffmpeg = get_runtime().ffmpeg_path
+    work_dir = args.work_dir or Path(tempfile.mkdtemp(prefix="transition_bench_"))
+    work_dir.mkdir(parents=True, exist_ok=True)
+    cache_dir = work_dir / "segment-cache"
+
+    results = []
+    try:
+        for count in args.counts:
+            print(f"Building synthetic lesson with {count} segments...")
+            lesson = build_lesson(work_dir, count, args.segment_duration, ffmpeg)
+
+            # Warm the segment cache so only the transition path differs
+            run_compositor(lesson, "chunked", args.jobs, cache_dir)
+
+            row = {"segments": count}
+            for engine in ENGINES:
+                try:
+                    row[engine] = round(run_compositor(lesson, engine, args.jobs, cache_dir), 2)
+                except RuntimeError as e:
+                    print(e)
+                    row[engine] = None
+            results.append(row)
+            print(f"  graph: {row['graph']}s  chunked: {row['chunked']}s")
+    finally:
+        if not args.work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    print()
+    print(f"{'Segments':>10} {'graph (s)':>12} {'chunked (s)':>12} {'speedup':>9}")
+    for row in results:
+        graph, chunked = row["graph"], row["chunked"]
+        speedup = f"{graph / chunked:.2f}x" if graph and chunked else "-"
+        print(f"{row['segments']:>10} {str(graph):>12} {str(chunked):>12} {speedup:>9}")
+
+    if args.json:
+        args.json.write_text(json.dumps({"jobs": args.jobs, "results": results}, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,8 +9,11 @@ import subprocess
 import sys
 from pathlib import Path
 
+from ffmpeg_runtime import get_runtime
+
 SCRIPT_DIR = Path(__file__).parent
-FFPROBE = Path(r"C:\ffmpeg\bin\ffprobe.exe")
+RUNTIME = get_runtime()
+FFPROBE = Path(RUNTIME.ffprobe_path)
 
 # Part 2 configuration
 AUDIO_FILE = "8.2-onboarding-part2.m4a"
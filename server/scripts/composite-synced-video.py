@@ -11,9 +11,12 @@ import subprocess
 import sys
 from pathlib import Path
 
+from ffmpeg_runtime import get_runtime
+
 SCRIPT_DIR = Path(__file__).parent
-FFPROBE = Path(r"C:\ffmpeg\bin\ffprobe.exe")
-FFMPEG = Path(r"C:\ffmpeg\bin\ffmpeg.exe")
+RUNTIME = get_runtime()
+FFPROBE = Path(RUNTIME.ffprobe_path)
+FFMPEG = Path(RUNTIME.ffmpeg_path)
 
 # Skip segment 25 (production notes)
 SKIP_SEGMENTS = [25]
@@ -290,8 +290,8 @@ def create_highlight_slide(main_text: str, highlight: str, output_path: Path = N
     return img
 
 
-def generate_assets_for_script(script_path: Path, output_dir: Path):
-    """Generate all visual assets for a parsed script."""
+def generate_assets_for_script(script_path: Path, output_dir: Path, segment_ids: set[int] = None):
+    """Generate visual assets for a parsed script (all segments, or only segment_ids)."""
     with open(script_path, 'r', encoding='utf-8') as f:
         data = json.load(f)
 
@@ -302,7 +302,11 @@ def generate_assets_for_script(script_path: Path, output_dir: Path):
     print(f"Output directory: {output_dir}")
     print("=" * 60)
 
-    for seg in data.get('segments', []):
+    segments = data.get('segments', [])
+    if segment_ids is not None:
+        segments = [seg for seg in segments if seg.get('segment_id') in segment_ids]
+
+    for seg in segments:
         seg_id = seg.get('segment_id', 0)
         visual_type = seg.get('visual_type', 'text_overlay')
         visual_cue = seg.get('visual_cue', '')
@@ -353,7 +357,7 @@ def generate_assets_for_script(script_path: Path, output_dir: Path):
 
         print(f"  Segment {seg_id}: {visual_type} -> {output_path.name}")
 
-    print(f"\nGenerated {len(data.get('segments', []))} assets")
+    print(f"\nGenerated {len(segments)} assets")
     return output_dir
 
 
@@ -362,6 +366,7 @@ def main():
     parser = argparse.ArgumentParser(description="Generate slide assets for video composition")
     parser.add_argument("--script", type=Path, help="Path to parsed script JSON")
     parser.add_argument("--output", type=Path, help="Output directory for assets")
+    parser.add_argument("--segments", type=int, nargs="+", help="Only generate these segment IDs (default: all)")
     parser.add_argument("--demo", action="store_true", help="Generate demo slides")
 
     args = parser.parse_args()
@@ -390,7 +395,7 @@ def main():
 
     elif args.script:
         output_dir = args.output or Path("output/generated-assets") / args.script.stem
-        generate_assets_for_script(args.script, output_dir)
+        generate_assets_for_script(args.script, output_dir, set(args.segments) if args.segments else None)
     else:
         parser.print_help()
 
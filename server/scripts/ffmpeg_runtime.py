@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+FFmpeg Runtime
+==============
+Shared discovery and capability probing for the FFmpeg toolchain, used by
+the compositors, the mezzanine stage and the composite-*.py scripts.
+
+The first run finds ffmpeg/ffprobe in PATH or the usual install locations,
+reads the version line and lists the available encoders and filters. The
+result is stored in output/ffmpeg-runtime.json together with each binary's
+size and mtime, so later runs only stat the two binaries instead of searching
+PATH and spawning `ffmpeg -version`. Replacing or upgrading FFmpeg changes
+the stat and triggers a fresh probe.
+
+The runtime also picks the fastest viable video encoder for our quality
+targets (libx264, then libsvtav1, then libx265) and exposes matching
+arguments, so every tool encodes with the same choice.
+
+This module has an importable name so the hyphenated scripts next to it can
+share it:
+    from ffmpeg_runtime import get_runtime
+"""
+
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional
+
+# ============================================================================
+# Constants and Configuration
+# ============================================================================
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+DEFAULT_RUNTIME_CACHE = SCRIPT_DIR / "output" / "ffmpeg-runtime.json"
+RUNTIME_CACHE_VERSION = 1
+
+EXE_SUFFIX = ".exe" if sys.platform == "win32" else ""
+INSTALL_DIRS = [
+    r"C:\ffmpeg\bin",
+    r"C:\Program Files\ffmpeg\bin",
+    r"C:\ProgramData\chocolatey\bin",
+    "/usr/local/bin",
+    "/usr/bin",
+    "/opt/homebrew/bin",
+]
+
+# Capabilities the tools care about, reported by --check-ffmpeg
+PROBED_ENCODERS = ["libx264", "libx265", "libsvtav1"]
+PROBED_FILTERS = ["xfade", "zscale"]
+
+# Fastest viable encoder first, with settings of comparable visual quality.
+# mpeg4 ships with every FFmpeg build and is the last resort.
+ENCODER_PREFERENCE = ["libx264", "libsvtav1", "libx265", "mpeg4"]
+ENCODER_ARGS = {
+    "libx264": ["-c:v", "libx264", "-preset", "medium", "-crf", "18"],
+    "libsvtav1": ["-c:v", "libsvtav1", "-preset", "8", "-crf", "30"],
+    "libx265": ["-c:v", "libx265", "-preset", "fast", "-crf", "20", "-tag:v", "hvc1"],
+    "mpeg4": ["-c:v", "mpeg4", "-q:v", "2"],
+}
+ENCODER_CODECS = {"libx264": "h264", "libsvtav1": "av1", "libx265": "hevc", "mpeg4": "mpeg4"}
+
+
+# ============================================================================
+# Runtime
+# ============================================================================
+
+@dataclass
+class FFmpegRuntime:
+    """A discovered FFmpeg toolchain and what it can do."""
+    ffmpeg_path: str
+    ffprobe_path: str
+    version: str = ""
+    encoders: set[str] = field(default_factory=set)
+    filters: set[str] = field(default_factory=set)
+
+    @property
+    def available(self) -> bool:
+        return bool(self.version)
+
+    def has_encoder(self, name: str) -> bool:
+        return name in self.encoders
+
+    def has_filter(self, name: str) -> bool:
+        return name in self.filters
+
+    @property
+    def video_encoder(self) -> str:
+        """The fastest viable video encoder in this build."""
+        for name in ENCODER_PREFERENCE:
+            if name in self.encoders:
+                return name
+        return "libx264"  # Unknown build; let FFmpeg report the problem
+
+    @property
+    def video_codec(self) -> str:
+        """Codec name (as ffprobe reports it) produced by video_encoder."""
+        return ENCODER_CODECS[self.video_encoder]
+
+    def video_encoder_args(self, tune: Optional[str] = None) -> list[str]:
+        """Codec, speed and quality arguments for the preferred encoder."""
+        encoder = self.video_encoder
+        args = list(ENCODER_ARGS[encoder])
+        if tune and encoder == "libx264":
+            args += ["-tune", tune]
+        return args
+
+    def capabilities(self) -> dict[str, bool]:
+        """Availability of the encoders and filters the tools rely on."""
+        return {
+            **{name: self.has_encoder(name) for name in PROBED_ENCODERS},
+            **{name: self.has_filter(name) for name in PROBED_FILTERS},
+        }
+
+
+def _locate(name: str, preferred_dir: Optional[Path] = None) -> Optional[str]:
+    """Absolute path of an FFmpeg binary, or None."""
+    exe = name + EXE_SUFFIX
+    if preferred_dir is not None and (preferred_dir / exe).is_file():
+        return str(preferred_dir / exe)
+    found = shutil.which(name)
+    if found:
+        return found
+    for directory in INSTALL_DIRS:
+        candidate = Path(directory) / exe
+        if candidate.is_file():
+            return str(candidate)
+    return None
+
+
+def _fingerprint(path: str) -> Optional[list]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [path, stat.st_size, stat.st_mtime_ns]
+
+
+def _list_names(ffmpeg_path: str, option: str) -> set[str]:
+    """Names from `ffmpeg -encoders` or `-filters` (second column of each row).
+
+    Encoder rows follow a "------" rule; filter rows are the ones whose third
+    column is an input->output signature such as "VV->V".
+    """
+    try:
+        result = subprocess.run(
+            [ffmpeg_path, "-hide_banner", option],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return set()
+
+    names = set()
+    in_table = False
+    for line in result.stdout.splitlines():
+        parts = line.split()
+        if parts and set(parts[0]) == {"-"}:
+            in_table = True
+        elif option == "-filters":
+            if len(parts) >= 3 and "->" in parts[2]:
+                names.add(parts[1])
+        elif in_table and len(parts) >= 2:
+            names.add(parts[1])
+    return names
+
+
+def probe_runtime(logger: Optional[logging.Logger] = None) -> FFmpegRuntime:
+    """Find FFmpeg and probe its version, encoders and filters (uncached)."""
+    logger = logger or logging.getLogger(__name__)
+    ffmpeg_path = _locate("ffmpeg")
+    if ffmpeg_path is None:
+        return FFmpegRuntime("ffmpeg", _locate("ffprobe") or "ffprobe")
+    ffprobe_path = _locate("ffprobe", Path(ffmpeg_path).parent) or "ffprobe"
+
+    runtime = FFmpegRuntime(ffmpeg_path, ffprobe_path)
+    try:
+        result = subprocess.run(
+            [ffmpeg_path, "-version"],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        if result.returncode == 0:
+            runtime.version = result.stdout.split("\n")[0]
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.warning(f"Could not run {ffmpeg_path}: {e}")
+        return runtime
+
+    if runtime.available:
+        runtime.encoders = _list_names(ffmpeg_path, "-encoders")
+        runtime.filters = _list_names(ffmpeg_path, "-filters")
+    return runtime
+
+
+def _load_cached(cache_path: Path) -> Optional[FFmpegRuntime]:
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if data.get("version") != RUNTIME_CACHE_VERSION:
+        return None
+
+    # Valid only while both binaries are unchanged
+    fingerprints = data.get("fingerprints", [])
+    if not fingerprints or any(_fingerprint(entry[0]) != entry for entry in fingerprints):
+        return None
+
+    runtime = data.get("runtime", {})
+    return FFmpegRuntime(
+        ffmpeg_path=runtime["ffmpeg_path"],
+        ffprobe_path=runtime["ffprobe_path"],
+        version=runtime.get("version", ""),
+        encoders=set(runtime.get("encoders", [])),
+        filters=set(runtime.get("filters", [])),
+    )
+
+
+def _save_cached(cache_path: Path, runtime: FFmpegRuntime, logger: logging.Logger):
+    fingerprints = [_fingerprint(path) for path in (runtime.ffmpeg_path, runtime.ffprobe_path)]
+    if not all(fingerprints):
+        return
+    data = asdict(runtime)
+    data["encoders"] = sorted(runtime.encoders)
+    data["filters"] = sorted(runtime.filters)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": RUNTIME_CACHE_VERSION, "fingerprints": fingerprints, "runtime": data}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Failed to save FFmpeg runtime cache: {e}")
+
+
+_runtime_lock = threading.Lock()
+_runtimes: dict[Optional[Path], FFmpegRuntime] = {}
+
+
+def get_runtime(
+    cache_path: Optional[Path] = DEFAULT_RUNTIME_CACHE,
+    refresh: bool = False,
+    logger: Optional[logging.Logger] = None
+) -> FFmpegRuntime:
+    """Return the FFmpeg runtime, probing only if the cached record is stale.
+
+    The result is also memoised per process, so every wrapper and helper in
+    a run shares one discovery.
+    """
+    logger = logger or logging.getLogger(__name__)
+    with _runtime_lock:
+        if not refresh and cache_path in _runtimes:
+            return _runtimes[cache_path]
+
+        runtime = None
+        if cache_path and not refresh:
+            runtime = _load_cached(cache_path)
+        if runtime is None:
+            runtime = probe_runtime(logger)
+            if runtime.available:
+                logger.debug(f"Probed FFmpeg at {runtime.ffmpeg_path}: {runtime.version}")
+                if cache_path:
+                    _save_cached(cache_path, runtime, logger)
+
+        _runtimes[cache_path] = runtime
+        return runtime
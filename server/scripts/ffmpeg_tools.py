@@ -0,0 +1,575 @@
+#!/usr/bin/env python3
+"""
+FFmpeg Tools
+============
+Shared FFmpeg helpers for audio-slides-compositor.py, video-compositor.py
+and the mezzanine stage:
+
+- parse_frame_rate / probe_keyframes / probe_frame_times: ffprobe rate
+  parsing, and keyframe or frame timestamps read from packets
+- count_frame_errors: duplicated and dropped frames in a timeline
+- ProbeCache: ffprobe results keyed on each file's path, size and mtime,
+  optionally persisted between runs (--probe-cache)
+- FFmpegProgress / read_progress: structured events parsed from FFmpeg's
+  machine-readable "-progress pipe:1" output
+- FFmpegWrapper: cached probes and FFmpeg runs with progress callbacks,
+  bounded stderr capture and per-run output totals
+- RunReport: per-stage wall time, child CPU, peak RSS and bytes written
+  (--report)
+
+This module has an importable name so the hyphenated scripts next to it can
+share it:
+    from ffmpeg_tools import FFmpegWrapper, ProbeCache, RunReport
+"""
+
+import json
+import logging
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from fractions import Fraction
+from pathlib import Path
+from typing import IO, Any, Callable, Optional
+
+try:
+    import resource  # POSIX only; used for per-stage child CPU and RSS
+except ImportError:
+    resource = None
+
+from ffmpeg_runtime import get_runtime
+
+# ============================================================================
+# Constants and Configuration
+# ============================================================================
+
+# FFmpeg output capture
+STDERR_TAIL_LINES = 200  # ring buffer kept while FFmpeg runs
+ERROR_TAIL_LINES = 20  # lines returned in error messages
+
+# printf-style sequence in an output name (segment muxer, image2)
+OUTPUT_PATTERN = re.compile(r"%0?\d*d")
+
+
+def parse_frame_rate(rate: Optional[str]) -> Optional[Fraction]:
+    """Parse an ffprobe rate such as "30/1" or "30000/1001"."""
+    try:
+        return Fraction(rate)
+    except (TypeError, ValueError, ZeroDivisionError):
+        return None
+
+
+def _probe_packets(ffprobe_path: str, file_path: Path) -> Optional[list[tuple[float, str]]]:
+    """(pts_time, flags) of every packet in a file's first video stream, or None if ffprobe fails."""
+    try:
+        result = subprocess.run(
+            [
+                ffprobe_path,
+                "-v", "error",
+                "-select_streams", "v:0",
+                "-show_entries", "packet=pts_time,flags",
+                "-of", "csv=p=0",
+                str(file_path)
+            ],
+            capture_output=True,
+            text=True,
+            timeout=120
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+
+    packets = []
+    for line in result.stdout.splitlines():
+        pts_time, _, flags = line.partition(",")
+        if pts_time not in ("", "N/A"):
+            packets.append((float(pts_time), flags))
+    return packets
+
+
+def probe_keyframes(ffprobe_path: str, file_path: Path) -> Optional[list[float]]:
+    """Sorted keyframe timestamps of a file's first video stream, or None if ffprobe fails.
+
+    Read from packet flags, which need no decoding, so this stays cheap on
+    long captures.
+    """
+    packets = _probe_packets(ffprobe_path, file_path)
+    if packets is None:
+        return None
+    return sorted(pts for pts, flags in packets if "K" in flags)
+
+
+def probe_frame_times(ffprobe_path: str, file_path: Path) -> Optional[list[float]]:
+    """Sorted presentation timestamps of every frame in a file's first video stream.
+
+    One packet per frame, in decode order, so sorting undoes B-frame
+    reordering. None if ffprobe fails.
+    """
+    packets = _probe_packets(ffprobe_path, file_path)
+    if packets is None:
+        return None
+    return sorted(pts for pts, _ in packets)
+
+
+def count_frame_errors(frame_times: list[float], fps: float) -> tuple[int, int]:
+    """(duplicated, dropped) frames in a constant-rate timeline of sorted timestamps.
+
+    A step under half a frame is a duplicate; a step over one and a half
+    frames is a gap, counted as the number of frames missing from it.
+    """
+    duplicated = dropped = 0
+    for previous, current in zip(frame_times, frame_times[1:]):
+        step = (current - previous) * fps
+        if step < 0.5:
+            duplicated += 1
+        elif step > 1.5:
+            dropped += round(step) - 1
+    return duplicated, dropped
+
+
+# ============================================================================
+# Probe Cache
+# ============================================================================
+
+class ProbeCache:
+    """ffprobe results keyed on (path, size, mtime_ns).
+
+    Lives in memory for the run and is optionally persisted to a JSON file.
+    Durations that are known without probing (e.g. clips just rendered with
+    an exact frame count) can be recorded directly. Entries for files that
+    were deleted or modified since they were probed are dropped on save.
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        self.cache_path = cache_path
+        self.entries: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def _key(file_path: Path) -> Optional[str]:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return f"{Path(file_path).resolve()}|{stat.st_size}|{stat.st_mtime_ns}"
+
+    @staticmethod
+    def _is_current(key: str) -> bool:
+        """True if the file a key was made from still has that size and mtime."""
+        parts = key.rsplit("|", 2)
+        return len(parts) == 3 and ProbeCache._key(Path(parts[0])) == key
+
+    def _load(self):
+        if not self.cache_path or not self.cache_path.exists():
+            return
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self.entries = {}
+
+    def get(self, file_path: Path) -> Optional[dict[str, Any]]:
+        """Return the cached entry for a file if it is unchanged."""
+        key = self._key(file_path)
+        if key is None:
+            return None
+        with self._lock:
+            return self.entries.get(key)
+
+    def put_info(self, file_path: Path, info: dict[str, Any]):
+        """Store a full ffprobe result."""
+        key = self._key(file_path)
+        if key is None or not info:
+            return
+        with self._lock:
+            self.entries.setdefault(key, {})["info"] = info
+            self._dirty = True
+
+    def record_duration(self, file_path: Path, duration: float):
+        """Store a known duration without probing."""
+        key = self._key(file_path)
+        if key is None:
+            return
+        with self._lock:
+            entry = self.entries.setdefault(key, {})
+            entry["duration"] = duration
+            self._dirty = True
+
+    def record_keyframes(self, file_path: Path, keyframes: list[float]):
+        """Store the keyframe timestamps of a file's video stream."""
+        key = self._key(file_path)
+        if key is None:
+            return
+        with self._lock:
+            self.entries.setdefault(key, {})["keyframes"] = keyframes
+            self._dirty = True
+
+    def save(self):
+        """Persist the cache if a path was configured, dropping stale entries."""
+        if not self.cache_path:
+            return
+        with self._lock:
+            current = {key: entry for key, entry in self.entries.items() if self._is_current(key)}
+            if len(current) != len(self.entries):
+                self.entries = current
+                self._dirty = True
+            if not self._dirty:
+                return
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.entries, f)
+                os.replace(tmp_path, self.cache_path)
+                self._dirty = False
+            except OSError:
+                pass
+
+
+# ============================================================================
+# Progress
+# ============================================================================
+
+@dataclass
+class FFmpegProgress:
+    """One structured progress update from FFmpeg's -progress output."""
+    frame: int = 0
+    fps: float = 0.0
+    bitrate_kbps: float = 0.0
+    total_size: int = 0
+    out_time: float = 0.0  # seconds of output written
+    speed: float = 0.0  # multiple of realtime
+    done: bool = False
+
+    @classmethod
+    def from_fields(cls, fields: dict[str, str]) -> "FFmpegProgress":
+        """Build a progress event from one block of key=value lines."""
+        def number(key: str, suffix: str = "") -> float:
+            value = fields.get(key, "").strip()
+            if suffix and value.endswith(suffix):
+                value = value[:-len(suffix)]
+            try:
+                return float(value)
+            except ValueError:
+                return 0.0
+
+        # out_time_us is microseconds; older builds only emit out_time_ms,
+        # which despite its name is also microseconds
+        out_time_us = number("out_time_us") or number("out_time_ms")
+
+        return cls(
+            frame=int(number("frame")),
+            fps=number("fps"),
+            bitrate_kbps=number("bitrate", "kbits/s"),
+            total_size=int(number("total_size")),
+            out_time=out_time_us / 1_000_000,
+            speed=number("speed", "x"),
+            done=fields.get("progress") == "end",
+        )
+
+
+def read_progress(
+    stream: IO[str],
+    callback: Optional[Callable[[FFmpegProgress], None]] = None
+) -> Optional[FFmpegProgress]:
+    """Parse FFmpeg's -progress output until EOF, returning the last event.
+
+    Progress blocks are key=value lines terminated by progress=continue or
+    progress=end; each complete block is passed to the callback.
+    """
+    fields: dict[str, str] = {}
+    last_progress: Optional[FFmpegProgress] = None
+    for line in stream:
+        key, sep, value = line.strip().partition("=")
+        if not sep:
+            continue
+        fields[key] = value
+        if key == "progress":
+            last_progress = FFmpegProgress.from_fields(fields)
+            if callback:
+                callback(last_progress)
+            fields = {}
+    return last_progress
+
+
+# ============================================================================
+# FFmpeg Wrapper
+# ============================================================================
+
+class FFmpegWrapper:
+    """Wrapper for FFmpeg operations with progress reporting."""
+
+    def __init__(self, logger: logging.Logger, probe_cache: Optional[ProbeCache] = None):
+        self.logger = logger
+        self.runtime = get_runtime(logger=logger)
+        self.ffmpeg_path = self.runtime.ffmpeg_path
+        self.ffprobe_path = self.runtime.ffprobe_path
+        self.version = self.runtime.version
+        self.probe_cache = probe_cache or ProbeCache()
+
+        # Totals for run reports; run_ffmpeg may be called from worker threads
+        self._stats_lock = threading.Lock()
+        self.bytes_written = 0
+        self.run_speeds: list[float] = []
+
+    def check_availability(self) -> tuple[bool, str]:
+        """Check if FFmpeg is available and return version (from the runtime cache)."""
+        if not self.runtime.available:
+            return False, f"FFmpeg not found at {self.ffmpeg_path}"
+        self.logger.info(f"FFmpeg found: {self.runtime.version}")
+        return True, self.runtime.version
+
+    def get_media_info(self, file_path: Path) -> dict[str, Any]:
+        """Get media file information using ffprobe (cached per file version)."""
+        cached = self.probe_cache.get(file_path)
+        if cached and "info" in cached:
+            return cached["info"]
+
+        info = self._probe(file_path)
+        self.probe_cache.put_info(file_path, info)
+        return info
+
+    def _probe(self, file_path: Path) -> dict[str, Any]:
+        """Run ffprobe on a file."""
+        try:
+            result = subprocess.run(
+                [
+                    self.ffprobe_path,
+                    "-v", "quiet",
+                    "-print_format", "json",
+                    "-show_format",
+                    "-show_streams",
+                    str(file_path)
+                ],
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+            if result.returncode == 0:
+                return json.loads(result.stdout)
+            self.logger.error(f"FFprobe error: {result.stderr}")
+            return {}
+        except Exception as e:
+            self.logger.error(f"Error getting media info: {e}")
+            return {}
+
+    def get_duration(self, file_path: Path) -> float:
+        """Get media file duration in seconds."""
+        cached = self.probe_cache.get(file_path)
+        if cached and "duration" in cached:
+            return cached["duration"]
+
+        info = self.get_media_info(file_path)
+        if info and "format" in info:
+            return float(info["format"].get("duration", 0))
+        return 0.0
+
+    def get_dimensions(self, video_path: Path) -> tuple[int, int]:
+        """Get video dimensions (width, height)."""
+        info = self.get_media_info(video_path)
+        if info and "streams" in info:
+            for stream in info["streams"]:
+                if stream.get("codec_type") == "video":
+                    return stream.get("width", 0), stream.get("height", 0)
+        return 0, 0
+
+    def get_video_stream_params(self, file_path: Path) -> dict[str, Any]:
+        """Get the codec parameters that must match for stream-copy concatenation."""
+        info = self.get_media_info(file_path)
+        for stream in info.get("streams", []):
+            if stream.get("codec_type") == "video":
+                return {
+                    key: stream.get(key)
+                    for key in (
+                        "codec_name", "profile", "level", "width", "height", "pix_fmt",
+                        "r_frame_rate", "time_base", "sample_aspect_ratio",
+                    )
+                }
+        return {}
+
+    def get_frame_times(self, video_path: Path) -> list[float]:
+        """Sorted frame timestamps of the first video stream (not cached; used to check outputs)."""
+        frame_times = probe_frame_times(self.ffprobe_path, video_path)
+        if frame_times is None:
+            self.logger.error(f"Could not read frame timestamps of {video_path}")
+            return []
+        return frame_times
+
+    def get_keyframes(self, video_path: Path) -> list[float]:
+        """Keyframe timestamps of the first video stream, read from its packets (cached)."""
+        cached = self.probe_cache.get(video_path)
+        if cached and "keyframes" in cached:
+            return cached["keyframes"]
+
+        keyframes = probe_keyframes(self.ffprobe_path, video_path)
+        if keyframes is None:
+            self.logger.error(f"Could not read keyframes of {video_path}")
+            return []
+
+        self.probe_cache.record_keyframes(video_path, keyframes)
+        return keyframes
+
+    @staticmethod
+    def _output_files(output_path: Path) -> list[Path]:
+        """An output path, or the files written for a printf-style pattern (piece_%d.ts)."""
+        if "%" not in output_path.name:
+            return [output_path]
+        return sorted(output_path.parent.glob(OUTPUT_PATTERN.sub("*", output_path.name)))
+
+    def _record_run(self, output_paths: list[Path], progress: Optional[FFmpegProgress]):
+        """Add a finished FFmpeg run's output sizes and final speed to the totals."""
+        size = sum(
+            path.stat().st_size
+            for output_path in output_paths
+            for path in self._output_files(output_path)
+            if path.is_file()
+        )
+        with self._stats_lock:
+            self.bytes_written += size
+            self.run_speeds.append(progress.speed if progress else 0.0)
+
+    def run_ffmpeg(
+        self,
+        args: list[str],
+        progress_callback: Optional[Callable[[FFmpegProgress], None]] = None,
+        timeout: int = 3600,
+        outputs: Optional[list[Path]] = None
+    ) -> tuple[bool, str]:
+        """Run FFmpeg with the given arguments.
+
+        Progress is read from FFmpeg's machine-readable -progress stream on
+        stdout and delivered as FFmpegProgress events. Only the last
+        STDERR_TAIL_LINES lines of stderr are kept, for error reporting.
+
+        outputs lists the files the run writes, for the bytes-written total;
+        it defaults to the last argument. Segment muxer patterns such as
+        piece_%d.ts count every file they produced.
+        """
+        cmd = [self.ffmpeg_path, "-nostats", "-progress", "pipe:1"] + args
+        self.logger.debug(f"Running: {' '.join(cmd)}")
+
+        try:
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1
+            )
+
+            # Drain stderr on a separate thread into a bounded ring buffer
+            stderr_tail: deque[str] = deque(maxlen=STDERR_TAIL_LINES)
+
+            def drain_stderr():
+                for line in process.stderr:
+                    stderr_tail.append(line)
+                    if "error" in line.lower() and "errors" not in line.lower():
+                        self.logger.warning(line.strip())
+
+            stderr_thread = threading.Thread(target=drain_stderr, daemon=True)
+            stderr_thread.start()
+
+            last_progress = read_progress(process.stdout, progress_callback)
+
+            process.wait(timeout=timeout)
+            stderr_thread.join(timeout=5)
+
+            if process.returncode == 0:
+                self._record_run(outputs or [Path(args[-1])], last_progress)
+                return True, "Success"
+            else:
+                error_msg = ''.join(list(stderr_tail)[-ERROR_TAIL_LINES:])
+                return False, error_msg
+
+        except subprocess.TimeoutExpired:
+            process.kill()
+            return False, "FFmpeg timed out"
+        except Exception as e:
+            return False, f"FFmpeg error: {e}"
+
+
+# ============================================================================
+# Run Report
+# ============================================================================
+
+class RunReport:
+    """Per-stage wall time and resource usage for one compositor run.
+
+    Child CPU time and peak RSS come from getrusage(RUSAGE_CHILDREN), which
+    only covers FFmpeg processes that have exited; the kernel keeps a running
+    maximum, so peak_rss_kb is the largest child seen up to the end of each
+    stage. Both are null on platforms without the resource module.
+    """
+
+    def __init__(self, tool: str, ffmpeg: FFmpegWrapper):
+        self.tool = tool
+        self.ffmpeg = ffmpeg
+        self.stages: list[dict[str, Any]] = []
+        self.started_at = datetime.now().isoformat()
+        self._start_wall = time.perf_counter()
+        self._start_cpu, _ = self._child_usage()
+
+    @staticmethod
+    def _child_usage() -> tuple[Optional[float], Optional[int]]:
+        """Return (CPU seconds, peak RSS in KB) of reaped child processes."""
+        if resource is None:
+            return None, None
+        usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+        peak_rss = usage.ru_maxrss
+        if sys.platform == "darwin":
+            peak_rss //= 1024  # macOS reports bytes, Linux kilobytes
+        return usage.ru_utime + usage.ru_stime, peak_rss
+
+    @contextmanager
+    def stage(self, name: str):
+        """Measure the enclosed block as one named stage."""
+        cpu_before, _ = self._child_usage()
+        bytes_before = self.ffmpeg.bytes_written
+        runs_before = len(self.ffmpeg.run_speeds)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - start
+            cpu_after, peak_rss = self._child_usage()
+            speeds = [s for s in self.ffmpeg.run_speeds[runs_before:] if s > 0]
+            self.stages.append({
+                "name": name,
+                "wall_seconds": round(wall, 3),
+                "child_cpu_seconds": round(cpu_after - cpu_before, 3) if cpu_after is not None else None,
+                "peak_rss_kb": peak_rss,
+                "bytes_written": self.ffmpeg.bytes_written - bytes_before,
+                "ffmpeg_runs": len(self.ffmpeg.run_speeds) - runs_before,
+                "encoder_speed": round(sum(speeds) / len(speeds), 3) if speeds else None,
+            })
+
+    def to_dict(self, output_path: Path, success: bool) -> dict[str, Any]:
+        """Build the JSON-serialisable report."""
+        cpu, peak_rss = self._child_usage()
+        return {
+            "tool": self.tool,
+            "output": str(output_path),
+            "success": success,
+            "started_at": self.started_at,
+            "ffmpeg_version": getattr(self.ffmpeg, "version", ""),
+            "wall_seconds": round(time.perf_counter() - self._start_wall, 3),
+            "child_cpu_seconds": round(cpu - self._start_cpu, 3) if cpu is not None else None,
+            "peak_rss_kb": peak_rss,
+            "bytes_written": self.ffmpeg.bytes_written,
+            "stages": self.stages,
+        }
+
+    def write(self, report_path: Path, output_path: Path, success: bool):
+        """Write the report as JSON."""
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(output_path, success), f, indent=2)
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Mezzanine Media
+===============
+Conforms incoming media once to the house mezzanine format and records the
+result in a manifest keyed by source content hash. Avatar clips, Veo b-roll,
+downloaded audio and screen recordings all arrive with different codecs,
+frame rates and sample rates; after this stage every composite reads files
+with known parameters and can stream-copy or cheaply decode them.
+
+House format:
+- video: the FFmpeg runtime's preferred encoder (H.264 via libx264 on
+         standard builds, see ffmpeg_runtime.py), yuv420p, constant 30 fps,
+         a closed GOP every second, source resolution (rounded down to even)
+- audio: AAC-LC, 48 kHz stereo, 192 kbps
+- container: MP4 (M4A for audio-only sources) with +faststart
+
+Streams that already conform are copied rather than re-encoded, so a file
+that is only missing, say, the right audio rate costs an audio encode.
+
+This module has an importable name so the hyphenated scripts next to it can
+share it:
+    from mezzanine import MezzanineStore
+"""
+
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from asset_catalog import VIDEO_FORMATS
+from ffmpeg_runtime import FFmpegRuntime, get_runtime
+from ffmpeg_tools import parse_frame_rate, probe_keyframes
+
+# ============================================================================
+# Constants and Configuration
+# ============================================================================
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+DEFAULT_MEZZANINE_DIR = SCRIPT_DIR / "output" / "mezzanine"
+DEFAULT_MANIFEST_PATH = DEFAULT_MEZZANINE_DIR / "manifest.json"
+MANIFEST_VERSION = 1
+
+AUDIO_FORMATS = {".mp3", ".wav", ".m4a", ".aac", ".flac", ".ogg"}
+
+# House format; changing any value (or the runtime's encoder, see
+# mezzanine_spec) invalidates existing mezzanine files
+MEZZANINE_FPS = 30
+MEZZANINE_GOP_SECONDS = 1
+MEZZANINE_PIX_FMT = "yuv420p"
+MEZZANINE_AUDIO_RATE = 48000
+MEZZANINE_AUDIO_CHANNELS = 2
+
+# Appended to the runtime's encoder arguments
+VIDEO_GOP_ARGS = [
+    "-pix_fmt", MEZZANINE_PIX_FMT,
+    "-g", str(MEZZANINE_FPS * MEZZANINE_GOP_SECONDS),
+    "-keyint_min", str(MEZZANINE_FPS * MEZZANINE_GOP_SECONDS),
+    "-sc_threshold", "0",
+]
+VIDEO_FILTER = f"fps={MEZZANINE_FPS},scale=trunc(iw/2)*2:trunc(ih/2)*2,setsar=1"
+AUDIO_ENCODER_ARGS = [
+    "-c:a", "aac", "-b:a", "192k",
+    "-ar", str(MEZZANINE_AUDIO_RATE), "-ac", str(MEZZANINE_AUDIO_CHANNELS),
+]
+
+
+def mezzanine_spec(runtime: FFmpegRuntime) -> dict[str, str]:
+    """House format as recorded in the manifest, for the runtime's video encoder."""
+    return {
+        "video": f"{runtime.video_codec}/{MEZZANINE_PIX_FMT}/{MEZZANINE_FPS}fps/gop{MEZZANINE_GOP_SECONDS}s",
+        "video_encoder": " ".join(runtime.video_encoder_args()),
+        "audio": f"aac/{MEZZANINE_AUDIO_RATE}/{MEZZANINE_AUDIO_CHANNELS}ch/192k",
+    }
+
+
+def media_kind(path: Path) -> Optional[str]:
+    """Return "video" or "audio" for a supported media file, else None."""
+    suffix = path.suffix.lower()
+    if suffix in VIDEO_FORMATS:
+        return "video"
+    if suffix in AUDIO_FORMATS:
+        return "audio"
+    return None
+
+
+# ============================================================================
+# Mezzanine Store
+# ============================================================================
+
+class MezzanineStore:
+    """Manifest of mezzanine copies, keyed by the SHA-256 of each source."""
+
+    def __init__(
+        self,
+        manifest_path: Path = DEFAULT_MANIFEST_PATH,
+        runtime: Optional[FFmpegRuntime] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        self.manifest_path = manifest_path
+        self.output_dir = manifest_path.parent
+        self.logger = logger or logging.getLogger(__name__)
+        self.runtime = runtime or get_runtime(logger=self.logger)
+        self.ffmpeg_path = self.runtime.ffmpeg_path
+        self.ffprobe_path = self.runtime.ffprobe_path
+        self.spec = mezzanine_spec(self.runtime)
+
+        self.entries: dict[str, dict[str, Any]] = {}
+        self._sources: dict[str, list] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._pending: dict[str, threading.Lock] = {}
+
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load(self):
+        if not self.manifest_path.exists():
+            return
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.warning(f"Ignoring unreadable mezzanine manifest {self.manifest_path}: {e}")
+            return
+        if data.get("version") != MANIFEST_VERSION:
+            return
+        self._sources = data.get("sources", {})
+        if data.get("spec") == self.spec:
+            self.entries = data.get("entries", {})
+        else:
+            self.logger.info("Mezzanine format changed, existing files will be regenerated")
+            self._dirty = True
+
+    def save(self):
+        """Write the manifest back to disk if anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                "version": MANIFEST_VERSION,
+                "spec": self.spec,
+                "entries": self.entries,
+                "sources": self._sources,
+            }
+            try:
+                self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.manifest_path.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=2)
+                os.replace(tmp_path, self.manifest_path)
+                self._dirty = False
+            except OSError as e:
+                self.logger.warning(f"Failed to save mezzanine manifest: {e}")
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def source_hash(self, path: Path) -> Optional[str]:
+        """SHA-256 of a source file, cached by size and mtime."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+
+        key = str(path.resolve())
+        with self._lock:
+            cached = self._sources.get(key)
+            if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+                return cached[2]
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+
+        with self._lock:
+            self._sources[key] = [stat.st_size, stat.st_mtime_ns, digest.hexdigest()]
+            self._dirty = True
+        return digest.hexdigest()
+
+    def lookup(self, path: Path) -> Optional[Path]:
+        """Return the existing mezzanine copy of a source, if there is one."""
+        digest = self.source_hash(path)
+        if digest is None:
+            return None
+        with self._lock:
+            entry = self.entries.get(digest)
+        if not entry:
+            return None
+        output_path = self.output_dir / entry["output"]
+        return output_path if output_path.exists() else None
+
+    def is_mezzanine(self, path: Path) -> bool:
+        """True if a path is a file produced by this store."""
+        return Path(path).resolve().parent == self.output_dir.resolve()
+
+    # ------------------------------------------------------------------
+    # Normalisation
+    # ------------------------------------------------------------------
+
+    def normalize(self, path: Path) -> Path:
+        """Return the mezzanine copy of a source, creating it on first use.
+
+        Unsupported files, and sources that fail to normalise, are returned
+        unchanged so callers can always use the result.
+        """
+        kind = media_kind(path)
+        if kind is None or self.is_mezzanine(path):
+            return path
+
+        digest = self.source_hash(path)
+        if digest is None:
+            return path
+
+        with self._lock:
+            pending = self._pending.setdefault(digest, threading.Lock())
+
+        # One conversion per source, even when several workers ask for it
+        with pending:
+            existing = self.lookup(path)
+            if existing:
+                return existing
+
+            suffix = ".mp4" if kind == "video" else ".m4a"
+            output_path = self.output_dir / f"{digest[:16]}{suffix}"
+            info = self._probe(path)
+            if not info:
+                return path
+
+            args, copied = self._build_args(path, info, kind)
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = output_path.with_name(f"{output_path.stem}.{os.getpid()}.tmp{suffix}")
+            self.logger.info(
+                f"Normalising {path.name} -> {output_path.name}"
+                f"{' (copying ' + ', '.join(copied) + ')' if copied else ''}"
+            )
+
+            try:
+                result = subprocess.run(
+                    [self.ffmpeg_path, "-y", "-v", "error", *args, str(tmp_path)],
+                    capture_output=True,
+                    text=True,
+                    timeout=3600
+                )
+            except (OSError, subprocess.TimeoutExpired) as e:
+                self.logger.warning(f"Could not normalise {path.name}: {e}")
+                return path
+            if result.returncode != 0:
+                self.logger.warning(f"Could not normalise {path.name}: {result.stderr.strip()[-500:]}")
+                tmp_path.unlink(missing_ok=True)
+                return path
+            os.replace(tmp_path, output_path)
+
+            with self._lock:
+                self.entries[digest] = {
+                    "source": str(path.resolve()),
+                    "output": output_path.name,
+                    "kind": kind,
+                    "duration": float(info.get("format", {}).get("duration") or 0),
+                    "copied": copied,
+                    "created": datetime.now().isoformat(),
+                }
+                self._dirty = True
+
+        self.save()
+        return output_path
+
+    def _probe(self, path: Path) -> dict[str, Any]:
+        try:
+            result = subprocess.run(
+                [self.ffprobe_path, "-v", "quiet", "-print_format", "json",
+                 "-show_format", "-show_streams", str(path)],
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+            if result.returncode == 0:
+                return json.loads(result.stdout)
+            self.logger.warning(f"FFprobe error on {path.name}: {result.stderr}")
+        except (OSError, subprocess.TimeoutExpired, json.JSONDecodeError) as e:
+            self.logger.warning(f"Could not probe {path.name}: {e}")
+        return {}
+
+    def _max_keyframe_gap(self, path: Path) -> float:
+        """Largest distance between video keyframes, read from packet flags."""
+        keyframes = probe_keyframes(self.ffprobe_path, path)
+        if not keyframes:
+            return float("inf")
+        return max((b - a for a, b in zip(keyframes, keyframes[1:])), default=0.0)
+
+    def _video_conforms(self, path: Path, stream: dict[str, Any]) -> bool:
+        if (
+            stream.get("codec_name") != self.runtime.video_codec
+            or stream.get("pix_fmt") != MEZZANINE_PIX_FMT
+            or stream.get("width", 1) % 2
+            or stream.get("height", 1) % 2
+            or parse_frame_rate(stream.get("r_frame_rate")) != MEZZANINE_FPS
+            or parse_frame_rate(stream.get("avg_frame_rate")) != MEZZANINE_FPS
+        ):
+            return False
+        return self._max_keyframe_gap(path) <= MEZZANINE_GOP_SECONDS + 0.5 / MEZZANINE_FPS
+
+    @staticmethod
+    def _audio_conforms(stream: dict[str, Any]) -> bool:
+        return (
+            stream.get("codec_name") == "aac"
+            and str(stream.get("sample_rate")) == str(MEZZANINE_AUDIO_RATE)
+            and stream.get("channels") == MEZZANINE_AUDIO_CHANNELS
+        )
+
+    def _build_args(
+        self,
+        path: Path,
+        info: dict[str, Any],
+        kind: str
+    ) -> tuple[list[str], list[str]]:
+        """FFmpeg arguments (minus the output path) and the streams copied as is."""
+        streams = info.get("streams", [])
+        video = next((s for s in streams if s.get("codec_type") == "video"), None)
+        audio = next((s for s in streams if s.get("codec_type") == "audio"), None)
+
+        args = ["-i", str(path)]
+        copied = []
+
+        if kind == "video" and video:
+            args += ["-map", "0:v:0"]
+            if self._video_conforms(path, video):
+                args += ["-c:v", "copy"]
+                copied.append("video")
+            else:
+                args += ["-vf", VIDEO_FILTER, *self.runtime.video_encoder_args(), *VIDEO_GOP_ARGS]
+        else:
+            args += ["-vn"]
+
+        if audio:
+            args += ["-map", "0:a:0"]
+            if self._audio_conforms(audio):
+                args += ["-c:a", "copy"]
+                copied.append("audio")
+            else:
+                args += AUDIO_ENCODER_ARGS
+        else:
+            args += ["-an"]
+
+        args += ["-map_metadata", "-1", "-movflags", "+faststart", "-f", "mp4"]
+        return args, copied
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Media Normaliser
+================
+Conforms incoming media to the house mezzanine format once, ahead of
+compositing (see mezzanine.py for the format). Results are recorded in a
+manifest keyed by source content hash, so re-running over the same folders
+only touches new or changed files, and the compositors pick the mezzanine
+copies up automatically.
+
+Default inputs:
+- output/devon-videos  (avatar clips from batch-devon-production.py)
+- output/broll         (b-roll from veo-video-generator.py)
+- output/devon-audio   (downloaded voiceover audio)
+
+Usage:
+    python normalize-media.py                              # Default folders
+    python normalize-media.py recordings/ intro.mov        # Specific files or folders
+    python normalize-media.py --jobs 4 --manifest out/mezzanine/manifest.json
+    python normalize-media.py --list                       # Show the manifest
+
+Requirements:
+    - FFmpeg in PATH or a standard install location (see ffmpeg_runtime.py)
+    - Python 3.8+
+"""
+
+import argparse
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from ffmpeg_runtime import get_runtime
+from mezzanine import DEFAULT_MANIFEST_PATH, MezzanineStore, media_kind
+
+# ============================================================================
+# Constants and Configuration
+# ============================================================================
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+DEFAULT_INPUTS = [
+    SCRIPT_DIR / "output" / "devon-videos",
+    SCRIPT_DIR / "output" / "broll",
+    SCRIPT_DIR / "output" / "devon-audio",
+]
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s | %(levelname)-8s | %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+
+def collect_media(inputs: list[Path], output_dir: Path) -> list[Path]:
+    """Expand files and folders into the media files to normalise."""
+    files = []
+    for item in inputs:
+        if item.is_dir():
+            candidates = sorted(p for p in item.rglob("*") if p.is_file())
+        elif item.is_file():
+            candidates = [item]
+        else:
+            logger.warning(f"Skipping missing input: {item}")
+            continue
+        for path in candidates:
+            # Never re-normalise the store's own output
+            if media_kind(path) and path.resolve().parent != output_dir.resolve():
+                files.append(path)
+    return files
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Normalise media to the house mezzanine format")
+    parser.add_argument("inputs", type=Path, nargs="*",
+                        help="Files or folders to normalise (default: devon-videos, broll, devon-audio)")
+    parser.add_argument("--manifest", type=Path, default=DEFAULT_MANIFEST_PATH,
+                        help="Mezzanine manifest; files are written next to it (default: output/mezzanine/manifest.json)")
+    parser.add_argument("--jobs", type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help="Files to normalise in parallel (default: half the CPU count)")
+    parser.add_argument("--list", action="store_true", help="List manifest entries and exit")
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+    runtime = get_runtime(logger=logger)
+    store = MezzanineStore(args.manifest, runtime, logger)
+
+    if args.list:
+        for digest, entry in sorted(store.entries.items(), key=lambda item: item[1]["source"]):
+            copied = f" (copied {', '.join(entry['copied'])})" if entry.get("copied") else ""
+            print(f"{digest[:12]}  {entry['kind']:<5}  {entry['duration']:>8.1f}s  {entry['source']}{copied}")
+        return
+
+    files = collect_media(args.inputs or DEFAULT_INPUTS, store.output_dir)
+    if not files:
+        print("No media files found")
+        return
+
+    print(f"Checking {len(files)} media files...")
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        results = list(pool.map(store.normalize, files))
+    store.save()
+
+    failed = [source for source, result in zip(files, results) if result == source]
+    print(f"{len(files) - len(failed)} of {len(files)} files in mezzanine format ({store.output_dir})")
+    for source in failed:
+        print(f"  not normalised: {source}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
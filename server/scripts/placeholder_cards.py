@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Placeholder Cards
+=================
+Branded placeholder cards for slides and visual assets that are missing,
+shared by audio-slides-compositor.py and video-compositor.py.
+
+Cards are drawn in-process with Pillow in the house colours (copied from
+enhanced-slide-generator.py), memoised per process and cached as PNGs in
+output/placeholders/ across runs. Without Pillow, PILLOW_AVAILABLE is False
+and the compositors draw a plain card with FFmpeg drawtext instead, cached
+under the same naming scheme via placeholder_path().
+
+This module has an importable name so the hyphenated scripts next to it can
+share it:
+    from placeholder_cards import render_placeholder
+"""
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:
+    Image = None
+
+# ============================================================================
+# Constants and Configuration
+# ============================================================================
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+PILLOW_AVAILABLE = Image is not None
+
+# Brand colours (match enhanced-slide-generator.py)
+PLACEHOLDER_BACKGROUND = (30, 27, 75)  # #1E1B4B dark purple
+PLACEHOLDER_ACCENT = (139, 92, 246)  # #8B5CF6 accent purple
+PLACEHOLDER_TEXT_COLOR = (245, 245, 250)  # off-white
+PLACEHOLDER_FONT_SIZE = 48
+PLACEHOLDER_MAX_LINES = 3
+PLACEHOLDER_DIR = SCRIPT_DIR / "output" / "placeholders"
+PLACEHOLDER_FONT_PATHS = [
+    "C:/Windows/Fonts/segoeui.ttf",
+    "C:/Windows/Fonts/arial.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/System/Library/Fonts/Helvetica.ttc",
+    "/Library/Fonts/Arial.ttf",
+]
+
+_placeholder_lock = threading.Lock()
+_placeholder_cards: dict[tuple[str, int, int], Path] = {}
+
+
+def _placeholder_font(size: int):
+    """Load the first available brand font, falling back to PIL's default."""
+    for path in PLACEHOLDER_FONT_PATHS:
+        if os.path.exists(path):
+            try:
+                return ImageFont.truetype(path, size)
+            except OSError:
+                continue
+    return ImageFont.load_default()
+
+
+def placeholder_path(
+    text: str,
+    width: int,
+    height: int,
+    cache_dir: Path = PLACEHOLDER_DIR,
+    kind: str = "placeholder"
+) -> Path:
+    """Cache path for a placeholder card with this text and size."""
+    digest = hashlib.sha256(f"{text}|{width}x{height}".encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"{kind}_{width}x{height}_{digest}.png"
+
+
+def render_placeholder(text: str, width: int, height: int, cache_dir: Path = PLACEHOLDER_DIR) -> Path:
+    """Render a branded placeholder card in-process and return its path.
+
+    Cards are memoized by (text, size): identical cards are drawn once per
+    process and the PNG is reused from cache_dir across runs.
+    """
+    key = (text, width, height)
+    with _placeholder_lock:
+        card = _placeholder_cards.get(key)
+        if card is not None and card.exists():
+            return card
+
+        card = placeholder_path(text, width, height, cache_dir)
+        if not card.exists():
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            image = Image.new("RGB", (width, height), PLACEHOLDER_BACKGROUND)
+            draw = ImageDraw.Draw(image)
+            font = _placeholder_font(PLACEHOLDER_FONT_SIZE)
+
+            # Greedy word wrap to 80% of the card width
+            lines: list[str] = []
+            for word in text.split():
+                candidate = f"{lines[-1]} {word}" if lines else word
+                if lines and draw.textlength(candidate, font=font) <= width * 0.8:
+                    lines[-1] = candidate
+                else:
+                    lines.append(word)
+            lines = lines[:PLACEHOLDER_MAX_LINES]
+
+            line_height = int(PLACEHOLDER_FONT_SIZE * 1.3)
+            y = (height - line_height * len(lines)) // 2
+            for line in lines:
+                x = (width - draw.textlength(line, font=font)) // 2
+                draw.text((x, y), line, fill=PLACEHOLDER_TEXT_COLOR, font=font)
+                y += line_height
+
+            # Accent bar along the top and under the text, as on generated slides
+            draw.rectangle([(0, 0), (width, 6)], fill=PLACEHOLDER_ACCENT)
+            draw.rectangle([(width // 2 - 60, y + 16), (width // 2 + 60, y + 20)], fill=PLACEHOLDER_ACCENT)
+
+            tmp_path = card.with_suffix(f".{os.getpid()}.tmp")
+            image.save(tmp_path, format="PNG")
+            os.replace(tmp_path, card)
+
+        _placeholder_cards[key] = card
+        return card
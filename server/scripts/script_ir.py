@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""
+Script IR
+=========
+Shared, cached intermediate representation of a lesson script, consumed by
+video-script-parser.py, video-asset-generator.py and batch-devon-production.py
+so every tool reads the same cues and spoken text from one parse.
+
+A ScriptIR holds:
+- title and header/footer metadata
+- "## " sections with their offsets
+- [SCREEN: ...] cues with their offsets, enclosing section, and the cleaned
+  spoken text, word count and [PAUSE] count of the segment that follows
+- the avatar-ready spoken text of the whole script (what Devon reads)
+
+IRs are built once per script content and stored in output/script-ir/ next
+to the SHA-256 of the markdown they came from. load_script_ir() only
+rebuilds when that hash (or SCRIPT_IR_VERSION) changes, so tools pay one
+read and one hash per script instead of a full parse.
+
+This module has an importable name so the hyphenated scripts next to it can
+share it:
+    from script_ir import load_script_ir
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from bisect import bisect_left
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional
+
+# ============================================================================
+# Constants and Configuration
+# ============================================================================
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+DEFAULT_IR_DIR = SCRIPT_DIR / "output" / "script-ir"
+
+# Bump whenever build_script_ir output changes
+SCRIPT_IR_VERSION = 1
+
+# Tokenizer patterns, compiled once
+SCREEN_PATTERN = re.compile(r'\[SCREEN:\s*(.+?)\]', re.IGNORECASE | re.DOTALL)
+SECTION_PATTERN = re.compile(r'^##\s+(.+)$', re.MULTILINE)
+SCRIPT_END_PATTERN = re.compile(
+    r'---\n\n\*\*END OF SCRIPT|\*\*END OF SCRIPT|\n---\n\n\*Approximate|\n\*Approximate word count'
+)
+# Section headers and horizontal rules are dropped; [PAUSE] markers are counted
+SEGMENT_TOKEN_PATTERN = re.compile(
+    r'(?P<line>^(?:##\s+.+|---+)$)|(?P<pause>(?i:\[PAUSE\]))',
+    re.MULTILINE
+)
+NEWLINE_RUN_PATTERN = re.compile(r'\n{3,}')
+PAUSE_PATTERN = re.compile(r'\[PAUSE\]', re.IGNORECASE)
+BOLD_PATTERN = re.compile(r'\*\*([^*]+)\*\*')
+ITALIC_PATTERN = re.compile(r'\*([^*]+)\*')
+CODE_PATTERN = re.compile(r'`([^`]+)`')
+BRACKETS_PATTERN = re.compile(r'\[[^\]]+\]')
+MARKUP_CHARS = frozenset('*`[')
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Data Classes
+# ============================================================================
+
+@dataclass
+class CueIR:
+    """A [SCREEN: ...] cue and the spoken segment that follows it."""
+    index: int          # 1-based, in script order
+    text: str           # Cue text, stripped (inner whitespace as written)
+    start: int          # Offset of "[SCREEN:" in the script
+    end: int            # Offset just past the closing "]"
+    section: str        # Enclosing "## " section, "" before the first
+    spoken_text: str
+    word_count: int
+    pause_count: int
+
+
+@dataclass
+class ScriptIR:
+    """Parsed form of one lesson script shared by the pipeline stages."""
+    script_id: str      # File stem
+    filename: str
+    content_hash: str
+    title: str
+    metadata: dict = field(default_factory=dict)
+    sections: list = field(default_factory=list)    # [{"name", "position"}]
+    cues: list = field(default_factory=list)        # [CueIR]
+    avatar_text: str = ""
+    content: str = field(default="", repr=False, compare=False)  # Not persisted
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        del data["content"]
+        data["version"] = SCRIPT_IR_VERSION
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict, content: str = "") -> "ScriptIR":
+        return cls(
+            script_id=data["script_id"],
+            filename=data["filename"],
+            content_hash=data["content_hash"],
+            title=data["title"],
+            metadata=data.get("metadata", {}),
+            sections=data.get("sections", []),
+            cues=[CueIR(**cue) for cue in data.get("cues", [])],
+            avatar_text=data.get("avatar_text", ""),
+            content=content,
+        )
+
+
+# ============================================================================
+# Text Extraction
+# ============================================================================
+
+def count_words(text: str) -> int:
+    """
+    Count words in text, excluding markdown and stage directions.
+
+    Args:
+        text: The text to count words in
+
+    Returns:
+        Word count
+    """
+    # Remove markdown formatting
+    clean_text = BOLD_PATTERN.sub(r'\1', text)
+    clean_text = ITALIC_PATTERN.sub(r'\1', clean_text)
+    clean_text = CODE_PATTERN.sub(r'\1', clean_text)
+
+    # Remove [PAUSE] markers
+    clean_text = PAUSE_PATTERN.sub('', clean_text)
+
+    # Remove any remaining brackets content that might be stage directions
+    clean_text = BRACKETS_PATTERN.sub('', clean_text)
+
+    # Count words
+    words = clean_text.split()
+    return len(words)
+
+
+def scan_segment(text: str) -> tuple[str, int, int]:
+    """
+    Clean one segment's spoken text in a single tokenizer pass.
+
+    Section headers and horizontal rules are dropped, [PAUSE] markers are
+    kept in the text but counted and excluded from the word count, and runs
+    of blank lines are collapsed.
+
+    Args:
+        text: Raw text between two visual cues
+
+    Returns:
+        (spoken_text, word_count, pause_count)
+    """
+    text = text.strip()
+    kept = []        # spoken text pieces, [PAUSE] markers included
+    counted = []     # the same pieces without [PAUSE] markers, for word counting
+    pause_count = 0
+    position = 0
+
+    for token in SEGMENT_TOKEN_PATTERN.finditer(text):
+        start, end = token.span()
+        if token.lastgroup == "pause":
+            pause_count += 1
+            kept.append(text[position:end])
+        else:
+            kept.append(text[position:start])
+        counted.append(text[position:start])
+        position = end
+
+    if position:
+        kept.append(text[position:])
+        counted.append(text[position:])
+        spoken_text = "".join(kept)
+        count_text = "".join(counted)
+    else:
+        spoken_text = count_text = text
+
+    if "\n\n\n" in spoken_text:
+        spoken_text = NEWLINE_RUN_PATTERN.sub("\n\n", spoken_text)
+    spoken_text = spoken_text.strip()
+
+    # Plain prose needs no markdown stripping before counting
+    if MARKUP_CHARS.isdisjoint(count_text):
+        word_count = len(count_text.split())
+    else:
+        word_count = count_words(count_text)
+
+    return spoken_text, word_count, pause_count
+
+
+def extract_title_from_content(content: str, filename: str) -> str:
+    """
+    Extract the title from the script content.
+
+    Args:
+        content: The markdown content
+        filename: The script filename as fallback
+
+    Returns:
+        The extracted title
+    """
+    # Try to find H1 heading
+    h1_match = re.search(r'^#\s+(?:Script\s+[\d.]+:\s*)?(.+)$', content, re.MULTILINE)
+    if h1_match:
+        title = h1_match.group(1).strip()
+        # Clean up any remaining script numbering
+        title = re.sub(r'^[\d.]+\s*[-:]\s*', '', title)
+        return title
+
+    # Fallback to filename
+    base_name = Path(filename).stem
+    # Convert filename to title case
+    title = base_name.replace('-', ' ').replace('_', ' ')
+    return title.title()
+
+
+def extract_metadata(content: str) -> dict:
+    """
+    Extract metadata from the script header.
+
+    Args:
+        content: The markdown content
+
+    Returns:
+        Dictionary of metadata
+    """
+    metadata = {}
+
+    # Duration
+    duration_match = re.search(r'\*\*Duration:\*\*\s*(.+?)(?:\n|$)', content)
+    if duration_match:
+        metadata['stated_duration'] = duration_match.group(1).strip()
+
+    # Lesson info
+    lesson_match = re.search(r'\*\*Lesson:\*\*\s*(.+?)(?:\n|$)', content)
+    if lesson_match:
+        metadata['lesson'] = lesson_match.group(1).strip()
+
+    # Purpose
+    purpose_match = re.search(r'\*\*Purpose:\*\*\s*(.+?)(?:\n|$)', content)
+    if purpose_match:
+        metadata['purpose'] = purpose_match.group(1).strip()
+
+    # Word count from footer
+    word_count_match = re.search(r'\*Approximate word count:\s*([\d,]+)', content)
+    if word_count_match:
+        metadata['stated_word_count'] = word_count_match.group(1).strip()
+
+    # Runtime estimate from footer
+    runtime_match = re.search(r'\*Estimated runtime:\s*(.+?)\*', content)
+    if runtime_match:
+        metadata['stated_runtime'] = runtime_match.group(1).strip()
+
+    return metadata
+
+
+def extract_sections(content: str) -> list:
+    """Extract "## " section headers and their offsets."""
+    sections = []
+    for match in SECTION_PATTERN.finditer(content):
+        section_name = match.group(1).strip()
+        if section_name not in ["---"]:
+            sections.append({
+                "name": section_name,
+                "position": match.start()
+            })
+    return sections
+
+
+def extract_spoken_text(content: str) -> str:
+    """
+    Extract only the spoken dialogue from a video script.
+    Removes screen directions, pause markers, headers, etc.
+    """
+    lines = content.split('\n')
+    spoken_lines = []
+
+    for line in lines:
+        line = line.strip()
+
+        # Skip empty lines
+        if not line:
+            continue
+
+        # Skip markdown headers
+        if line.startswith('#'):
+            continue
+
+        # Skip metadata lines
+        if line.startswith('**') and ':' in line:
+            continue
+        if line.startswith('*') and ('word' in line.lower() or 'runtime' in line.lower()):
+            continue
+
+        # Skip horizontal rules
+        if line == '---':
+            continue
+
+        # Skip screen directions [SCREEN: ...]
+        if line.startswith('[SCREEN:') or line.startswith('[Screen:'):
+            continue
+
+        # Remove inline [SCREEN: ...] and [PAUSE] markers
+        line = re.sub(r'\[SCREEN:[^\]]+\]', '', line)
+        line = re.sub(r'\[PAUSE\]', '', line)
+        line = re.sub(r'\[pause\]', '', line)
+
+        # Skip production notes sections
+        if 'PRODUCTION NOTES' in line.upper():
+            break
+        if 'KEY TERMS FOR PRONUNCIATION' in line.upper():
+            break
+        if 'POST-VIDEO RESOURCES' in line.upper():
+            break
+
+        # Clean up the line
+        line = line.strip()
+
+        # Skip bullet points that are just labels
+        if line.startswith('- ') and ':' in line and len(line) < 50:
+            continue
+
+        if line:
+            spoken_lines.append(line)
+
+    # Join and clean up
+    text = ' '.join(spoken_lines)
+
+    # Remove extra whitespace
+    text = re.sub(r'\s+', ' ', text)
+
+    # Remove markdown formatting
+    text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)  # Bold
+    text = re.sub(r'\*([^*]+)\*', r'\1', text)      # Italic
+
+    return text.strip()
+
+
+# ============================================================================
+# Building and Caching
+# ============================================================================
+
+def content_hash(content: str) -> str:
+    """SHA-256 of a script's text, the IR cache key."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def iter_cues(content: str, sections: list):
+    """
+    Walk a script's [SCREEN: ...] cues in order, yielding each cue together
+    with its section and the cleaned spoken segment that follows it.
+
+    Args:
+        content: The markdown content
+        sections: extract_sections(content)
+
+    Yields:
+        CueIR for each cue
+    """
+    section_positions = [section["position"] for section in sections]
+    cue_matches = list(SCREEN_PATTERN.finditer(content))
+    for i, match in enumerate(cue_matches):
+        cue_end = match.end()
+        if i + 1 < len(cue_matches):
+            # Text until next cue
+            spoken_text = content[cue_end:cue_matches[i + 1].start()]
+        else:
+            # Text until end of content (before the earliest footer marker)
+            end_match = SCRIPT_END_PATTERN.search(content, cue_end)
+            spoken_text = content[cue_end:end_match.start() if end_match else len(content)]
+
+        spoken_text, word_count, pause_count = scan_segment(spoken_text)
+
+        # Last section starting before the cue
+        section_index = bisect_left(section_positions, match.start()) - 1
+        yield CueIR(
+            index=i + 1,
+            text=match.group(1).strip(),
+            start=match.start(),
+            end=cue_end,
+            section=sections[section_index]["name"] if section_index >= 0 else "",
+            spoken_text=spoken_text,
+            word_count=word_count,
+            pause_count=pause_count,
+        )
+
+
+def build_script_ir(content: str, filename: str) -> ScriptIR:
+    """
+    Parse script markdown into a ScriptIR (uncached).
+
+    Args:
+        content: The markdown content
+        filename: The script filename
+
+    Returns:
+        ScriptIR with content attached
+    """
+    sections = extract_sections(content)
+    cues = list(iter_cues(content, sections))
+
+    return ScriptIR(
+        script_id=Path(filename).stem,
+        filename=Path(filename).name,
+        content_hash=content_hash(content),
+        title=extract_title_from_content(content, filename),
+        metadata=extract_metadata(content),
+        sections=sections,
+        cues=cues,
+        avatar_text=extract_spoken_text(content),
+        content=content,
+    )
+
+
+def _ir_path(cache_dir: Path, path: Path) -> Path:
+    return cache_dir / f"{path.stem}.json"
+
+
+def load_script_ir(
+    path: Path,
+    cache_dir: Optional[Path] = DEFAULT_IR_DIR,
+    content: Optional[str] = None
+) -> ScriptIR:
+    """
+    Return the IR for a script file, rebuilding it only if the file changed.
+
+    Args:
+        path: Script markdown file
+        cache_dir: IR store directory, or None to skip caching
+        content: The file's text, if the caller has already read it
+
+    Returns:
+        ScriptIR with content attached
+    """
+    path = Path(path)
+    if content is None:
+        content = path.read_text(encoding="utf-8")
+    if cache_dir is None:
+        return build_script_ir(content, path.name)
+
+    ir_path = _ir_path(cache_dir, path)
+    digest = content_hash(content)
+    try:
+        with open(ir_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if (data.get("version") == SCRIPT_IR_VERSION
+                and data.get("content_hash") == digest
+                and data.get("filename") == path.name):
+            return ScriptIR.from_dict(data, content)
+    except (OSError, json.JSONDecodeError, KeyError, TypeError):
+        pass
+
+    ir = build_script_ir(content, path.name)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = ir_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(ir.to_dict(), f, ensure_ascii=False)
+        os.replace(tmp_path, ir_path)
+    except OSError as e:
+        logger.warning(f"Failed to save script IR for {path.name}: {e}")
+    return ir
+
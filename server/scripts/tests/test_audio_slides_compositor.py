@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for audio-slides-compositor.py timeline planning.
+
+These cover the frame arithmetic only, so they run without FFmpeg:
+    python -m pytest server/scripts/tests
+"""
+
+import importlib.util
+import logging
+import sys
+import unittest
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPT_DIR))
+
+
+def load_compositor():
+    """Import audio-slides-compositor.py (hyphenated, so not importable by name)."""
+    spec = importlib.util.spec_from_file_location("audio_slides_compositor", SCRIPT_DIR / "audio-slides-compositor.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+compositor_module = load_compositor()
+OUTPUT_FPS = compositor_module.OUTPUT_FPS
+
+
+def rendered_length(durations: list[float], transition_dur: float) -> float:
+    """Length _render_xfade_chain produces, including its clamp on negative offsets."""
+    length = durations[0]
+    for i in range(1, len(durations)):
+        offset = max(0, sum(durations[:i]) - transition_dur * i)
+        length = offset + durations[i]
+    return length
+
+
+class ChunkedCrossfadeTest(unittest.TestCase):
+    TRANSITION = 0.5
+    CHUNK_SIZE = 2
+
+    def setUp(self):
+        config = compositor_module.CompositorConfig(
+            audio_path=Path("audio.mp3"),
+            slides_dir=Path("slides"),
+            script_path=Path("script.json"),
+            output_path=Path("out.mp4"),
+            transition_duration=self.TRANSITION,
+        )
+        # Only the planning methods are exercised, so skip FFmpeg discovery in __init__
+        self.compositor = object.__new__(compositor_module.AudioSlidesCompositor)
+        self.compositor.config = config
+        self.compositor.logger = logging.getLogger("test")
+
+    def segments(self, durations: list[float]) -> list:
+        segments, start = [], 0.0
+        for i, duration in enumerate(durations):
+            segments.append(compositor_module.SlideSegment(i, start, start + duration, duration))
+            start += duration
+        return segments
+
+    def test_short_segment_at_chunk_boundary(self):
+        # Segments 2 and 4 open chunks and are shorter than one transition
+        durations = [2.0, 2.0, 0.3, 2.0, 0.4, 2.0]
+        target = sum(durations) - self.TRANSITION * (len(durations) - 1)
+        planned = self.compositor.fit_segments_to_duration(self.segments(durations), target)
+
+        # The last segment is refitted to the target; it only fades in, and never opens a chunk
+        min_duration = 2 * self.TRANSITION + 1 / OUTPUT_FPS
+        for segment in planned[:-1]:
+            self.assertGreaterEqual(segment.duration, min_duration - 1e-9)
+        self.assertGreater(planned[-1].duration, self.TRANSITION)
+
+        inputs = [(Path(f"segment_{seg.segment_id}.mp4"), 0.0, seg.duration) for seg in planned]
+        chunks = self.compositor.plan_crossfade_chunks(inputs, self.CHUNK_SIZE)
+        self.assertGreater(len(chunks), 1)
+
+        single = rendered_length([dur for _, _, dur in inputs], self.TRANSITION)
+        chunked = sum(rendered_length([dur for _, _, dur in chunk], self.TRANSITION) for chunk in chunks)
+        self.assertAlmostEqual(chunked, single, places=6)
+        self.assertAlmostEqual(single, round(target * OUTPUT_FPS) / OUTPUT_FPS, places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
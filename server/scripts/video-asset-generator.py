@@ -30,6 +30,10 @@ from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any, Optional
+
+from cue_classifier import CueClassifier
+from script_ir import ScriptIR, load_script_ir
+
 try:
     from dotenv import load_dotenv
 except ImportError:
@@ -223,108 +227,70 @@ class ScriptParser:
             r"logo\s+animation", r"branding\s+animation"
         ]
     }
+    TYPE_CLASSIFIER = CueClassifier(TYPE_PATTERNS)
 
     def __init__(self, logger: logging.Logger):
         self.logger = logger
 
     def parse_markdown(self, filepath: Path) -> ParsedScript:
         """Parse a markdown script file into structured data."""
-        content = filepath.read_text(encoding="utf-8")
+        # Shared, cached parse (see script_ir.py)
+        ir = load_script_ir(filepath)
 
         # Extract metadata from header
-        metadata = self._extract_metadata(content)
-
-        # Extract sections
-        sections = self._extract_sections(content)
+        metadata = self._extract_metadata(ir)
 
         # Extract visual cues
-        visual_cues = self._extract_visual_cues(content, sections)
-
-        # Generate script ID from filename
-        script_id = filepath.stem
+        visual_cues = self._extract_visual_cues(ir)
 
         return ParsedScript(
-            script_id=script_id,
-            title=metadata.get("title", script_id),
+            script_id=ir.script_id,
+            title=metadata["title"],
             module=metadata.get("module", ""),
             lesson=metadata.get("lesson", ""),
             duration=metadata.get("duration", ""),
             purpose=metadata.get("purpose", ""),
-            sections=sections,
+            sections=ir.sections,
             visual_cues=[vc.to_dict() for vc in visual_cues],
-            raw_content=content
+            raw_content=ir.content
         )
 
-    def _extract_metadata(self, content: str) -> dict:
-        """Extract metadata from script header."""
-        metadata = {}
+    def _extract_metadata(self, ir: ScriptIR) -> dict:
+        """Map the script header onto this tool's metadata fields."""
+        metadata = {"title": ir.title}
 
-        # Title from first H1
-        title_match = re.search(r"^#\s+(?:Script\s+[\d.]+:\s+)?(.+)$", content, re.MULTILINE)
-        if title_match:
-            metadata["title"] = title_match.group(1).strip()
-
-        # Duration
-        duration_match = re.search(r"\*\*Duration:\*\*\s*(.+)", content)
-        if duration_match:
-            metadata["duration"] = duration_match.group(1).strip()
+        if "stated_duration" in ir.metadata:
+            metadata["duration"] = ir.metadata["stated_duration"]
 
         # Lesson info
-        lesson_match = re.search(r"\*\*Lesson:\*\*\s*(.+)", content)
-        if lesson_match:
-            lesson_info = lesson_match.group(1).strip()
+        lesson_info = ir.metadata.get("lesson")
+        if lesson_info:
             metadata["lesson"] = lesson_info
             # Extract module number
             module_match = re.search(r"Module\s+(\d+)", lesson_info)
             if module_match:
                 metadata["module"] = module_match.group(1)
 
-        # Purpose
-        purpose_match = re.search(r"\*\*Purpose:\*\*\s*(.+)", content)
-        if purpose_match:
-            metadata["purpose"] = purpose_match.group(1).strip()
+        if "purpose" in ir.metadata:
+            metadata["purpose"] = ir.metadata["purpose"]
 
         return metadata
 
-    def _extract_sections(self, content: str) -> list:
-        """Extract section headers from script."""
-        sections = []
-        section_pattern = re.compile(r"^##\s+(.+)$", re.MULTILINE)
-
-        for match in section_pattern.finditer(content):
-            section_name = match.group(1).strip()
-            if section_name not in ["---"]:
-                sections.append({
-                    "name": section_name,
-                    "position": match.start()
-                })
-
-        return sections
-
-    def _extract_visual_cues(self, content: str, sections: list) -> list:
-        """Extract visual cues from [SCREEN: ...] markers."""
+    def _extract_visual_cues(self, ir: ScriptIR) -> list:
+        """Build visual cues from the script's [SCREEN: ...] markers."""
         visual_cues = []
+        content = ir.content
+        asset_types = self._classify_visual_cues([cue.text for cue in ir.cues])
 
-        # Pattern to match [SCREEN: ...] markers
-        screen_pattern = re.compile(r"\[SCREEN:\s*(.+?)\]", re.IGNORECASE | re.DOTALL)
-
-        for idx, match in enumerate(screen_pattern.finditer(content)):
-            raw_text = match.group(1).strip()
-            position = match.start()
-
-            # Determine which section this cue belongs to
-            current_section = ""
-            for section in sections:
-                if section["position"] < position:
-                    current_section = section["name"]
+        for idx, cue in enumerate(ir.cues):
+            raw_text = cue.text
 
             # Get surrounding context (text before and after)
-            context_start = max(0, position - 200)
-            context_end = min(len(content), match.end() + 200)
+            context_start = max(0, cue.start - 200)
+            context_end = min(len(content), cue.end + 200)
             context = content[context_start:context_end]
 
-            # Determine asset type
-            asset_type = self._classify_visual_cue(raw_text)
+            asset_type = asset_types[idx]
 
             # Generate filename
             filename = self._generate_filename(idx + 1, asset_type, raw_text)
@@ -335,7 +301,7 @@ class ScriptParser:
                 asset_type=asset_type,
                 description=raw_text,
                 context=context,
-                section=current_section,
+                section=cue.section,
                 filename=filename,
                 status=GenerationStatus.PENDING
             )
@@ -345,14 +311,18 @@ class ScriptParser:
         self.logger.info(f"Extracted {len(visual_cues)} visual cues")
         return visual_cues
 
-    def _classify_visual_cue(self, text: str) -> AssetType:
-        """Classify a visual cue into an asset type."""
-        text_lower = text.lower()
+    def _classify_visual_cues(self, texts: list) -> list:
+        """Classify a batch of visual cues into asset types."""
+        asset_types = self.TYPE_CLASSIFIER.classify_many(texts)
+        return [
+            asset_type or self._fallback_asset_type(text)
+            for text, asset_type in zip(texts, asset_types)
+        ]
 
-        for asset_type, patterns in self.TYPE_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, text_lower):
-                    return asset_type
+    @staticmethod
+    def _fallback_asset_type(text: str) -> AssetType:
+        """Keyword classification for cues no pattern matched."""
+        text_lower = text.lower()
 
         # Default classification based on keywords
         if any(word in text_lower for word in ["heading", "title", "module", "phase"]):
@@ -19,24 +19,40 @@ Usage:
     python video-compositor.py --preview                    # Generate preview frames only
     python video-compositor.py --pip-position bottom-right  # Change PiP position
     python video-compositor.py --pip-size medium            # Change PiP size
+    python video-compositor.py --pip-style circle           # Rounded, circle or square PiP
 
 Requirements:
     - FFmpeg installed and accessible via command line
     - Python 3.8+
+    - Pillow (optional, for rounded/circular PiP masks and shadows)
 """
 
 import argparse
 import json
 import logging
+import math
 import os
 import shutil
-import subprocess
 import sys
 import tempfile
-from dataclasses import dataclass, field
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Optional
+
+try:
+    from PIL import Image, ImageDraw, ImageFilter
+except ImportError:
+    Image = None  # plain rectangular PiP
+
+from asset_catalog import DEFAULT_CATALOG_PATH, AssetCatalog
+from ffmpeg_runtime import get_runtime
+from ffmpeg_tools import FFmpegProgress, FFmpegWrapper, ProbeCache, RunReport, count_frame_errors, parse_frame_rate
+from mezzanine import DEFAULT_MANIFEST_PATH, MezzanineStore
+from placeholder_cards import PILLOW_AVAILABLE, placeholder_path, render_placeholder
 
 # ============================================================================
 # Constants and Configuration
@@ -50,10 +66,16 @@ DEFAULT_LOG_PATH = SCRIPT_DIR / "video-compositor.log"
 OUTPUT_WIDTH = 1920
 OUTPUT_HEIGHT = 1080
 VISUAL_HEIGHT = 864  # 80% of 1080
+OUTPUT_FPS = 30
 PIP_PADDING = 20
 BACKGROUND_COLOR = "0x1E1B4B"  # Dark purple (BGR for FFmpeg)
 TRANSITION_DURATION = 0.5  # seconds
 
+# Still-image profile for image segments: stillimage tuning and long GOPs.
+# The codec itself is the FFmpeg runtime's preferred encoder.
+STILL_GOP_SECONDS = 10
+STILL_GOP_ARGS = ["-g", str(OUTPUT_FPS * STILL_GOP_SECONDS), "-pix_fmt", "yuv420p"]
+
 # PiP size presets (width, height)
 PIP_SIZES = {
     "small": (288, 162),
@@ -61,6 +83,24 @@ PIP_SIZES = {
     "large": (480, 270),
 }
 
+# PiP styling: masks and shadows are rendered once per geometry and cached
+PIP_STYLES = ["square", "rounded", "circle"]
+DEFAULT_PIP_RADIUS = 20  # corner radius for the rounded style
+PIP_SHADOW_BLUR = 12
+PIP_SHADOW_OFFSET = 6
+PIP_SHADOW_OPACITY = 160  # 0-255
+PIP_MASK_SUPERSAMPLE = 4  # anti-aliasing factor for mask edges
+PIP_MASK_DIR = DEFAULT_OUTPUT_DIR / "pip-masks"
+
+# Chunked final composite: the timeline is split at segment boundaries into
+# this many ranges, composited in parallel and joined by stream copy
+DEFAULT_COMPOSE_CHUNKS = 1  # 1 = single serial encode
+
+# Preview mode
+DEFAULT_PREVIEW_COUNT = 5
+PREVIEW_THUMB_WIDTH = 480  # contact sheet thumbnail size
+PREVIEW_THUMB_HEIGHT = 270
+
 # PiP position presets (returns x, y based on size)
 def get_pip_position(position: str, pip_width: int, pip_height: int) -> tuple[int, int]:
     """Calculate PiP position based on preset name."""
@@ -72,7 +112,6 @@ def get_pip_position(position: str, pip_width: int, pip_height: int) -> tuple[in
     }
     return positions.get(position, positions["bottom-right"])
 
-
 # ============================================================================
 # Logging Setup
 # ============================================================================
@@ -132,9 +171,21 @@ class CompositorConfig:
     output_path: Path
     pip_position: str = "bottom-right"
     pip_size: str = "medium"
+    pip_style: str = "rounded"
+    pip_radius: int = DEFAULT_PIP_RADIUS
+    pip_shadow: bool = True
     preview_only: bool = False
+    preview_count: int = DEFAULT_PREVIEW_COUNT
     temp_dir: Optional[Path] = None
     verbose: bool = False
+    probe_cache: Optional[Path] = None
+    report_path: Optional[Path] = None
+    asset_catalog: Optional[Path] = DEFAULT_CATALOG_PATH
+    mezzanine_manifest: Optional[Path] = DEFAULT_MANIFEST_PATH
+    normalize_media: bool = False
+    vfr: bool = False
+    compose_chunks: int = DEFAULT_COMPOSE_CHUNKS
+    transition_duration: float = TRANSITION_DURATION
 
     # Computed properties
     pip_width: int = field(init=False)
@@ -144,177 +195,69 @@ class CompositorConfig:
 
     def __post_init__(self):
         self.pip_width, self.pip_height = PIP_SIZES.get(self.pip_size, PIP_SIZES["medium"])
+        if self.pip_style == "circle":
+            # Circular PiP is a square crop of the avatar, anchored like the rectangle
+            self.pip_width = self.pip_height
+            self.pip_radius = self.pip_height // 2
+        elif self.pip_style == "square":
+            self.pip_radius = 0
         self.pip_x, self.pip_y = get_pip_position(self.pip_position, self.pip_width, self.pip_height)
 
 
 # ============================================================================
-# FFmpeg Utilities
+# PiP Masks
 # ============================================================================
 
-class FFmpegWrapper:
-    """Wrapper for FFmpeg operations."""
-
-    def __init__(self, logger: logging.Logger):
-        self.logger = logger
-        self.ffmpeg_path = self._find_ffmpeg()
-        self.ffprobe_path = self._find_ffprobe()
-
-    def _find_ffmpeg(self) -> str:
-        """Find FFmpeg executable."""
-        # Check common locations
-        common_paths = [
-            "ffmpeg",
-            "ffmpeg.exe",
-            r"C:\ffmpeg\bin\ffmpeg.exe",
-            r"C:\Program Files\ffmpeg\bin\ffmpeg.exe",
-            r"C:\ProgramData\chocolatey\bin\ffmpeg.exe",
-            "/usr/bin/ffmpeg",
-            "/usr/local/bin/ffmpeg",
-        ]
-
-        for path in common_paths:
-            if shutil.which(path):
-                return path
-
-        # Try to find via where/which
-        try:
-            result = subprocess.run(
-                ["where", "ffmpeg"] if sys.platform == "win32" else ["which", "ffmpeg"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                return result.stdout.strip().split('\n')[0]
-        except Exception:
-            pass
-
-        return "ffmpeg"  # Hope it's in PATH
-
-    def _find_ffprobe(self) -> str:
-        """Find FFprobe executable."""
-        # Check common locations first
-        common_paths = [
-            r"C:\ffmpeg\bin\ffprobe.exe",
-            r"C:\Program Files\ffmpeg\bin\ffprobe.exe",
-            "ffprobe.exe",
-            "ffprobe",
-        ]
-
-        for path in common_paths:
-            if os.path.exists(path):
-                return path
-
-        # Try deriving from ffmpeg path
-        if self.ffmpeg_path and self.ffmpeg_path != "ffmpeg":
-            ffprobe = self.ffmpeg_path.replace("ffmpeg", "ffprobe")
-            if os.path.exists(ffprobe):
-                return ffprobe
-
-        return "ffprobe"
-
-    def check_availability(self) -> tuple[bool, str]:
-        """Check if FFmpeg is available and return version."""
-        try:
-            result = subprocess.run(
-                [self.ffmpeg_path, "-version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                version_line = result.stdout.split('\n')[0]
-                self.logger.info(f"FFmpeg found: {version_line}")
-                return True, version_line
-            return False, "FFmpeg returned error"
-        except FileNotFoundError:
-            return False, "FFmpeg not found in PATH"
-        except subprocess.TimeoutExpired:
-            return False, "FFmpeg check timed out"
-        except Exception as e:
-            return False, f"Error checking FFmpeg: {e}"
-
-    def get_video_info(self, video_path: Path) -> dict[str, Any]:
-        """Get video information using ffprobe."""
-        try:
-            result = subprocess.run(
-                [
-                    self.ffprobe_path,
-                    "-v", "quiet",
-                    "-print_format", "json",
-                    "-show_format",
-                    "-show_streams",
-                    str(video_path)
-                ],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            if result.returncode == 0:
-                return json.loads(result.stdout)
-            self.logger.error(f"FFprobe error: {result.stderr}")
-            return {}
-        except Exception as e:
-            self.logger.error(f"Error getting video info: {e}")
-            return {}
-
-    def get_duration(self, video_path: Path) -> float:
-        """Get video duration in seconds."""
-        info = self.get_video_info(video_path)
-        if info and "format" in info:
-            return float(info["format"].get("duration", 0))
-        return 0.0
-
-    def get_dimensions(self, video_path: Path) -> tuple[int, int]:
-        """Get video dimensions (width, height)."""
-        info = self.get_video_info(video_path)
-        if info and "streams" in info:
-            for stream in info["streams"]:
-                if stream.get("codec_type") == "video":
-                    return stream.get("width", 0), stream.get("height", 0)
-        return 0, 0
-
-    def run_ffmpeg(
-        self,
-        args: list[str],
-        progress_callback: Optional[callable] = None,
-        timeout: int = 3600
-    ) -> tuple[bool, str]:
-        """Run FFmpeg with the given arguments."""
-        cmd = [self.ffmpeg_path] + args
-        self.logger.debug(f"Running: {' '.join(cmd)}")
-
-        try:
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1
-            )
-
-            # Capture stderr for progress (FFmpeg outputs progress to stderr)
-            stderr_output = []
-            for line in process.stderr:
-                stderr_output.append(line)
-                if progress_callback and "time=" in line:
-                    progress_callback(line)
-                elif "error" in line.lower():
-                    self.logger.warning(line.strip())
-
-            process.wait(timeout=timeout)
-
-            if process.returncode == 0:
-                return True, "Success"
-            else:
-                error_msg = ''.join(stderr_output[-10:])  # Last 10 lines
-                return False, error_msg
-
-        except subprocess.TimeoutExpired:
-            process.kill()
-            return False, "FFmpeg timed out"
-        except Exception as e:
-            return False, f"FFmpeg error: {e}"
+def _pip_shape(width: int, height: int, radius: int, fill: int, offset: int = 0) -> "Image.Image":
+    """Draw an anti-aliased rounded rectangle as an 8-bit alpha image."""
+    scale = PIP_MASK_SUPERSAMPLE
+    canvas = Image.new("L", ((width + 2 * offset) * scale, (height + 2 * offset) * scale), 0)
+    ImageDraw.Draw(canvas).rounded_rectangle(
+        [offset * scale, offset * scale, (offset + width) * scale - 1, (offset + height) * scale - 1],
+        radius=radius * scale,
+        fill=fill
+    )
+    return canvas.resize((width + 2 * offset, height + 2 * offset), Image.LANCZOS)
+
+
+@lru_cache(maxsize=None)
+def render_pip_masks(
+    width: int,
+    height: int,
+    radius: int,
+    shadow: bool,
+    cache_dir: Path = PIP_MASK_DIR
+) -> tuple[Path, Optional[Path]]:
+    """Render the PiP alpha mask and drop shadow PNGs for one geometry.
+
+    Files are named after (size, radius, shadow settings) and reused across
+    runs, so FFmpeg only has to alphamerge/overlay two static images.
+    Returns (mask_path, shadow_path); shadow_path is None without a shadow.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    stem = f"{width}x{height}_r{radius}"
+
+    mask_path = cache_dir / f"mask_{stem}.png"
+    if not mask_path.exists():
+        tmp_path = mask_path.with_suffix(f".{os.getpid()}.tmp")
+        _pip_shape(width, height, radius, 255).save(tmp_path, format="PNG")
+        os.replace(tmp_path, mask_path)
+
+    if not shadow:
+        return mask_path, None
+
+    margin = PIP_SHADOW_BLUR * 2
+    shadow_path = cache_dir / f"shadow_{stem}_b{PIP_SHADOW_BLUR}_a{PIP_SHADOW_OPACITY}.png"
+    if not shadow_path.exists():
+        alpha = _pip_shape(width, height, radius, PIP_SHADOW_OPACITY, offset=margin)
+        alpha = alpha.filter(ImageFilter.GaussianBlur(PIP_SHADOW_BLUR))
+        image = Image.new("RGBA", alpha.size, (0, 0, 0, 0))
+        image.putalpha(alpha)
+        tmp_path = shadow_path.with_suffix(f".{os.getpid()}.tmp")
+        image.save(tmp_path, format="PNG")
+        os.replace(tmp_path, shadow_path)
+
+    return mask_path, shadow_path
 
 
 # ============================================================================
@@ -327,96 +270,68 @@ class AssetManager:
     SUPPORTED_IMAGE_FORMATS = {".png", ".jpg", ".jpeg", ".webp", ".bmp"}
     SUPPORTED_VIDEO_FORMATS = {".mp4", ".mov", ".webm", ".avi", ".mkv"}
 
-    def __init__(self, assets_dir: Path, logger: logging.Logger):
+    def __init__(
+        self,
+        assets_dir: Path,
+        logger: logging.Logger,
+        ffmpeg: Optional[FFmpegWrapper] = None,
+        catalog_path: Optional[Path] = DEFAULT_CATALOG_PATH
+    ):
         self.assets_dir = assets_dir
         self.logger = logger
-        self.assets: dict[str, Path] = {}
-        self._scan_assets()
-
-    def _scan_assets(self):
-        """Scan assets directory and index files."""
-        if not self.assets_dir.exists():
-            self.logger.warning(f"Assets directory not found: {self.assets_dir}")
-            return
-
-        for file in self.assets_dir.iterdir():
-            if file.is_file():
-                suffix = file.suffix.lower()
-                if suffix in self.SUPPORTED_IMAGE_FORMATS | self.SUPPORTED_VIDEO_FORMATS:
-                    key = file.stem.lower()
-                    self.assets[key] = file
-                    self.logger.debug(f"Found asset: {key} -> {file}")
-
-        self.logger.info(f"Indexed {len(self.assets)} assets from {self.assets_dir}")
+        self.ffmpeg = ffmpeg
+        self.catalog = AssetCatalog(
+            [assets_dir],
+            self.SUPPORTED_IMAGE_FORMATS | self.SUPPORTED_VIDEO_FORMATS,
+            cache_path=catalog_path,
+            logger=logger
+        )
 
     def get_asset(self, name: str) -> Optional[Path]:
         """Get asset by name (case-insensitive, without extension)."""
-        return self.assets.get(name.lower())
+        return self.catalog.find_title(name)
 
     def find_asset_for_segment(self, segment_index: int, segment_title: Optional[str] = None) -> Optional[Path]:
         """Find appropriate asset for a segment."""
-        # Try by segment index with various formats
         # Note: segment_index is 0-based from parser, but segment_id in scripts is 1-based
-        segment_id = segment_index + 1  # Convert to 1-based for matching
-
-        patterns = [
-            f"segment_{segment_id:03d}",  # segment_001, segment_002, etc.
-            f"segment_{segment_id:02d}",  # segment_01, segment_02, etc.
-            f"segment_{segment_id}",      # segment_1, segment_2, etc.
-            f"segment_{segment_index:03d}",  # 0-based versions
-            f"segment_{segment_index}",
-            f"slide_{segment_id}",
-            f"slide_{segment_index}",
-            f"{segment_id}",
-            f"{segment_index}",
-        ]
-
-        for pattern in patterns:
-            if asset := self.get_asset(pattern):
-                return asset
-
-        # Try by title
-        if segment_title:
-            title_key = segment_title.lower().replace(" ", "_").replace("-", "_")
-            if asset := self.get_asset(title_key):
-                return asset
-
-        return None
+        return self.catalog.find_segment(segment_index + 1, segment_title, segment_index=segment_index)
 
     def is_video_asset(self, path: Path) -> bool:
         """Check if asset is a video file."""
         return path.suffix.lower() in self.SUPPORTED_VIDEO_FORMATS
 
-    def create_placeholder(self, output_path: Path, text: str = "Content") -> bool:
-        """Create a placeholder image with text."""
-        # Use FFmpeg to create a placeholder
-        # Find ffmpeg path
-        ffmpeg_path = r"C:\ffmpeg\bin\ffmpeg.exe"
-        if not os.path.exists(ffmpeg_path):
-            ffmpeg_path = "ffmpeg"
+    def create_placeholder(self, text: str = "Content") -> Optional[Path]:
+        """Return a placeholder card with text, rendering it if needed."""
+        if PILLOW_AVAILABLE:
+            try:
+                return render_placeholder(text, OUTPUT_WIDTH, VISUAL_HEIGHT)
+            except OSError as e:
+                self.logger.error(f"Failed to create placeholder: {e}")
+                return None
+
+        # Without Pillow, draw the card with FFmpeg instead
+        output_path = placeholder_path(text, OUTPUT_WIDTH, VISUAL_HEIGHT, kind="drawtext")
+        if output_path.exists():
+            return output_path
+        if self.ffmpeg is None:
+            self.logger.error("Cannot create placeholder: Pillow is not installed and no FFmpeg is configured")
+            return None
+        output_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Escape special characters in text for FFmpeg filter
         safe_text = text.replace("'", "").replace(":", " -").replace("\\", "")[:40]
 
-        try:
-            result = subprocess.run(
-                [
-                    ffmpeg_path, "-y",
-                    "-f", "lavfi",
-                    "-i", f"color=c={BACKGROUND_COLOR}:s={OUTPUT_WIDTH}x{VISUAL_HEIGHT}:d=1",
-                    "-vf", f"drawtext=text='{safe_text}':fontsize=48:fontcolor=white:x=(w-text_w)/2:y=(h-text_h)/2",
-                    "-frames:v", "1",
-                    str(output_path)
-                ],
-                capture_output=True,
-                timeout=30
-            )
-            if result.returncode != 0:
-                self.logger.debug(f"FFmpeg placeholder error: {result.stderr.decode()}")
-            return output_path.exists()
-        except Exception as e:
-            self.logger.error(f"Failed to create placeholder: {e}")
-            return False
+        success, msg = self.ffmpeg.run_ffmpeg([
+            "-y",
+            "-f", "lavfi",
+            "-i", f"color=c={BACKGROUND_COLOR}:s={OUTPUT_WIDTH}x{VISUAL_HEIGHT}:d=1",
+            "-vf", f"drawtext=text='{safe_text}':fontsize=48:fontcolor=white:x=(w-text_w)/2:y=(h-text_h)/2",
+            "-frames:v", "1",
+            str(output_path)
+        ])
+        if not success:
+            self.logger.debug(f"FFmpeg placeholder error: {msg}")
+        return output_path if output_path.exists() else None
 
 
 # ============================================================================
@@ -518,10 +433,30 @@ class VideoCompositor:
     def __init__(self, config: CompositorConfig, logger: logging.Logger):
         self.config = config
         self.logger = logger
-        self.ffmpeg = FFmpegWrapper(logger)
-        self.asset_manager = AssetManager(config.assets_dir, logger)
+        self.ffmpeg = FFmpegWrapper(logger, ProbeCache(config.probe_cache))
+        self.report = RunReport("video-compositor", self.ffmpeg)
+        self.asset_manager = AssetManager(config.assets_dir, logger, self.ffmpeg, config.asset_catalog)
         self.script_parser = ScriptParser(config.script_json, logger)
         self.temp_dir = config.temp_dir or Path(tempfile.mkdtemp(prefix="compositor_"))
+        self.visual_segments: list[Segment] = []
+        self.overlap_frames = 0
+        self.mezzanine = None
+        if config.mezzanine_manifest:
+            self.mezzanine = MezzanineStore(config.mezzanine_manifest, self.ffmpeg.runtime, logger)
+        # Devon audio is re-encoded unless it comes from the mezzanine store
+        self.devon_audio_args = ["-c:a", "aac", "-b:a", "192k"]
+
+    def conform_media(self, path: Path) -> Path:
+        """Return the mezzanine copy of a media file if there is one, else the file itself.
+
+        Copies are made ahead of time by normalize-media.py; only with
+        --normalize-media are missing ones transcoded during the run.
+        """
+        if self.mezzanine is None:
+            return path
+        if self.config.normalize_media:
+            return self.mezzanine.normalize(path)
+        return self.mezzanine.lookup(path) or path
 
     def validate_inputs(self) -> bool:
         """Validate all input files and configuration."""
@@ -561,7 +496,7 @@ class VideoCompositor:
         return True
 
     def prepare_devon_video(self) -> Optional[Path]:
-        """Prepare Devon video (concatenate if in parts, scale if needed)."""
+        """Resolve the Devon video, stream-copy concatenating it if in parts."""
         devon_path = self.config.devon_video
 
         # Check if it's a directory with parts
@@ -571,6 +506,10 @@ class VideoCompositor:
                 self.logger.error("No MP4 files found in Devon video directory")
                 return None
 
+            # Conformed parts share one format, so the stream-copy concat is always safe
+            with ThreadPoolExecutor(max_workers=max(1, min(len(parts), os.cpu_count() or 1))) as pool:
+                parts = list(pool.map(self.conform_media, parts))
+
             if len(parts) > 1:
                 self.logger.info(f"Concatenating {len(parts)} Devon video parts")
                 concat_path = self.temp_dir / "devon_concat.mp4"
@@ -595,45 +534,19 @@ class VideoCompositor:
                 devon_path = concat_path
             else:
                 devon_path = parts[0]
+        else:
+            parts = [self.conform_media(devon_path)]
+            devon_path = parts[0]
 
-        # Get current dimensions
+        if self.mezzanine and all(self.mezzanine.is_mezzanine(part) for part in parts):
+            self.devon_audio_args = ["-c:a", "copy"]
+
+        # Get current dimensions; scaling to the PiP size happens in the
+        # final compose graph, so the avatar track is only encoded once
         width, height = self.ffmpeg.get_dimensions(devon_path)
         self.logger.info(f"Devon video dimensions: {width}x{height}")
 
-        # Scale to PiP size and apply mask
-        pip_path = self.temp_dir / "devon_pip.mp4"
-
-        # Create circular/rounded mask and add shadow effect
-        filter_complex = (
-            f"[0:v]scale={self.config.pip_width}:{self.config.pip_height},"
-            f"format=rgba,"
-            # Rounded rectangle mask
-            f"geq=lum='p(X,Y)':a='if(gt(abs(X-W/2),W/2-20)*gt(abs(Y-H/2),H/2-20),"
-            f"if(lte(hypot(abs(X-W/2)-(W/2-20),abs(Y-H/2)-(H/2-20)),20),255,0),255)'"
-            f"[pip]"
-        )
-
-        # Simpler approach with just scaling and slight vignette
-        filter_simple = (
-            f"scale={self.config.pip_width}:{self.config.pip_height}:force_original_aspect_ratio=decrease,"
-            f"pad={self.config.pip_width}:{self.config.pip_height}:(ow-iw)/2:(oh-ih)/2:color=black,"
-            f"format=yuv420p"
-        )
-
-        success, msg = self.ffmpeg.run_ffmpeg([
-            "-y", "-i", str(devon_path),
-            "-vf", filter_simple,
-            "-c:v", "libx264", "-preset", "medium", "-crf", "18",
-            "-c:a", "aac", "-b:a", "128k",
-            str(pip_path)
-        ])
-
-        if not success:
-            self.logger.error(f"Failed to prepare Devon PiP: {msg}")
-            return None
-
-        self.logger.info(f"Prepared Devon PiP video: {pip_path}")
-        return pip_path
+        return devon_path
 
     def prepare_visual_sequence(self, devon_duration: float) -> Optional[Path]:
         """Create the visual sequence video from assets."""
@@ -641,8 +554,9 @@ class VideoCompositor:
 
         if not segments:
             self.logger.warning("No segments, creating placeholder visual")
-            placeholder_path = self.temp_dir / "placeholder.png"
-            self.asset_manager.create_placeholder(placeholder_path, "Support Forge")
+            placeholder_path = self.asset_manager.create_placeholder("Support Forge")
+            if placeholder_path is None:
+                return None
 
             # Create video from placeholder
             visual_path = self.temp_dir / "visuals.mp4"
@@ -651,114 +565,297 @@ class VideoCompositor:
                 "-i", str(placeholder_path),
                 "-t", str(devon_duration),
                 "-vf", f"scale={OUTPUT_WIDTH}:{VISUAL_HEIGHT}:force_original_aspect_ratio=decrease,pad={OUTPUT_WIDTH}:{VISUAL_HEIGHT}:(ow-iw)/2:(oh-ih)/2:color={BACKGROUND_COLOR}",
-                "-c:v", "libx264", "-preset", "medium", "-crf", "18",
+                *self.ffmpeg.runtime.video_encoder_args(),
                 "-pix_fmt", "yuv420p",
                 str(visual_path)
             ])
             return visual_path if success else None
 
-        # Prepare individual segment videos
-        segment_videos = []
+        # Plan segment durations so the sequence ends exactly with Devon
+        segments = self.fit_segments_to_duration(segments, devon_duration)
+        self.visual_segments = segments
 
-        for segment in segments:
-            segment_video = self.temp_dir / f"segment_{segment.index}.mp4"
+        with self.report.stage("segment_encode"):
+            # Prepare individual segment videos
+            segment_videos = []
 
-            # Find visual asset
-            visual_asset = None
-            if segment.visual_asset and segment.visual_asset.exists():
-                visual_asset = segment.visual_asset
-            else:
-                visual_asset = self.asset_manager.find_asset_for_segment(
-                    segment.index,
-                    segment.title
-                )
+            for position, segment in enumerate(segments):
+                segment_video = self.temp_dir / f"segment_{segment.index}.mp4"
+                frame_count = str(max(1, round(segment.duration * OUTPUT_FPS)))
 
-            if visual_asset is None:
-                # Create placeholder
-                placeholder = self.temp_dir / f"placeholder_{segment.index}.png"
-                text = segment.title or f"Segment {segment.index + 1}"
-                self.asset_manager.create_placeholder(placeholder, text)
-                visual_asset = placeholder
+                # Keyframes on the crossfade window boundaries let the clip be split by stream copy
+                cuts = self._window_cuts(position, len(segments), int(frame_count))
+                keyframe_args = ["-force_key_frames", self._cut_times(cuts)] if cuts else []
 
-            self.logger.info(f"Segment {segment.index}: {visual_asset.name} ({segment.duration:.2f}s)")
-
-            # Create segment video
-            is_video = self.asset_manager.is_video_asset(visual_asset)
+                # Find visual asset
+                visual_asset = None
+                if segment.visual_asset and segment.visual_asset.exists():
+                    visual_asset = segment.visual_asset
+                else:
+                    visual_asset = self.asset_manager.find_asset_for_segment(
+                        segment.index,
+                        segment.title
+                    )
 
-            if is_video:
-                # Handle video asset
-                success, msg = self.ffmpeg.run_ffmpeg([
-                    "-y", "-i", str(visual_asset),
-                    "-t", str(segment.duration),
-                    "-vf", f"scale={OUTPUT_WIDTH}:{VISUAL_HEIGHT}:force_original_aspect_ratio=decrease,pad={OUTPUT_WIDTH}:{VISUAL_HEIGHT}:(ow-iw)/2:(oh-ih)/2:color={BACKGROUND_COLOR},setsar=1",
-                    "-c:v", "libx264", "-preset", "medium", "-crf", "18",
-                    "-an",  # Remove audio from visual assets
-                    "-pix_fmt", "yuv420p",
-                    str(segment_video)
-                ])
-            else:
-                # Handle image asset
-                success, msg = self.ffmpeg.run_ffmpeg([
-                    "-y", "-loop", "1",
-                    "-i", str(visual_asset),
-                    "-t", str(segment.duration),
-                    "-vf", f"scale={OUTPUT_WIDTH}:{VISUAL_HEIGHT}:force_original_aspect_ratio=decrease,pad={OUTPUT_WIDTH}:{VISUAL_HEIGHT}:(ow-iw)/2:(oh-ih)/2:color={BACKGROUND_COLOR},setsar=1",
-                    "-c:v", "libx264", "-preset", "medium", "-crf", "18",
-                    "-pix_fmt", "yuv420p",
-                    str(segment_video)
-                ])
+                if visual_asset is None:
+                    # Create placeholder
+                    text = segment.title or f"Segment {segment.index + 1}"
+                    visual_asset = self.asset_manager.create_placeholder(text)
+                    if visual_asset is None:
+                        return None
+
+                self.logger.info(f"Segment {segment.index}: {visual_asset.name} ({segment.duration:.2f}s)")
+
+                # Create segment video
+                is_video = self.asset_manager.is_video_asset(visual_asset)
+                if is_video:
+                    visual_asset = self.conform_media(visual_asset)
+
+                copied = False
+                if is_video and self.is_conforming_video(visual_asset, int(frame_count), cuts):
+                    # Already in the output format: stream-copy, trimmed on a keyframe
+                    copied, msg = self._copy_video_segment(visual_asset, int(frame_count), segment_video)
+                    if copied:
+                        self.logger.info(f"Segment {segment.index}: stream-copied conforming video")
+                    else:
+                        self.logger.warning(f"Stream copy of {visual_asset.name} failed, re-encoding: {msg}")
+
+                if copied:
+                    success = True
+                elif is_video:
+                    # Handle video asset; hold its last frame if it is shorter than the segment
+                    success, msg = self.ffmpeg.run_ffmpeg([
+                        "-y", "-i", str(visual_asset),
+                        "-vf", f"scale={OUTPUT_WIDTH}:{VISUAL_HEIGHT}:force_original_aspect_ratio=decrease,pad={OUTPUT_WIDTH}:{VISUAL_HEIGHT}:(ow-iw)/2:(oh-ih)/2:color={BACKGROUND_COLOR},setsar=1,fps={OUTPUT_FPS},tpad=stop_mode=clone:stop_duration={segment.duration:.3f}",
+                        "-frames:v", frame_count,
+                        *self.ffmpeg.runtime.video_encoder_args(),
+                        *keyframe_args,
+                        "-an",  # Remove audio from visual assets
+                        "-pix_fmt", "yuv420p",
+                        str(segment_video)
+                    ])
+                else:
+                    # Handle image asset with the still-image profile
+                    image_filter = f"scale={OUTPUT_WIDTH}:{VISUAL_HEIGHT}:force_original_aspect_ratio=decrease,pad={OUTPUT_WIDTH}:{VISUAL_HEIGHT}:(ow-iw)/2:(oh-ih)/2:color={BACKGROUND_COLOR},setsar=1"
+                    rate_args = ["-r", str(OUTPUT_FPS)]
+                    held_frames = {0, int(frame_count) - 1}
+                    if self.config.vfr:
+                        # One held frame plus a closing frame per piece, which preserves the duration
+                        for cut in cuts:
+                            held_frames.update((cut - 1, cut))
+                        select = "+".join(f"eq(n\\,{n})" for n in sorted(held_frames))
+                        image_filter += f",trim=end_frame={frame_count},select='{select}'"
+                        rate_args = ["-fps_mode", "vfr"]
+
+                    success, msg = self.ffmpeg.run_ffmpeg([
+                        "-y", "-loop", "1", "-framerate", str(OUTPUT_FPS),
+                        "-i", str(visual_asset),
+                        "-frames:v", str(len(held_frames)) if self.config.vfr else frame_count,
+                        "-vf", image_filter,
+                        *self.ffmpeg.runtime.video_encoder_args(tune="stillimage"), *STILL_GOP_ARGS,
+                        *keyframe_args,
+                        *rate_args,
+                        str(segment_video)
+                    ])
 
-            if not success:
-                self.logger.error(f"Failed to create segment {segment.index}: {msg}")
-                return None
+                if not success:
+                    self.logger.error(f"Failed to create segment {segment.index}: {msg}")
+                    return None
 
-            segment_videos.append(segment_video)
+                self.ffmpeg.probe_cache.record_duration(segment_video, int(frame_count) / OUTPUT_FPS)
+                segment_videos.append(segment_video)
 
         # Concatenate with crossfade transitions
         if len(segment_videos) == 1:
             final_visual = segment_videos[0]
         else:
-            final_visual = self._concatenate_with_transitions(segment_videos)
+            with self.report.stage("transitions"):
+                final_visual = self._concatenate_with_transitions(segment_videos)
 
-        # Ensure duration matches Devon video
-        visual_duration = self.ffmpeg.get_duration(final_visual)
-        if visual_duration < devon_duration:
-            # Extend last frame
-            self.logger.info(f"Extending visual from {visual_duration:.2f}s to {devon_duration:.2f}s")
-            extended = self.temp_dir / "visuals_extended.mp4"
+        return final_visual
 
-            # Use tpad filter to extend
-            success, msg = self.ffmpeg.run_ffmpeg([
-                "-y", "-i", str(final_visual),
-                "-vf", f"tpad=stop_mode=clone:stop_duration={devon_duration - visual_duration}",
-                "-c:v", "libx264", "-preset", "medium", "-crf", "18",
-                str(extended)
-            ])
+    def is_conforming_video(self, video_path: Path, frame_count: int, cuts: list[int]) -> bool:
+        """True if a video asset can be stream-copied into a segment unchanged.
+
+        The asset must already be in the runtime's codec, yuv420p, at OUTPUT_WIDTH x VISUAL_HEIGHT,
+        constant OUTPUT_FPS, at least as long as the segment, and have
+        keyframes wherever it is cut: the segment end and any crossfade
+        window boundaries.
+        """
+        info = self.ffmpeg.get_media_info(video_path)
+        stream = next((s for s in info.get("streams", []) if s.get("codec_type") == "video"), None)
+        if not stream:
+            return False
 
-            if success:
-                final_visual = extended
+        if (
+            stream.get("codec_name") != self.ffmpeg.runtime.video_codec
+            or stream.get("pix_fmt") != "yuv420p"
+            or stream.get("width") != OUTPUT_WIDTH
+            or stream.get("height") != VISUAL_HEIGHT
+            or stream.get("sample_aspect_ratio", "1:1") not in ("1:1", "0:1")
+            or parse_frame_rate(stream.get("r_frame_rate")) != OUTPUT_FPS
+            or parse_frame_rate(stream.get("avg_frame_rate")) != OUTPUT_FPS
+        ):
+            return False
 
-        return final_visual
+        duration = float(stream.get("duration") or info.get("format", {}).get("duration") or 0)
+        asset_frames = round(duration * OUTPUT_FPS)
+        if asset_frames < frame_count:
+            return False  # Needs its last frame held, which means re-encoding
+
+        start = float(stream.get("start_time") or 0)
+        keyframes = [t - start for t in self.ffmpeg.get_keyframes(video_path)]
+        required = [0, *cuts] + ([frame_count] if asset_frames > frame_count else [])
+        tolerance = 0.5 / OUTPUT_FPS
+
+        for frame in required:
+            t = frame / OUTPUT_FPS
+            i = bisect_left(keyframes, t - tolerance)
+            if i == len(keyframes) or keyframes[i] > t + tolerance:
+                return False
+        return True
+
+    def _copy_video_segment(self, video_path: Path, frame_count: int, output_path: Path) -> tuple[bool, str]:
+        """Stream-copy the first frame_count frames of a conforming video.
+
+        The cut is made by the segment muxer, which splits exactly on the
+        keyframe at the segment end; -t only bounds how much is read past it.
+        """
+        end = frame_count / OUTPUT_FPS
+        pattern = output_path.with_name(f"{output_path.stem}_copy_%d.mp4")
+        for stale in output_path.parent.glob(f"{output_path.stem}_copy_*.mp4"):
+            stale.unlink()
+
+        success, msg = self.ffmpeg.run_ffmpeg([
+            "-y", "-i", str(video_path),
+            "-t", f"{end + 1:.6f}",
+            "-map", "0:v:0", "-c", "copy",
+            "-an",
+            "-f", "segment",
+            "-segment_format", "mp4",
+            "-segment_times", f"{end - 0.5 / OUTPUT_FPS:.6f}",
+            "-reset_timestamps", "1",
+            str(pattern)
+        ])
 
-    def _concatenate_with_transitions(self, videos: list[Path]) -> Path:
+        first_piece = output_path.with_name(f"{output_path.stem}_copy_0.mp4")
+        if not success or not first_piece.exists():
+            return False, msg or "no output"
+        os.replace(first_piece, output_path)
+
+        # Everything past the segment end landed in further pieces, which are not needed
+        for extra in output_path.parent.glob(f"{output_path.stem}_copy_*.mp4"):
+            extra.unlink()
+        return True, msg
+
+    def fit_segments_to_duration(self, segments: list[Segment], target_duration: float) -> list[Segment]:
+        """Plan segment durations so the visual timeline ends exactly at the target.
+
+        Durations are quantised to whole frames. The last segment is stretched
+        when the visuals run short, and trailing segments are shortened or
+        dropped when they run long, so no separate tpad/trim pass is needed.
+        Consecutive segments overlap by the crossfade window, which is
+        shortened when a segment is too short to hold both of its windows.
+        """
+        if not segments or target_duration <= 0:
+            return segments
+
+        overlap = self.transition_frames(len(segments))
+        frames = [max(1, round(seg.duration * OUTPUT_FPS)) for seg in segments]
+        target_frames = round(target_duration * OUTPUT_FPS)
+
+        if overlap and len(frames) > 1:
+            # The last segment is refitted below; every other one must keep its own length
+            shortest = min(frames[:-1])
+            fitted = (shortest - 1) // 2
+            if fitted < overlap:
+                fallback = f"{fitted} frames" if fitted else "hard cuts"
+                self.logger.info(
+                    f"Shortest segment is {shortest} frames, shortening crossfades from {overlap} frames to {fallback}"
+                )
+                overlap = fitted
+        min_frames = 2 * overlap + 1
+
+        def remaining(counts: list[int]) -> int:
+            # Frames left for the last segment once the others are laid out
+            return target_frames - sum(counts[:-1]) + overlap * (len(counts) - 1)
+
+        # Drop segments that would start after the Devon video ends
+        while len(frames) > 1 and remaining(frames) < min_frames:
+            frames.pop()
+        if len(frames) == 1:
+            overlap = 0
+        frames[-1] = max(min_frames if overlap else 1, remaining(frames))
+        self.overlap_frames = overlap
+
+        planned = [replace(seg, duration=count / OUTPUT_FPS) for seg, count in zip(segments, frames)]
+        if len(planned) < len(segments):
+            self.logger.info(f"Dropping {len(segments) - len(planned)} segment(s) past the end of the Devon video")
+
+        visual_duration = sum(seg.duration for seg in segments)
+        if abs(visual_duration - target_duration) >= 1 / OUTPUT_FPS:
+            self.logger.info(f"Fitting visual timeline from {visual_duration:.2f}s to {target_duration:.2f}s")
+
+        return planned
+
+    def transition_frames(self, segment_count: int) -> int:
+        """Frames each crossfade window spans, or 0 for hard cuts."""
+        if segment_count < 2 or self.config.transition_duration <= 0:
+            return 0
+        if not self.ffmpeg.runtime.has_filter("xfade"):
+            self.logger.warning("FFmpeg build has no xfade filter, using hard cuts")
+            return 0
+        return max(1, round(self.config.transition_duration * OUTPUT_FPS))
+
+    def _window_cuts(self, position: int, count: int, frames: int) -> list[int]:
+        """Frame indices where a segment clip meets its crossfade windows."""
+        if not self.overlap_frames or count < 2:
+            return []
+        cuts = []
+        if position > 0:
+            cuts.append(self.overlap_frames)
+        if position < count - 1:
+            cuts.append(frames - self.overlap_frames)
+        return cuts
+
+    @staticmethod
+    def _cut_times(cuts: list[int]) -> str:
+        """Cut frames as timestamps half a frame early, so rounding cannot miss them."""
+        return ",".join(f"{(cut - 0.5) / OUTPUT_FPS:.6f}" for cut in cuts)
+
+    def _concatenate_with_transitions(self, videos: list[Path]) -> Optional[Path]:
         """Concatenate videos with crossfade transitions."""
         if len(videos) <= 1:
             return videos[0] if videos else None
 
-        # Build complex filter for crossfades
-        # For simplicity, use xfade filter between consecutive videos
-        output_path = self.temp_dir / "visuals_concat.mp4"
+        if self.overlap_frames:
+            output_path = self._crossfade_windows(videos)
+            if output_path:
+                return output_path
+            self.logger.warning("Windowed crossfade failed, falling back to hard cuts")
 
-        # Simple concat for now (xfade is complex with multiple inputs)
+        output_path = self.temp_dir / "visuals_concat.mp4"
         concat_list = self.temp_dir / "visual_concat.txt"
         with open(concat_list, 'w') as f:
             for video in videos:
                 f.write(f"file '{video}'\n")
 
+        stream_copy = self.segments_conform(videos)
+        if stream_copy:
+            # Identical codec parameters: hard cuts join packets without re-encoding
+            self.logger.info("Segments share encoding parameters, concatenating with stream copy")
+            codec_args = ["-map", "0:v", "-c", "copy"]
+        else:
+            self.logger.info("Segment encoding parameters differ, re-encoding during concat")
+            codec_args = [
+                *self.ffmpeg.runtime.video_encoder_args(),
+                *(["-fps_mode", "vfr"] if self.config.vfr else []),
+            ]
+
         success, msg = self.ffmpeg.run_ffmpeg([
             "-y", "-f", "concat", "-safe", "0",
             "-i", str(concat_list),
-            "-c:v", "libx264", "-preset", "medium", "-crf", "18",
+            *codec_args,
             str(output_path)
         ])
 
@@ -766,17 +863,250 @@ class VideoCompositor:
             self.logger.error(f"Failed to concatenate visuals: {msg}")
             return videos[0]  # Return first video as fallback
 
+        if stream_copy:
+            total_frames = sum(round(seg.duration * OUTPUT_FPS) for seg in self.visual_segments)
+            self.ffmpeg.probe_cache.record_duration(output_path, total_frames / OUTPUT_FPS)
+
+        return output_path
+
+    def segments_conform(self, videos: list[Path]) -> bool:
+        """Check that all clips share codec, resolution, fps and pix_fmt."""
+        reference = None
+        for video in videos:
+            params = self.ffmpeg.get_video_stream_params(video)
+            if not params:
+                return False
+            if self.config.vfr:
+                # Frame rate guesses vary with each VFR clip's timestamps
+                params.pop("r_frame_rate", None)
+            if reference is None:
+                reference = params
+            elif params != reference:
+                self.logger.debug(f"{video.name} does not conform: {params} != {reference}")
+                return False
+        return True
+
+    def _crossfade_windows(self, videos: list[Path]) -> Optional[Path]:
+        """Crossfade clips by re-rendering only the window around each cut.
+
+        Each clip is split by stream copy at the keyframes forced on its
+        window boundaries. The tail of one clip and the head of the next are
+        blended with xfade into a short window clip, and the untouched clip
+        interiors and the windows are joined with -c copy when they all share
+        the same stream parameters; otherwise the join is re-encoded.
+        """
+        overlap = self.overlap_frames
+        count = len(videos)
+        workers = max(1, min(count, os.cpu_count() or 1))
+
+        def split(position: int) -> Optional[list[Path]]:
+            frames = round(self.visual_segments[position].duration * OUTPUT_FPS)
+            return self._split_clip(videos[position], self._window_cuts(position, count, frames), position)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pieces = list(pool.map(split, range(count)))
+        if not all(pieces):
+            return None
+
+        # Head window is the first piece of every clip but the first, tail the last of every clip but the last
+        windows = [self.temp_dir / f"window_{k}.ts" for k in range(count - 1)]
+
+        def render(k: int) -> tuple[bool, str]:
+            return self._render_window(pieces[k][-1], pieces[k + 1][0], windows[k])
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(render, range(count - 1)))
+        for k, (success, msg) in enumerate(results):
+            if not success:
+                self.logger.error(f"Failed to render crossfade {k + 1}: {msg}")
+                return None
+
+        parts = []
+        for position, clip_pieces in enumerate(pieces):
+            parts.append(clip_pieces[1] if position > 0 else clip_pieces[0])
+            if position < count - 1:
+                parts.append(windows[position])
+
+        concat_list = self.temp_dir / "visual_windows.txt"
+        with open(concat_list, 'w') as f:
+            for part in parts:
+                f.write(f"file '{part}'\n")
+
+        total_frames = sum(round(seg.duration * OUTPUT_FPS) for seg in self.visual_segments) - overlap * (count - 1)
+        stream_copy = self.segments_conform(parts)
+        if stream_copy:
+            codec_args = ["-c", "copy"]
+        else:
+            # Segments and windows were encoded differently; copying them would mix streams
+            self.logger.info("Crossfade pieces differ in encoding parameters, re-encoding the join")
+            codec_args = [
+                *self.ffmpeg.runtime.video_encoder_args(),
+                "-pix_fmt", "yuv420p",
+                *(["-fps_mode", "vfr"] if self.config.vfr else ["-r", str(OUTPUT_FPS)]),
+            ]
+
+        output_path = self.temp_dir / "visuals_concat.mp4"
+        success, msg = self.ffmpeg.run_ffmpeg([
+            "-y", "-f", "concat", "-safe", "0",
+            "-i", str(concat_list),
+            "-map", "0:v", *codec_args,
+            str(output_path)
+        ])
+        if not success:
+            self.logger.error(f"Failed to join crossfaded visuals: {msg}")
+            return None
+
+        self.ffmpeg.probe_cache.record_duration(output_path, total_frames / OUTPUT_FPS)
+        if stream_copy:
+            self.logger.info(f"Crossfaded {count} segments, re-encoding {overlap * (count - 1)} of {total_frames} frames")
+        else:
+            self.logger.info(f"Crossfaded {count} segments, re-encoding all {total_frames} frames")
         return output_path
 
+    def _split_clip(self, video: Path, cuts: list[int], position: int) -> Optional[list[Path]]:
+        """Split a segment clip at its window keyframes by stream copy."""
+        for stale in self.temp_dir.glob(f"piece_{position}_*.ts"):
+            stale.unlink()
+
+        success, msg = self.ffmpeg.run_ffmpeg([
+            "-y", "-i", str(video),
+            "-map", "0:v", "-c", "copy",
+            "-f", "segment",
+            "-segment_format", "mpegts",
+            "-segment_times", self._cut_times(cuts),
+            "-reset_timestamps", "1",
+            str(self.temp_dir / f"piece_{position}_%d.ts")
+        ])
+
+        pieces = [self.temp_dir / f"piece_{position}_{n}.ts" for n in range(len(cuts) + 1)]
+        if not success or not all(piece.exists() for piece in pieces):
+            self.logger.error(f"Failed to split {video.name} at its crossfade windows: {msg}")
+            return None
+        return pieces
+
+    def _render_window(self, tail: Path, head: Path, output_path: Path) -> tuple[bool, str]:
+        """Blend the tail of one clip into the head of the next."""
+        overlap = self.overlap_frames
+        window = (
+            f"setpts=PTS-STARTPTS,fps={OUTPUT_FPS},"
+            f"tpad=stop_mode=clone:stop={overlap},trim=end_frame={overlap}"
+        )
+        filter_complex = (
+            f"[0:v]{window}[from];[1:v]{window}[to];"
+            f"[from][to]xfade=transition=fade:duration={overlap / OUTPUT_FPS:.6f}:offset=0[vout]"
+        )
+        return self.ffmpeg.run_ffmpeg([
+            "-y", "-i", str(tail), "-i", str(head),
+            "-filter_complex", filter_complex,
+            "-map", "[vout]",
+            "-frames:v", str(overlap),
+            *self.ffmpeg.runtime.video_encoder_args(tune="stillimage"), *STILL_GOP_ARGS,
+            "-r", str(OUTPUT_FPS),
+            str(output_path)
+        ])
+
+    def prepare_pip_masks(self) -> tuple[Optional[Path], Optional[Path]]:
+        """Return cached (mask, shadow) PNGs for the configured PiP style."""
+        radius = self.config.pip_radius
+        if radius <= 0 and not self.config.pip_shadow:
+            return None, None
+
+        if Image is None:
+            self.logger.warning("Pillow not installed, using a plain rectangular PiP")
+            return None, None
+
+        try:
+            mask_path, shadow_path = render_pip_masks(
+                self.config.pip_width,
+                self.config.pip_height,
+                radius,
+                self.config.pip_shadow
+            )
+        except OSError as e:
+            self.logger.warning(f"Failed to render PiP mask, using a plain rectangle: {e}")
+            return None, None
+
+        # A square PiP needs no alpha mask, only the shadow
+        return (mask_path if radius > 0 else None), shadow_path
+
+    @staticmethod
+    def _pip_mask_inputs(
+        mask_path: Optional[Path],
+        shadow_path: Optional[Path],
+        first_index: int
+    ) -> tuple[list[str], Optional[str], Optional[str]]:
+        """Build looped image inputs for the mask/shadow and their stream labels."""
+        args, labels = [], []
+        index = first_index
+        for path in (mask_path, shadow_path):
+            if path is None:
+                labels.append(None)
+                continue
+            args += ["-loop", "1", "-i", str(path)]
+            labels.append(f"[{index}:v]")
+            index += 1
+        return args, labels[0], labels[1]
+
+    def build_pip_filter(
+        self,
+        base: str,
+        devon: str,
+        mask: Optional[str] = None,
+        shadow: Optional[str] = None,
+        output: str = "[final]",
+        tag: str = ""
+    ) -> str:
+        """Filter graph that scales Devon into the PiP box and overlays it on base.
+
+        tag suffixes the intermediate labels so several PiP chains can share
+        one graph (batch previews).
+        """
+        width, height = self.config.pip_width, self.config.pip_height
+        x, y = self.config.pip_x, self.config.pip_y
+        pip = f"[pip{tag}]"
+
+        if mask:
+            # Fill the shaped box, then cut the shape out with the static mask
+            graph = (
+                f"{devon}scale={width}:{height}:force_original_aspect_ratio=increase,"
+                f"crop={width}:{height},setsar=1,format=yuva420p[pip_fill{tag}];"
+                f"{mask}format=gray[pip_mask{tag}];"
+                f"[pip_fill{tag}][pip_mask{tag}]alphamerge{pip};"
+            )
+        else:
+            graph = (
+                f"{devon}scale={width}:{height}:force_original_aspect_ratio=decrease,"
+                f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2:color=black{pip};"
+            )
+
+        if shadow:
+            margin = PIP_SHADOW_BLUR * 2
+            graph += (
+                f"{base}{shadow}overlay={x - margin + PIP_SHADOW_OFFSET}:{y - margin + PIP_SHADOW_OFFSET}"
+                f":shortest=1[pip_base{tag}];"
+            )
+            base = f"[pip_base{tag}]"
+
+        return graph + f"{base}{pip}overlay={x}:{y}{output}"
+
     def compose_final_video(
         self,
-        devon_pip: Path,
+        devon_video: Path,
         visuals: Path,
         lower_thirds: Optional[list[dict]] = None
     ) -> bool:
         """Compose the final video with all layers."""
+        if self.config.compose_chunks > 1:
+            if self.compose_final_video_chunked(devon_video, visuals):
+                return True
+            self.logger.warning("Chunked composite failed, falling back to a single encode")
+
         self.logger.info("Composing final video...")
 
+        # Static PiP mask/shadow images follow the three main inputs
+        mask_path, shadow_path = self.prepare_pip_masks()
+        pip_inputs, mask_label, shadow_label = self._pip_mask_inputs(mask_path, shadow_path, first_index=3)
+
         # Build filter complex for composition
         # Background -> Visuals -> Devon PiP
 
@@ -791,28 +1121,30 @@ class VideoCompositor:
             # Overlay visuals on background (top portion)
             f"[bg][visual]overlay=0:0:shortest=0[with_visual];"
 
-            # Overlay Devon PiP
-            f"[with_visual][2:v]overlay={self.config.pip_x}:{self.config.pip_y}[final]"
+            # Scale, mask and overlay Devon PiP
+            + self.build_pip_filter("[with_visual]", "[2:v]", mask_label, shadow_label)
         )
 
         # Calculate Devon video duration
-        devon_duration = self.ffmpeg.get_duration(devon_pip)
+        devon_duration = self.ffmpeg.get_duration(devon_video)
 
-        success, msg = self.ffmpeg.run_ffmpeg([
-            "-y",
-            "-f", "lavfi", "-i", f"color=c={BACKGROUND_COLOR}:s={OUTPUT_WIDTH}x{OUTPUT_HEIGHT}:r=30",
-            "-i", str(visuals),
-            "-i", str(devon_pip),
-            "-filter_complex", filter_complex,
-            "-map", "[final]",
-            "-map", "2:a",  # Use Devon audio
-            "-t", str(devon_duration),
-            "-c:v", "libx264", "-preset", "medium", "-crf", "18",
-            "-c:a", "aac", "-b:a", "192k",
-            "-pix_fmt", "yuv420p",
-            "-movflags", "+faststart",
-            str(self.config.output_path)
-        ], progress_callback=self._progress_callback)
+        with self.report.stage("compose"):
+            success, msg = self.ffmpeg.run_ffmpeg([
+                "-y",
+                "-f", "lavfi", "-i", f"color=c={BACKGROUND_COLOR}:s={OUTPUT_WIDTH}x{OUTPUT_HEIGHT}:r={OUTPUT_FPS}",
+                "-i", str(visuals),
+                "-i", str(devon_video),
+                *pip_inputs,
+                "-filter_complex", filter_complex,
+                "-map", "[final]",
+                "-map", "2:a",  # Use Devon audio
+                "-t", str(devon_duration),
+                *self.ffmpeg.runtime.video_encoder_args(),
+                *self.devon_audio_args,
+                "-pix_fmt", "yuv420p",
+                "-movflags", "+faststart",
+                str(self.config.output_path)
+            ], progress_callback=self._progress_callback)
 
         if success:
             self.logger.info(f"Final video created: {self.config.output_path}")
@@ -821,36 +1153,192 @@ class VideoCompositor:
             self.logger.error(f"Failed to compose final video: {msg}")
             return False
 
-    def _progress_callback(self, line: str):
-        """Handle FFmpeg progress output."""
-        if "time=" in line:
-            # Extract time from FFmpeg output
-            import re
-            match = re.search(r'time=(\d+):(\d+):(\d+\.?\d*)', line)
-            if match:
-                hours, minutes, seconds = match.groups()
-                current = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
-                total = self.script_parser.total_duration or 60
-                percent = min(100, (current / total) * 100)
-                print(f"\rProgress: {percent:.1f}% ({current:.1f}s / {total:.1f}s)", end="", flush=True)
+    def plan_compose_chunks(self, total_frames: int, chunks: int) -> list[tuple[int, int]]:
+        """Split [0, total_frames) into up to `chunks` frame ranges cut at segment boundaries."""
+        cuts, position = [], 0
+        for segment in self.visual_segments[:-1]:
+            position += max(1, round(segment.duration * OUTPUT_FPS)) - self.overlap_frames
+            if 0 < position < total_frames:
+                cuts.append(position)
+
+        chosen = set()
+        if cuts:
+            for k in range(1, chunks):
+                target = total_frames * k / chunks
+                chosen.add(min(cuts, key=lambda cut: abs(cut - target)))
+
+        bounds = [0] + sorted(chosen) + [total_frames]
+        return list(zip(bounds, bounds[1:]))
+
+    def _compose_chunk(
+        self,
+        devon_video: Path,
+        visuals: Path,
+        start_frame: int,
+        end_frame: int,
+        chunk_path: Path,
+        threads: int,
+        pip_masks: tuple[Optional[Path], Optional[Path]]
+    ) -> tuple[bool, str]:
+        """Composite one frame range of the timeline, video only."""
+        start = start_frame / OUTPUT_FPS
+        pip_inputs, mask_label, shadow_label = self._pip_mask_inputs(*pip_masks, first_index=3)
+
+        if self.config.vfr:
+            # A VFR still is one held frame; an input seek would drop it, so cut after fps
+            visual_input = ["-i", str(visuals)]
+            visual_cut = f"fps={OUTPUT_FPS},trim=start_frame={start_frame},setpts=PTS-STARTPTS,"
+        else:
+            visual_input = ["-ss", f"{start:.6f}", "-i", str(visuals)]
+            visual_cut = ""
+
+        filter_complex = (
+            f"[1:v]{visual_cut}scale={OUTPUT_WIDTH}:{VISUAL_HEIGHT}:force_original_aspect_ratio=decrease,"
+            f"pad={OUTPUT_WIDTH}:{VISUAL_HEIGHT}:(ow-iw)/2:(oh-ih)/2:color={BACKGROUND_COLOR}[visual];"
+            f"[0:v][visual]overlay=0:0:shortest=0[with_visual];"
+            + self.build_pip_filter("[with_visual]", "[2:v]", mask_label, shadow_label)
+        )
+
+        return self.ffmpeg.run_ffmpeg([
+            "-y",
+            "-f", "lavfi", "-i", f"color=c={BACKGROUND_COLOR}:s={OUTPUT_WIDTH}x{OUTPUT_HEIGHT}:r={OUTPUT_FPS}",
+            *visual_input,
+            "-ss", f"{start:.6f}", "-i", str(devon_video),
+            *pip_inputs,
+            "-filter_complex", filter_complex,
+            "-map", "[final]",
+            "-an",
+            "-frames:v", str(end_frame - start_frame),
+            "-r", str(OUTPUT_FPS),
+            *self.ffmpeg.runtime.video_encoder_args(),
+            "-pix_fmt", "yuv420p",
+            "-force_key_frames", "expr:eq(n,0)",  # every chunk opens on a keyframe at its cut
+            "-threads", str(threads),
+            str(chunk_path)
+        ])
+
+    def compose_final_video_chunked(self, devon_video: Path, visuals: Path) -> bool:
+        """Composite the timeline in parallel chunks, then mux with audio encoded once.
+
+        Chunk ranges are whole frames cut at segment boundaries, so their
+        frame counts sum to what the single encode produces for -t. The
+        joined output is checked for that frame count and for duplicated or
+        dropped frames at the cuts; on any mismatch it is discarded and the
+        caller falls back to the single encode.
+        """
+        devon_duration = self.ffmpeg.get_duration(devon_video)
+        total_frames = math.ceil(devon_duration * OUTPUT_FPS - 1e-6)
+        ranges = self.plan_compose_chunks(total_frames, self.config.compose_chunks)
+        threads = max(1, (os.cpu_count() or 1) // len(ranges))
+        self.logger.info(
+            f"Composing final video in {len(ranges)} chunk(s), {threads} encoder thread(s) each..."
+        )
+
+        # Render the PiP mask once, before the workers share it
+        pip_masks = self.prepare_pip_masks()
+
+        chunk_paths = [self.temp_dir / f"compose_chunk_{i:03d}.mp4" for i in range(len(ranges))]
+        with self.report.stage("compose_chunks"), ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            futures = [
+                pool.submit(self._compose_chunk, devon_video, visuals, start, end, chunk_path, threads, pip_masks)
+                for (start, end), chunk_path in zip(ranges, chunk_paths)
+            ]
+            for i, future in enumerate(futures):
+                success, msg = future.result()
+                if not success:
+                    self.logger.error(f"Failed to compose chunk {i}: {msg}")
+                    return False
+                self.logger.info(f"Composed chunk {i + 1}/{len(ranges)} (frames {ranges[i][0]}-{ranges[i][1]})")
+
+        concat_list = self.temp_dir / "compose_chunks.txt"
+        with open(concat_list, 'w') as f:
+            for chunk_path in chunk_paths:
+                f.write(f"file '{chunk_path}'\n")
+
+        # Join the chunks without re-encoding; the Devon audio is encoded once here
+        with self.report.stage("chunk_join"):
+            success, msg = self.ffmpeg.run_ffmpeg([
+                "-y",
+                "-f", "concat", "-safe", "0", "-i", str(concat_list),
+                "-i", str(devon_video),
+                "-map", "0:v",
+                "-map", "1:a",  # Use Devon audio
+                "-c:v", "copy",
+                *self.devon_audio_args,
+                "-t", str(devon_duration),
+                "-movflags", "+faststart",
+                str(self.config.output_path)
+            ], progress_callback=self._progress_callback)
+        if not success:
+            self.logger.error(f"Failed to join composite chunks: {msg}")
+            return False
+
+        with self.report.stage("chunk_verify"):
+            problem = self.check_frame_timeline(self.config.output_path, total_frames)
+        if problem:
+            self.logger.error(f"Chunked composite is not frame-exact ({problem}), discarding it")
+            self.config.output_path.unlink(missing_ok=True)
+            return False
+
+        self.logger.info(f"Final video created: {self.config.output_path} ({total_frames} frames verified)")
+        return True
+
+    def check_frame_timeline(self, video_path: Path, expected_frames: int) -> Optional[str]:
+        """Describe what is wrong with a video's frame timeline, or None if it is exact.
+
+        Frame timestamps are read from packets, so long outputs are checked
+        without decoding.
+        """
+        frame_times = self.ffmpeg.get_frame_times(video_path)
+        if not frame_times:
+            return "no frame timestamps"
+
+        duplicated, dropped = count_frame_errors(frame_times, OUTPUT_FPS)
+        problems = []
+        if len(frame_times) != expected_frames:
+            problems.append(f"{len(frame_times)} frames, expected {expected_frames}")
+        if duplicated:
+            problems.append(f"{duplicated} duplicated")
+        if dropped:
+            problems.append(f"{dropped} dropped")
+        return ", ".join(problems) or None
+
+    def _progress_callback(self, progress: FFmpegProgress):
+        """Handle FFmpeg progress events."""
+        total = self.script_parser.total_duration or 60
+        percent = min(100, (progress.out_time / total) * 100)
+        eta = ""
+        if progress.speed > 0 and not progress.done:
+            eta = f", ETA {max(0.0, total - progress.out_time) / progress.speed:.0f}s"
+        print(f"\rProgress: {percent:.1f}% ({progress.out_time:.1f}s / {total:.1f}s) "
+              f"{progress.speed:.2f}x{eta}", end="", flush=True)
+
+    def preview_times(self, duration: float, count: int) -> list[float]:
+        """Evenly spaced preview timestamps from the start to just before the end."""
+        last = max(0.0, duration - 0.5)
+        if count <= 1:
+            return [0.0]
+        return [last * i / (count - 1) for i in range(count)]
 
     def generate_preview(self, times: list[float] = None) -> list[Path]:
-        """Generate preview frames at specified times."""
+        """Generate preview frames, plus a contact sheet, in a single FFmpeg run.
+
+        Each Devon frame is grabbed with an input seek, so only the GOP around
+        each timestamp is decoded. Visual assets are decoded and scaled once
+        and shared between previews that use the same asset.
+        """
         if times is None:
-            # Default: start, 25%, 50%, 75%, end
+            # Default (5): start, 25%, 50%, 75%, end
             duration = self.ffmpeg.get_duration(self.config.devon_video)
-            times = [0, duration * 0.25, duration * 0.5, duration * 0.75, duration - 0.5]
-
-        previews = []
+            times = self.preview_times(duration, self.config.preview_count)
 
-        for i, time in enumerate(times):
-            preview_path = self.config.output_path.parent / f"preview_{i}_{time:.1f}s.png"
+        if not times:
+            return []
 
-            # For preview, we need to actually compose a single frame
-            self.logger.info(f"Generating preview at {time:.1f}s")
-
-            # Get segment at this time for visual
-            segment = self.script_parser.get_segment_at_time(time)
+        # Resolve the visual for each timestamp
+        visuals: list[Path] = []
+        for i, timestamp in enumerate(times):
+            segment = self.script_parser.get_segment_at_time(timestamp)
             visual_asset = None
 
             if segment:
@@ -864,100 +1352,172 @@ class VideoCompositor:
 
             if visual_asset is None:
                 # Create placeholder
-                placeholder = self.temp_dir / "preview_placeholder.png"
                 text = segment.title if segment else "Preview"
-                self.asset_manager.create_placeholder(placeholder, text)
-                visual_asset = placeholder
-
-            # Extract Devon frame at this time
-            devon_frame = self.temp_dir / f"devon_frame_{i}.png"
-            success, _ = self.ffmpeg.run_ffmpeg([
-                "-y", "-ss", str(time),
-                "-i", str(self.config.devon_video),
-                "-vframes", "1",
-                "-vf", f"scale={self.config.pip_width}:{self.config.pip_height}",
-                str(devon_frame)
-            ])
-
-            if not success:
-                continue
-
-            # Compose preview frame
-            filter_complex = (
-                # Background
-                f"color=c={BACKGROUND_COLOR}:s={OUTPUT_WIDTH}x{OUTPUT_HEIGHT}[bg];"
-
-                # Scale visual
-                f"[1:v]scale={OUTPUT_WIDTH}:{VISUAL_HEIGHT}:force_original_aspect_ratio=decrease,"
-                f"pad={OUTPUT_WIDTH}:{VISUAL_HEIGHT}:(ow-iw)/2:(oh-ih)/2:color={BACKGROUND_COLOR}[visual];"
+                visual_asset = self.asset_manager.create_placeholder(text)
+                if visual_asset is None:
+                    return []
+
+            visuals.append(visual_asset)
+
+        count = len(times)
+        unique_visuals = list(dict.fromkeys(visuals))
+        visual_index = {asset: count + k for k, asset in enumerate(unique_visuals)}
+
+        # Inputs: one seeked Devon input per preview, each distinct visual once, then PiP mask/shadow
+        args = ["-y"]
+        for timestamp in times:
+            args += ["-ss", f"{timestamp:.3f}", "-i", str(self.config.devon_video)]
+        for asset in unique_visuals:
+            args += ["-i", str(asset)]
+
+        mask_path, shadow_path = self.prepare_pip_masks()
+        pip_inputs, mask_label, shadow_label = self._pip_mask_inputs(
+            mask_path, shadow_path, first_index=count + len(unique_visuals)
+        )
+        args += pip_inputs
 
-                # Overlay visual
-                f"[bg][visual]overlay=0:0[with_visual];"
+        def fan_out(source: str, name: str, n: int) -> tuple[str, list[str]]:
+            labels = [f"[{name}{j}]" for j in range(n)]
+            return f"{source}split={n}{''.join(labels)};", labels
 
-                # Overlay Devon PiP
-                f"[with_visual][2:v]overlay={self.config.pip_x}:{self.config.pip_y}[final]"
+        # Background, scaled visuals and PiP images are split to every preview that uses them
+        graph, bg_labels = fan_out(
+            f"color=c={BACKGROUND_COLOR}:s={OUTPUT_WIDTH}x{OUTPUT_HEIGHT}:r=1:d=1,", "bg", count
+        )
+        visual_labels: dict[Path, list[str]] = {}
+        for k, asset in enumerate(unique_visuals):
+            uses = visuals.count(asset)
+            part, visual_labels[asset] = fan_out(
+                f"[{visual_index[asset]}:v]scale={OUTPUT_WIDTH}:{VISUAL_HEIGHT}:force_original_aspect_ratio=decrease,"
+                f"pad={OUTPUT_WIDTH}:{VISUAL_HEIGHT}:(ow-iw)/2:(oh-ih)/2:color={BACKGROUND_COLOR},",
+                f"vis{k}_", uses
             )
+            graph += part
+        mask_labels = shadow_labels = [None] * count
+        if mask_label:
+            part, mask_labels = fan_out(mask_label, "mask", count)
+            graph += part
+        if shadow_label:
+            part, shadow_labels = fan_out(shadow_label, "shadow", count)
+            graph += part
+
+        # One composed frame per preview
+        previews = []
+        for i, timestamp in enumerate(times):
+            graph += (
+                f"[{i}:v]trim=end_frame=1,setpts=PTS-STARTPTS[devon{i}];"
+                f"{bg_labels[i]}{visual_labels[visuals[i]].pop(0)}overlay=0:0[with_visual{i}];"
+            )
+            graph += self.build_pip_filter(
+                f"[with_visual{i}]", f"[devon{i}]", mask_labels[i], shadow_labels[i],
+                output=f"[final{i}]", tag=str(i)
+            ) + ";"
+            previews.append(self.config.output_path.parent / f"preview_{i}_{timestamp:.1f}s.png")
+
+        # Contact sheet of thumbnails when there is more than one preview
+        sheet_path = None
+        outputs = [f"[final{i}]" for i in range(count)]
+        if count > 1:
+            columns = math.ceil(math.sqrt(count))
+            rows = math.ceil(count / columns)
+            sheet_inputs = ""
+            for i in range(count):
+                graph += f"[final{i}]split=2[out{i}][sheet_in{i}];"
+                sheet_inputs += f"[sheet_in{i}]"
+            graph += (
+                f"{sheet_inputs}concat=n={count}:v=1:a=0,"
+                f"scale={PREVIEW_THUMB_WIDTH}:{PREVIEW_THUMB_HEIGHT},"
+                f"tile={columns}x{rows}:padding={PIP_PADDING // 2}:margin={PIP_PADDING // 2}:color={BACKGROUND_COLOR}[sheet];"
+            )
+            outputs = [f"[out{i}]" for i in range(count)]
+            sheet_path = self.config.output_path.parent / "preview_sheet.png"
+
+        args += ["-filter_complex", graph.rstrip(";")]
+        for label, preview_path in zip(outputs, previews):
+            args += ["-map", label, "-frames:v", "1", str(preview_path)]
+        if sheet_path:
+            args += ["-map", "[sheet]", "-frames:v", "1", str(sheet_path)]
+
+        self.logger.info(f"Generating {count} preview(s) at " + ", ".join(f"{t:.1f}s" for t in times))
+        written = previews + ([sheet_path] if sheet_path else [])
+        success, msg = self.ffmpeg.run_ffmpeg(args, outputs=written)
+        if not success:
+            self.logger.error(f"Failed to generate previews: {msg}")
+            return []
 
-            success, msg = self.ffmpeg.run_ffmpeg([
-                "-y",
-                "-f", "lavfi", "-i", f"color=c={BACKGROUND_COLOR}:s={OUTPUT_WIDTH}x{OUTPUT_HEIGHT}",
-                "-i", str(visual_asset),
-                "-i", str(devon_frame),
-                "-filter_complex", filter_complex,
-                "-map", "[final]",
-                "-frames:v", "1",
-                str(preview_path)
-            ])
-
-            if success and preview_path.exists():
-                previews.append(preview_path)
-                self.logger.info(f"Preview saved: {preview_path}")
+        previews = [path for path in previews if path.exists()]
+        for preview_path in previews:
+            self.logger.info(f"Preview saved: {preview_path}")
+        if sheet_path and sheet_path.exists():
+            self.logger.info(f"Contact sheet saved: {sheet_path}")
 
         return previews
 
     def run(self) -> bool:
-        """Execute the full composition pipeline."""
+        """Execute the full composition pipeline and write the run report."""
+        success = False
+        try:
+            success = self._run_pipeline()
+        finally:
+            # Also on early exits, so probes made before a failure are kept
+            self.ffmpeg.probe_cache.save()
+            if self.mezzanine:
+                self.mezzanine.save()
+            if self.config.report_path:
+                try:
+                    self.report.write(self.config.report_path, self.config.output_path, success)
+                    self.logger.info(f"Run report written: {self.config.report_path}")
+                except OSError as e:
+                    self.logger.warning(f"Failed to write run report: {e}")
+        return success
+
+    def _run_pipeline(self) -> bool:
+        """Validate, render and clean up, recording each stage in the report."""
         self.logger.info("=" * 60)
         self.logger.info("Video Compositor Starting")
         self.logger.info("=" * 60)
 
         # Validate inputs
-        if not self.validate_inputs():
-            return False
+        with self.report.stage("validate"):
+            if not self.validate_inputs():
+                return False
 
         # Preview mode
         if self.config.preview_only:
             self.logger.info("Preview mode - generating preview frames only")
-            previews = self.generate_preview()
+            with self.report.stage("preview"):
+                previews = self.generate_preview()
             self.logger.info(f"Generated {len(previews)} preview frames")
             return len(previews) > 0
 
-        # Prepare Devon PiP video
-        self.logger.info("Preparing Devon PiP video...")
-        devon_pip = self.prepare_devon_video()
-        if devon_pip is None:
+        # Resolve the Devon video (parts are joined by stream copy)
+        self.logger.info("Preparing Devon video...")
+        with self.report.stage("devon_prepare"):
+            devon_video = self.prepare_devon_video()
+        if devon_video is None:
             return False
 
-        devon_duration = self.ffmpeg.get_duration(devon_pip)
+        devon_duration = self.ffmpeg.get_duration(devon_video)
         self.logger.info(f"Devon duration: {devon_duration:.2f}s")
 
-        # Prepare visual sequence
+        # Prepare visual sequence (records segment_encode and transitions)
         self.logger.info("Preparing visual sequence...")
         visuals = self.prepare_visual_sequence(devon_duration)
         if visuals is None:
             return False
 
         # Compose final video
-        success = self.compose_final_video(devon_pip, visuals)
+        with self.report.stage("mux"):
+            success = self.compose_final_video(devon_video, visuals)
 
         # Cleanup temp files
-        if success and not self.config.verbose:
-            self.logger.info("Cleaning up temporary files...")
-            try:
-                import shutil
-                shutil.rmtree(self.temp_dir, ignore_errors=True)
-            except Exception:
-                pass
+        with self.report.stage("cleanup"):
+            if success and not self.config.verbose:
+                self.logger.info("Cleaning up temporary files...")
+                try:
+                    shutil.rmtree(self.temp_dir, ignore_errors=True)
+                except Exception:
+                    pass
 
         print()  # New line after progress
         self.logger.info("=" * 60)
@@ -989,6 +1549,9 @@ Examples:
     # Preview mode
     python video-compositor.py --devon devon.mp4 --assets ./assets/ --script parsed.json --preview
 
+    # Contact sheet of 24 preview frames
+    python video-compositor.py --devon devon.mp4 --assets ./assets/ --script parsed.json --preview --preview-count 24
+
     # Custom PiP position and size
     python video-compositor.py --devon devon.mp4 --assets ./assets/ --script parsed.json --output final.mp4 \\
         --pip-position bottom-left --pip-size large
@@ -1040,6 +1603,41 @@ Examples:
         help="Size of Devon PiP (default: medium)"
     )
 
+    parser.add_argument(
+        "--pip-style",
+        choices=PIP_STYLES,
+        default="rounded",
+        help="Shape of Devon PiP (default: rounded)"
+    )
+
+    parser.add_argument(
+        "--pip-radius",
+        type=int,
+        default=DEFAULT_PIP_RADIUS,
+        help=f"Corner radius in pixels for the rounded style (default: {DEFAULT_PIP_RADIUS})"
+    )
+
+    parser.add_argument(
+        "--no-pip-shadow",
+        action="store_true",
+        help="Disable the drop shadow behind Devon PiP"
+    )
+
+    parser.add_argument(
+        "--compose-chunks",
+        type=int,
+        default=DEFAULT_COMPOSE_CHUNKS,
+        help="Composite the final video in N parallel chunks cut at segment boundaries "
+             "and joined by stream copy (default: 1, a single encode)"
+    )
+
+    parser.add_argument(
+        "--transition",
+        type=float,
+        default=TRANSITION_DURATION,
+        help=f"Crossfade between visual segments in seconds, 0 for hard cuts (default: {TRANSITION_DURATION})"
+    )
+
     # Mode options
     parser.add_argument(
         "--preview",
@@ -1047,7 +1645,65 @@ Examples:
         help="Generate preview frames only (no video output)"
     )
 
+    parser.add_argument(
+        "--preview-count",
+        type=int,
+        default=DEFAULT_PREVIEW_COUNT,
+        help=f"Number of evenly spaced preview frames, also tiled into preview_sheet.png (default: {DEFAULT_PREVIEW_COUNT})"
+    )
+
     # Other options
+    parser.add_argument(
+        "--vfr",
+        action="store_true",
+        help="Encode image segments as variable frame rate (one held frame per slide)"
+    )
+
+    parser.add_argument(
+        "--probe-cache",
+        type=Path,
+        help="Persist ffprobe results to this JSON file and reuse them across runs"
+    )
+
+    parser.add_argument(
+        "--report",
+        type=Path,
+        help="Write a per-stage timing and resource report (JSON) to this path"
+    )
+
+    parser.add_argument(
+        "--asset-catalog",
+        type=Path,
+        default=DEFAULT_CATALOG_PATH,
+        help="Persisted asset index, shared between runs and compositors (default: output/asset-catalog.json)"
+    )
+
+    parser.add_argument(
+        "--no-asset-catalog",
+        action="store_true",
+        help="Index assets in memory only, without reading or writing the catalog file"
+    )
+
+    parser.add_argument(
+        "--mezzanine-manifest",
+        type=Path,
+        default=DEFAULT_MANIFEST_PATH,
+        help="Mezzanine manifest to take conformed Devon and video assets from (default: output/mezzanine/manifest.json)"
+    )
+
+    parser.add_argument(
+        "--no-mezzanine",
+        action="store_true",
+        help="Use Devon and video assets as they are, without the mezzanine stage"
+    )
+
+    parser.add_argument(
+        "--normalize-media",
+        action="store_true",
+        help="Transcode Devon and video assets missing from the mezzanine store during the run "
+             "(default: use only copies normalize-media.py already made)"
+    )
+
     parser.add_argument(
         "--temp-dir",
         type=Path,
@@ -1079,12 +1735,16 @@ def main():
 
     # FFmpeg check mode
     if args.check_ffmpeg:
+        get_runtime(refresh=True, logger=logger)  # Re-probe rather than trust the cache
         ffmpeg = FFmpegWrapper(logger)
         available, version = ffmpeg.check_availability()
         if available:
             print(f"FFmpeg is available: {version}")
             print(f"FFmpeg path: {ffmpeg.ffmpeg_path}")
             print(f"FFprobe path: {ffmpeg.ffprobe_path}")
+            print(f"Video encoder: {ffmpeg.runtime.video_encoder}")
+            for name, present in ffmpeg.runtime.capabilities().items():
+                print(f"  {name:<10} {'yes' if present else 'no'}")
             sys.exit(0)
         else:
             print(f"FFmpeg not available: {version}")
@@ -1111,9 +1771,21 @@ def main():
         output_path=args.output,
         pip_position=args.pip_position,
         pip_size=args.pip_size,
+        pip_style=args.pip_style,
+        pip_radius=args.pip_radius,
+        pip_shadow=not args.no_pip_shadow,
         preview_only=args.preview,
+        preview_count=max(1, args.preview_count),
         temp_dir=args.temp_dir,
-        verbose=args.verbose
+        verbose=args.verbose,
+        probe_cache=args.probe_cache,
+        report_path=args.report,
+        asset_catalog=None if args.no_asset_catalog else args.asset_catalog,
+        mezzanine_manifest=None if args.no_mezzanine else args.mezzanine_manifest,
+        normalize_media=args.normalize_media,
+        vfr=args.vfr,
+        compose_chunks=max(1, args.compose_chunks),
+        transition_duration=max(0.0, args.transition)
     )
 
     # Run compositor
@@ -8,28 +8,58 @@ Parses video script markdown files and extracts:
 - Estimated timestamps based on word count (150 wpm)
 - Asset requirements categorization
 
+With --watch it keeps polling the scripts and slide directories, and after
+each edit re-renders only the slides and segment clips that changed before
+refreshing the lesson preview.
+
 Usage:
     python video-script-parser.py --script script-0.1-welcome.md
     python video-script-parser.py --all
     python video-script-parser.py --all --output ./parsed-scripts/
+    python video-script-parser.py --all --jobs 4 --no-cache
+    python video-script-parser.py --watch --output ./parsed-scripts/
 """
 
 import argparse
+import hashlib
 import json
 import os
 import re
+import subprocess
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from cue_classifier import CueClassifier
+from script_ir import SCRIPT_IR_VERSION, ScriptIR, build_script_ir, load_script_ir
+
 
 # Configuration
 WORDS_PER_MINUTE = 150
 DEFAULT_SCRIPTS_DIR = Path(r"C:\Users\Jakeb\support-forge\docs\academy-content\video-scripts")
 DEFAULT_OUTPUT_DIR = Path(r"C:\Users\Jakeb\support-forge\server\scripts\output\parsed-scripts")
 
+# Parse cache: bump PARSER_VERSION whenever script_from_ir output changes.
+# The cache is also dropped when the IR version, the visual type patterns or
+# the speaking rate change (see parse_cache_key).
+PARSER_VERSION = 1
+PARSE_CACHE_FILE = ".parse-cache.json"
+
+# Watch mode: slides come from create-slide-assets.py, previews from
+# audio-slides-compositor.py (whose segment cache skips unchanged clips)
+SCRIPT_DIR = Path(__file__).parent.resolve()
+SLIDE_GENERATOR = SCRIPT_DIR / "create-slide-assets.py"
+PREVIEW_COMPOSITOR = SCRIPT_DIR / "audio-slides-compositor.py"
+DEFAULT_SLIDES_ROOT = SCRIPT_DIR / "output" / "generated-assets"
+DEFAULT_AUDIO_DIR = SCRIPT_DIR / "output" / "devon-audio"
+DEFAULT_PREVIEW_DIR = SCRIPT_DIR / "output" / "previews"
+PREVIEW_AUDIO_FORMATS = (".m4a", ".aac", ".mp3", ".wav")
+WATCH_INTERVAL = 1.0  # seconds between polls
+
 # Visual type classification patterns
 VISUAL_TYPE_PATTERNS = {
     "animated_title": [
@@ -71,6 +101,7 @@ VISUAL_TYPE_PATTERNS = {
         r"before.*after", r"two\s*column", r"dual\s*view"
     ],
 }
+VISUAL_TYPE_CLASSIFIER = CueClassifier(VISUAL_TYPE_PATTERNS, default="text_overlay")
 
 
 @dataclass
@@ -93,6 +124,19 @@ class Asset:
     segment_ids: list = field(default_factory=list)
 
 
+@dataclass
+class SegmentChanges:
+    """Segment IDs a script edit invalidates."""
+    slides: list = field(default_factory=list)     # Cue or visual type changed, or new segment
+    clips: list = field(default_factory=list)      # Slide or duration changed
+    text_only: list = field(default_factory=list)  # Spoken text changed, same cue and timing
+    removed: list = field(default_factory=list)
+
+    @property
+    def render_needed(self) -> bool:
+        return bool(self.clips or self.removed)
+
+
 @dataclass
 class ParsedScript:
     """Represents a fully parsed video script."""
@@ -114,42 +158,7 @@ def classify_visual_type(visual_cue: str) -> str:
     Returns:
         The classified visual type
     """
-    cue_lower = visual_cue.lower()
-
-    # Check each category's patterns
-    for visual_type, patterns in VISUAL_TYPE_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, cue_lower):
-                return visual_type
-
-    # Default fallback
-    return "text_overlay"
-
-
-def count_words(text: str) -> int:
-    """
-    Count words in text, excluding markdown and stage directions.
-
-    Args:
-        text: The text to count words in
-
-    Returns:
-        Word count
-    """
-    # Remove markdown formatting
-    clean_text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)  # Bold
-    clean_text = re.sub(r'\*([^*]+)\*', r'\1', clean_text)  # Italic
-    clean_text = re.sub(r'`([^`]+)`', r'\1', clean_text)  # Code
-
-    # Remove [PAUSE] markers
-    clean_text = re.sub(r'\[PAUSE\]', '', clean_text, flags=re.IGNORECASE)
-
-    # Remove any remaining brackets content that might be stage directions
-    clean_text = re.sub(r'\[[^\]]+\]', '', clean_text)
-
-    # Count words
-    words = clean_text.split()
-    return len(words)
+    return VISUAL_TYPE_CLASSIFIER.classify(visual_cue)
 
 
 def calculate_duration(word_count: int, wpm: int = WORDS_PER_MINUTE) -> float:
@@ -166,32 +175,6 @@ def calculate_duration(word_count: int, wpm: int = WORDS_PER_MINUTE) -> float:
     return (word_count / wpm) * 60
 
 
-def extract_title_from_content(content: str, filename: str) -> str:
-    """
-    Extract the title from the script content.
-
-    Args:
-        content: The markdown content
-        filename: The script filename as fallback
-
-    Returns:
-        The extracted title
-    """
-    # Try to find H1 heading
-    h1_match = re.search(r'^#\s+(?:Script\s+[\d.]+:\s*)?(.+)$', content, re.MULTILINE)
-    if h1_match:
-        title = h1_match.group(1).strip()
-        # Clean up any remaining script numbering
-        title = re.sub(r'^[\d.]+\s*[-:]\s*', '', title)
-        return title
-
-    # Fallback to filename
-    base_name = Path(filename).stem
-    # Convert filename to title case
-    title = base_name.replace('-', ' ').replace('_', ' ')
-    return title.title()
-
-
 def extract_script_id(filename: str) -> str:
     """
     Extract a clean script ID from the filename.
@@ -208,117 +191,46 @@ def extract_script_id(filename: str) -> str:
     return script_id
 
 
-def extract_metadata(content: str) -> dict:
+def parse_script(content: str, filename: str) -> ParsedScript:
     """
-    Extract metadata from the script header.
+    Parse a video script markdown file into structured data.
 
     Args:
         content: The markdown content
+        filename: The script filename
 
     Returns:
-        Dictionary of metadata
+        ParsedScript object with all extracted data
     """
-    metadata = {}
-
-    # Duration
-    duration_match = re.search(r'\*\*Duration:\*\*\s*(.+?)(?:\n|$)', content)
-    if duration_match:
-        metadata['stated_duration'] = duration_match.group(1).strip()
-
-    # Lesson info
-    lesson_match = re.search(r'\*\*Lesson:\*\*\s*(.+?)(?:\n|$)', content)
-    if lesson_match:
-        metadata['lesson'] = lesson_match.group(1).strip()
-
-    # Purpose
-    purpose_match = re.search(r'\*\*Purpose:\*\*\s*(.+?)(?:\n|$)', content)
-    if purpose_match:
-        metadata['purpose'] = purpose_match.group(1).strip()
+    return script_from_ir(build_script_ir(content, filename))
 
-    # Word count from footer
-    word_count_match = re.search(r'\*Approximate word count:\s*([\d,]+)', content)
-    if word_count_match:
-        metadata['stated_word_count'] = word_count_match.group(1).strip()
 
-    # Runtime estimate from footer
-    runtime_match = re.search(r'\*Estimated runtime:\s*(.+?)\*', content)
-    if runtime_match:
-        metadata['stated_runtime'] = runtime_match.group(1).strip()
-
-    return metadata
-
-
-def parse_script(content: str, filename: str) -> ParsedScript:
+def script_from_ir(ir: ScriptIR) -> ParsedScript:
     """
-    Parse a video script markdown file into structured data.
+    Time and classify the segments of a parsed script.
 
     Args:
-        content: The markdown content
-        filename: The script filename
+        ir: Shared script IR (see script_ir.py)
 
     Returns:
         ParsedScript object with all extracted data
     """
-    script_id = extract_script_id(filename)
-    title = extract_title_from_content(content, filename)
-    metadata = extract_metadata(content)
-
-    # Pattern to match [SCREEN: ...] visual cues
-    screen_pattern = r'\[SCREEN:\s*(.+?)\]'
-
-    # Find all visual cues and their positions
-    cue_matches = list(re.finditer(screen_pattern, content, re.IGNORECASE | re.DOTALL))
-
     segments = []
     assets_by_type = {}  # Track assets for deduplication
     current_time = 0.0
 
-    for i, match in enumerate(cue_matches):
-        visual_cue = match.group(1).strip()
-        visual_cue = re.sub(r'\s+', ' ', visual_cue)  # Normalize whitespace
+    # Normalize cue whitespace and classify every cue in one batch
+    visual_cues = [re.sub(r'\s+', ' ', cue.text) for cue in ir.cues]
+    visual_types = VISUAL_TYPE_CLASSIFIER.classify_many(visual_cues)
 
-        # Determine spoken text boundaries
-        cue_end = match.end()
+    for i, cue in enumerate(ir.cues):
+        visual_cue = visual_cues[i]
+        visual_type = visual_types[i]
 
-        if i + 1 < len(cue_matches):
-            # Text until next cue
-            next_cue_start = cue_matches[i + 1].start()
-            spoken_text = content[cue_end:next_cue_start]
-        else:
-            # Text until end of content (before footer markers)
-            remaining = content[cue_end:]
-            # Find end markers
-            end_markers = [
-                remaining.find('---\n\n**END OF SCRIPT'),
-                remaining.find('**END OF SCRIPT'),
-                remaining.find('\n---\n\n*Approximate'),
-                remaining.find('\n*Approximate word count'),
-            ]
-            valid_markers = [m for m in end_markers if m != -1]
-            if valid_markers:
-                spoken_text = remaining[:min(valid_markers)]
-            else:
-                spoken_text = remaining
-
-        # Clean up spoken text
-        spoken_text = spoken_text.strip()
-        # Remove section headers (## HEADING)
-        spoken_text = re.sub(r'^##\s+.+$', '', spoken_text, flags=re.MULTILINE)
-        # Remove horizontal rules
-        spoken_text = re.sub(r'^---+$', '', spoken_text, flags=re.MULTILINE)
-        # Remove [PAUSE] for word counting but keep for reference
-        spoken_text_for_count = re.sub(r'\[PAUSE\]', '', spoken_text, flags=re.IGNORECASE)
-        # Normalize whitespace
-        spoken_text = re.sub(r'\n{3,}', '\n\n', spoken_text).strip()
-        spoken_text_for_count = spoken_text_for_count.strip()
-
-        # Calculate timing
-        word_count = count_words(spoken_text_for_count)
         # Add pause time (assume 1.5 seconds per [PAUSE])
-        pause_count = len(re.findall(r'\[PAUSE\]', spoken_text, re.IGNORECASE))
-        pause_time = pause_count * 1.5
+        pause_time = cue.pause_count * 1.5
 
-        segment_duration = calculate_duration(word_count) + pause_time
+        segment_duration = calculate_duration(cue.word_count) + pause_time
 
         # Ensure minimum segment duration
         if segment_duration < 2:
@@ -327,17 +239,14 @@ def parse_script(content: str, filename: str) -> ParsedScript:
         start_time = current_time
         end_time = current_time + segment_duration
 
-        # Classify visual type
-        visual_type = classify_visual_type(visual_cue)
-
         segment = Segment(
             segment_id=i + 1,
             start_time=round(start_time, 1),
             end_time=round(end_time, 1),
             visual_cue=visual_cue,
             visual_type=visual_type,
-            spoken_text=spoken_text,
-            word_count=word_count
+            spoken_text=cue.spoken_text,
+            word_count=cue.word_count
         )
         segments.append(segment)
 
@@ -363,12 +272,12 @@ def parse_script(content: str, filename: str) -> ParsedScript:
     assets_needed.sort(key=lambda a: (a.type, a.description))
 
     return ParsedScript(
-        script_id=script_id,
-        title=title,
+        script_id=extract_script_id(ir.filename),
+        title=ir.title,
         total_duration_seconds=round(current_time, 1),
         segments=segments,
         assets_needed=assets_needed,
-        metadata=metadata
+        metadata=ir.metadata
     )
 
 
@@ -411,6 +320,22 @@ def script_to_dict(parsed_script: ParsedScript) -> dict:
     }
 
 
+def print_script_summary(result: dict):
+    """Print the one-screen summary of a parsed script."""
+    print(f"  Title: {result['title']}")
+    print(f"  Segments: {len(result['segments'])}")
+    print(f"  Duration: {result['total_duration_seconds']:.1f}s ({result['total_duration_seconds']/60:.1f} min)")
+    print(f"  Assets needed: {len(result['assets_needed'])}")
+
+
+def write_json(path: Path, data) -> None:
+    """Write JSON atomically, so readers never see a half-written file."""
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
 def parse_single_script(script_path: Path, output_dir: Optional[Path] = None) -> dict:
     """
     Parse a single script file and optionally save to output directory.
@@ -427,36 +352,91 @@ def parse_single_script(script_path: Path, output_dir: Optional[Path] = None) ->
 
     print(f"Parsing: {script_path.name}")
 
-    with open(script_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    parsed = parse_script(content, script_path.name)
+    parsed = script_from_ir(load_script_ir(script_path))
     result = script_to_dict(parsed)
 
     # Print summary
-    print(f"  Title: {result['title']}")
-    print(f"  Segments: {len(result['segments'])}")
-    print(f"  Duration: {result['total_duration_seconds']:.1f}s ({result['total_duration_seconds']/60:.1f} min)")
-    print(f"  Assets needed: {len(result['assets_needed'])}")
+    print_script_summary(result)
 
     # Save if output directory specified
     if output_dir:
         output_dir.mkdir(parents=True, exist_ok=True)
         output_file = output_dir / f"{parsed.script_id}.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        write_json(output_file, result)
         print(f"  Saved to: {output_file}")
 
     return result
 
 
-def parse_all_scripts(scripts_dir: Path, output_dir: Optional[Path] = None) -> list:
+def _parse_content(job: tuple[str, str]) -> dict:
+    """Process-pool worker: parse one script's content into its JSON dict."""
+    content, script_path = job
+    return script_to_dict(script_from_ir(load_script_ir(Path(script_path), content=content)))
+
+
+def parse_cache_key() -> str:
+    """Hash of everything besides script content that shapes parse output."""
+    # Category order is priority order, so the table is hashed as a list
+    inputs = [PARSER_VERSION, SCRIPT_IR_VERSION, WORDS_PER_MINUTE, list(VISUAL_TYPE_PATTERNS.items())]
+    return hashlib.sha256(json.dumps(inputs).encode('utf-8')).hexdigest()
+
+
+def load_parse_cache(cache_path: Path) -> dict:
+    """
+    Load the per-script parse cache.
+
+    Entries are keyed by filename and hold the content hash and the parsed
+    result; the whole cache is dropped when parse_cache_key() changes.
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if cache.get("cache_key") != parse_cache_key():
+        return {}
+    return cache.get("scripts", {})
+
+
+def build_summary(results: list) -> dict:
+    """Build the _summary.json content (without its timestamp)."""
+    return {
+        "total_scripts": len(results),
+        "total_segments": sum(len(r['segments']) for r in results),
+        "total_duration_seconds": sum(r['total_duration_seconds'] for r in results),
+        "total_duration_minutes": sum(r['total_duration_seconds'] for r in results) / 60,
+        "scripts": [
+            {
+                "script_id": r['script_id'],
+                "title": r['title'],
+                "segments": len(r['segments']),
+                "duration_seconds": r['total_duration_seconds'],
+                "assets": len(r['assets_needed'])
+            }
+            for r in results
+        ],
+    }
+
+
+def parse_all_scripts(
+    scripts_dir: Path,
+    output_dir: Optional[Path] = None,
+    jobs: Optional[int] = None,
+    use_cache: bool = True
+) -> list:
     """
     Parse all script files in a directory.
 
+    Scripts whose content hash matches the parse cache (and whose JSON output
+    still exists) are not re-parsed or rewritten. Changed scripts are parsed
+    in a process pool, and _summary.json is rebuilt from the cached
+    per-script results and only rewritten when it changes.
+
     Args:
         scripts_dir: Directory containing script files
         output_dir: Optional output directory for JSON files
+        jobs: Worker processes for changed scripts (default: CPU count)
+        use_cache: Reuse results for unchanged scripts
 
     Returns:
         List of parsed scripts as dictionaries
@@ -472,51 +452,319 @@ def parse_all_scripts(scripts_dir: Path, output_dir: Optional[Path] = None) -> l
 
     print(f"Found {len(script_files)} script files\n")
 
-    results = []
+    cache_path = output_dir / PARSE_CACHE_FILE if output_dir else None
+    cache = load_parse_cache(cache_path) if cache_path and use_cache else {}
+    new_cache = {}
+
+    # Hash every script; only changed ones are parsed
+    results_by_name = {}
+    pending = []  # (script_path, content, digest)
     for script_path in script_files:
         try:
-            result = parse_single_script(script_path, output_dir)
-            results.append(result)
-            print()
+            with open(script_path, 'r', encoding='utf-8') as f:
+                content = f.read()
         except Exception as e:
+            print(f"Parsing: {script_path.name}")
             print(f"  ERROR: {e}\n")
+            continue
+
+        digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        entry = cache.get(script_path.name)
+        if entry and entry.get("hash") == digest:
+            result = entry["result"]
+            if not output_dir or (output_dir / f"{result['script_id']}.json").exists():
+                results_by_name[script_path.name] = result
+                new_cache[script_path.name] = entry
+                continue
+        pending.append((script_path, content, digest))
+
+    unchanged = len(results_by_name)
+    if unchanged:
+        print(f"{unchanged} unchanged script(s) skipped (parse cache)\n")
+
+    if pending:
+        workers = max(1, min(jobs or os.cpu_count() or 1, len(pending)))
+        job_args = [(content, str(script_path)) for script_path, content, _ in pending]
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_parse_content, job) for job in job_args]
+                outcomes = []
+                for future in futures:
+                    try:
+                        outcomes.append((future.result(), None))
+                    except Exception as e:
+                        outcomes.append((None, e))
+        else:
+            outcomes = []
+            for job in job_args:
+                try:
+                    outcomes.append((_parse_content(job), None))
+                except Exception as e:
+                    outcomes.append((None, e))
+
+        if output_dir:
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+        for (script_path, _, digest), (result, error) in zip(pending, outcomes):
+            print(f"Parsing: {script_path.name}")
+            if error is not None:
+                print(f"  ERROR: {error}\n")
+                continue
+            print_script_summary(result)
+            if output_dir:
+                output_file = output_dir / f"{result['script_id']}.json"
+                write_json(output_file, result)
+                print(f"  Saved to: {output_file}")
+            print()
+            results_by_name[script_path.name] = result
+            new_cache[script_path.name] = {"hash": digest, "result": result}
+
+    results = [results_by_name[p.name] for p in script_files if p.name in results_by_name]
+
+    if cache_path and (pending or new_cache.keys() != cache.keys()):
+        write_json(cache_path, {"cache_key": parse_cache_key(), "scripts": new_cache})
 
     # Create summary file if output directory specified
     if output_dir and results:
-        summary = {
-            "total_scripts": len(results),
-            "total_segments": sum(len(r['segments']) for r in results),
-            "total_duration_seconds": sum(r['total_duration_seconds'] for r in results),
-            "total_duration_minutes": sum(r['total_duration_seconds'] for r in results) / 60,
-            "scripts": [
-                {
-                    "script_id": r['script_id'],
-                    "title": r['title'],
-                    "segments": len(r['segments']),
-                    "duration_seconds": r['total_duration_seconds'],
-                    "assets": len(r['assets_needed'])
-                }
-                for r in results
-            ],
-            "generated_at": datetime.now().isoformat()
-        }
-
+        summary = build_summary(results)
         summary_file = output_dir / "_summary.json"
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
-        print(f"Summary saved to: {summary_file}")
+
+        previous = None
+        try:
+            with open(summary_file, 'r', encoding='utf-8') as f:
+                previous = json.load(f)
+            previous.pop("generated_at", None)
+        except (OSError, json.JSONDecodeError):
+            pass
+
+        if previous != summary:
+            summary["generated_at"] = datetime.now().isoformat()
+            write_json(summary_file, summary)
+            print(f"Summary saved to: {summary_file}")
+        else:
+            print(f"Summary unchanged: {summary_file}")
 
         # Print overall summary
         print(f"\n{'='*50}")
         print(f"PARSING COMPLETE")
         print(f"{'='*50}")
-        print(f"Total scripts parsed: {summary['total_scripts']}")
+        print(f"Total scripts parsed: {summary['total_scripts']} ({len(pending)} re-parsed)")
         print(f"Total segments: {summary['total_segments']}")
         print(f"Total duration: {summary['total_duration_minutes']:.1f} minutes")
 
     return results
 
 
+# ============================================================================
+# Watch mode
+# ============================================================================
+
+def diff_segments(old: Optional[dict], new: dict) -> SegmentChanges:
+    """
+    Compare two parsed versions of a script segment by segment.
+
+    Args:
+        old: Previous parsed script dict (None if the script is new)
+        new: Freshly parsed script dict
+
+    Returns:
+        SegmentChanges listing what needs re-rendering
+    """
+    old_segments = {s['segment_id']: s for s in (old or {}).get('segments', [])}
+    changes = SegmentChanges()
+
+    for segment in new.get('segments', []):
+        segment_id = segment['segment_id']
+        before = old_segments.pop(segment_id, None)
+
+        slide_changed = before is None or (
+            (before['visual_cue'], before['visual_type']) != (segment['visual_cue'], segment['visual_type'])
+        )
+        duration_changed = before is None or (
+            round(before['end_time'] - before['start_time'], 3)
+            != round(segment['end_time'] - segment['start_time'], 3)
+        )
+
+        if slide_changed:
+            changes.slides.append(segment_id)
+        if slide_changed or duration_changed:
+            changes.clips.append(segment_id)
+        elif before['spoken_text'] != segment['spoken_text']:
+            changes.text_only.append(segment_id)
+
+    changes.removed = sorted(old_segments)
+    return changes
+
+
+def snapshot_files(directory: Path, suffixes: Optional[set] = None, recursive: bool = False) -> dict:
+    """Map each file under a directory to its (size, mtime) for change polling."""
+    snapshot = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        snapshot.update(snapshot_files(Path(entry.path), suffixes, recursive))
+                elif suffixes is None or Path(entry.name).suffix.lower() in suffixes:
+                    stat = entry.stat()
+                    snapshot[entry.path] = (stat.st_size, stat.st_mtime_ns)
+    except OSError:
+        pass
+    return snapshot
+
+
+def changed_files(before: dict, after: dict) -> set:
+    """Paths added, removed or modified between two snapshots."""
+    return {path for path in before.keys() | after.keys() if before.get(path) != after.get(path)}
+
+
+def render_slides(script_json: Path, slides_dir: Path, segment_ids: Optional[list]) -> bool:
+    """Re-render slides for the given segments (all of them if segment_ids is None)."""
+    cmd = [sys.executable, str(SLIDE_GENERATOR), "--script", str(script_json), "--output", str(slides_dir)]
+    if segment_ids is not None:
+        cmd += ["--segments", *[str(segment_id) for segment_id in segment_ids]]
+    return subprocess.run(cmd).returncode == 0
+
+
+def find_preview_audio(audio_dir: Path, script_id: str) -> Optional[Path]:
+    """Voiceover for a script, named <script_id>.<ext> in the audio directory."""
+    for suffix in PREVIEW_AUDIO_FORMATS:
+        candidate = audio_dir / f"{script_id}{suffix}"
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def render_preview(script_json: Path, slides_dir: Path, audio_path: Path, output_path: Path) -> bool:
+    """Recompose a hard-cut preview; unchanged segment clips come from the compositor cache."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    cmd = [
+        sys.executable, str(PREVIEW_COMPOSITOR),
+        "--audio", str(audio_path),
+        "--slides", str(slides_dir),
+        "--script", str(script_json),
+        "--output", str(output_path),
+        "--transition", "0",
+    ]
+    return subprocess.run(cmd).returncode == 0
+
+
+def watch_scripts(
+    scripts_dir: Path,
+    output_dir: Path,
+    slides_root: Path = DEFAULT_SLIDES_ROOT,
+    audio_dir: Path = DEFAULT_AUDIO_DIR,
+    preview_dir: Path = DEFAULT_PREVIEW_DIR,
+    jobs: Optional[int] = None,
+    interval: float = WATCH_INTERVAL,
+    use_cache: bool = True
+):
+    """
+    Poll the scripts and slide directories and rebuild what each edit invalidates.
+
+    A changed script is re-parsed (the parse cache skips the others) and its
+    segments are diffed against the previous result. Only slides whose cue
+    or visual type changed are re-rendered, then the lesson preview is
+    recomposed, re-encoding only clips whose slide or duration changed.
+    Editing a slide image directly also refreshes that lesson's preview.
+    A lesson whose slides fail to render keeps its last good parse as the
+    baseline, so the next edit retries everything still outstanding.
+
+    Args:
+        scripts_dir: Directory containing script files
+        output_dir: Output directory for JSON files
+        slides_root: Per-script slide directories (<slides_root>/<script_id>/)
+        audio_dir: Voiceovers named <script_id>.m4a/.aac/.mp3/.wav
+        preview_dir: Where previews are written (<script_id>.mp4)
+        jobs: Worker processes for changed scripts
+        interval: Seconds between polls
+        use_cache: Reuse parse results for unchanged scripts
+    """
+    results = {
+        r['script_id']: r
+        for r in parse_all_scripts(scripts_dir, output_dir, jobs=jobs, use_cache=use_cache)
+    }
+    script_files = snapshot_files(scripts_dir, {'.md'})
+    slide_files = snapshot_files(slides_root, recursive=True)
+
+    print(f"\nWatching {scripts_dir} and {slides_root} every {interval:g}s (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(interval)
+            current_scripts = snapshot_files(scripts_dir, {'.md'})
+            current_slides = snapshot_files(slides_root, recursive=True)
+            if current_scripts == script_files and current_slides == slide_files:
+                continue
+
+            started = time.perf_counter()
+            to_preview = set()
+
+            # Slide images edited by hand: the lesson needs a new preview
+            for path in changed_files(slide_files, current_slides):
+                relative = Path(path).relative_to(slides_root)
+                if len(relative.parts) > 1 and relative.parts[0] in results:
+                    to_preview.add(relative.parts[0])
+
+            if current_scripts != script_files:
+                script_files = current_scripts
+                new_results = {
+                    r['script_id']: r
+                    for r in parse_all_scripts(scripts_dir, output_dir, jobs=jobs, use_cache=use_cache)
+                }
+                failed = []
+
+                for script_id, result in new_results.items():
+                    previous = results.get(script_id)
+                    if previous is not None and previous['segments'] == result['segments']:
+                        continue
+
+                    changes = diff_segments(previous, result)
+                    print(
+                        f"{script_id}: {len(changes.slides)} slide(s), {len(changes.clips)} clip(s) changed, "
+                        f"{len(changes.text_only)} text-only, {len(changes.removed)} removed"
+                    )
+
+                    script_json = output_dir / f"{script_id}.json"
+                    slides_dir = slides_root / script_id
+                    if changes.slides:
+                        # A lesson without slides yet gets all of them
+                        segment_ids = changes.slides if previous is not None and slides_dir.exists() else None
+                        if not render_slides(script_json, slides_dir, segment_ids):
+                            print(f"  Slide rendering failed for {script_id}; will retry on the next edit")
+                            failed.append(script_id)
+                            continue
+                    if changes.render_needed:
+                        to_preview.add(script_id)
+
+                # Failed lessons keep their old baseline so the diff is redone
+                for script_id in failed:
+                    if script_id in results:
+                        new_results[script_id] = results[script_id]
+                    else:
+                        del new_results[script_id]
+                results = new_results
+
+            for script_id in sorted(to_preview):
+                audio_path = find_preview_audio(audio_dir, script_id)
+                if audio_path is None:
+                    print(f"  No audio for {script_id} in {audio_dir}; preview skipped")
+                    continue
+                output_path = preview_dir / f"{script_id}.mp4"
+                if render_preview(output_dir / f"{script_id}.json", slides_root / script_id, audio_path, output_path):
+                    print(f"  Preview refreshed: {output_path}")
+                else:
+                    print(f"  Preview failed for {script_id}")
+
+            # Our own slide renders are not edits
+            slide_files = snapshot_files(slides_root, recursive=True)
+            print(f"Rebuilt in {time.perf_counter() - started:.1f}s; watching...")
+
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+
+
 def main():
     """Main entry point for CLI."""
     parser = argparse.ArgumentParser(
@@ -528,6 +776,8 @@ Examples:
   python video-script-parser.py --all
   python video-script-parser.py --all --output ./parsed-scripts/
   python video-script-parser.py --script script-0.1-welcome.md --output ./output/
+  python video-script-parser.py --all --jobs 4 --no-cache
+  python video-script-parser.py --watch --audio-dir ./output/devon-audio/
         """
     )
 
@@ -562,9 +812,60 @@ Examples:
         help="Output raw JSON to stdout (useful for piping)"
     )
 
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for changed scripts with --all (default: CPU count)"
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-parse every script with --all or --watch, ignoring the parse cache"
+    )
+
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Parse all scripts, then poll for edits and rebuild changed slides and previews"
+    )
+
+    parser.add_argument(
+        "--slides-root",
+        type=str,
+        default=str(DEFAULT_SLIDES_ROOT),
+        help="With --watch: per-script slide directories (default: output/generated-assets)"
+    )
+
+    parser.add_argument(
+        "--audio-dir",
+        type=str,
+        default=str(DEFAULT_AUDIO_DIR),
+        help="With --watch: voiceovers named <script_id>.m4a etc. for previews (default: output/devon-audio)"
+    )
+
+    parser.add_argument(
+        "--preview-dir",
+        type=str,
+        default=str(DEFAULT_PREVIEW_DIR),
+        help="With --watch: where preview videos are written (default: output/previews)"
+    )
+
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=WATCH_INTERVAL,
+        help=f"With --watch: seconds between polls (default: {WATCH_INTERVAL:g})"
+    )
+
     args = parser.parse_args()
 
     # Validate arguments
+    if args.watch and args.script:
+        parser.error("--watch works on all scripts; do not combine it with --script")
+    args.all = args.all or args.watch
+
     if not args.script and not args.all:
         parser.error("Must specify either --script or --all")
 
@@ -594,7 +895,20 @@ Examples:
             if not output_dir:
                 output_dir = DEFAULT_OUTPUT_DIR
 
-            results = parse_all_scripts(scripts_dir, output_dir)
+            if args.watch:
+                watch_scripts(
+                    scripts_dir,
+                    output_dir,
+                    slides_root=Path(args.slides_root),
+                    audio_dir=Path(args.audio_dir),
+                    preview_dir=Path(args.preview_dir),
+                    jobs=args.jobs,
+                    interval=args.interval,
+                    use_cache=not args.no_cache
+                )
+                return
+
+            results = parse_all_scripts(scripts_dir, output_dir, jobs=args.jobs, use_cache=not args.no_cache)
 
             if args.json:
                 print(json.dumps(results, indent=2, ensure_ascii=False))